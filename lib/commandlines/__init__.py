@@ -1,4 +1,15 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-from .library import Command
+import sys
+
+if sys.version_info >= (3, 7):
+    # the Command object is imported on first access so that the import of a light submodule (e.g.
+    # `commandlines.standard`) does not import the parser
+    def __getattr__(name):
+        if name == "Command":
+            from .library import Command  # noqa: F811
+            return Command
+        raise AttributeError("module 'commandlines' has no attribute '" + name + "'")
+else:
+    from .library import Command  # noqa: F401
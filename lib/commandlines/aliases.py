@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""The commandlines.aliases module contains the OptionAliases class, a registry of alternative names for command line
+options (e.g. the short `-o` and long `--output` spellings of an option), and the STANDARD_ALIASES registry of the
+POSIX / GNU standard options that are recognized by the Command object.
+
+Pass an OptionAliases registry to the Command object to canonicalize option keys once at parse time:
+
+    aliases = OptionAliases(("output", "o"), ("verbose", "v"))
+    c = Command.from_argv(argv, aliases=aliases)
+    c.get_definition("o") == c.get_definition("output")
+
+The option keys in the Command switches, defs, and mdefs containers are the canonical names and option lookups with
+any spelling are a single dictionary lookup.  String names are also registered with their bytes spellings for bytes
+mode argument lists (see `commandlines.tokenizer`).
+"""
+
+import sys
+
+if sys.version_info[0] >= 3:
+    _FS_ENCODING = sys.getfilesystemencoding()
+
+
+class OptionAliases(object):
+    """An immutable registry of option name alias groups.  The first name in each group is the canonical option name.
+    Names are defined without the dashes that are used on the command line.
+
+    Attributes:
+        alias_map : (dict)
+                    Mapping of every registered name : canonical name
+        bytes_alias_map : (dict)
+                          Mapping of the bytes spelling of every registered name : bytes canonical name.  This is the
+                          `alias_map` dictionary on Python 2.
+
+    :param groups: (tuple) One or more tuples of option names with the canonical name at index position 0
+    :raises: ValueError if a name is registered in more than one group
+    """
+    def __init__(self, *groups):
+        alias_map = {}
+        for group in groups:
+            if len(group) == 0:
+                raise ValueError("option alias groups must include at least one option name")
+            canonical = group[0]
+            for name in group:
+                if alias_map.get(name, canonical) != canonical:
+                    raise ValueError("the option name '" + name + "' is registered in more than one alias group")
+                alias_map[name] = canonical
+        self.alias_map = alias_map
+        if sys.version_info[0] >= 3:
+            self.bytes_alias_map = dict((_encode_name(name), _encode_name(canonical))
+                                        for name, canonical in alias_map.items())
+            needle_map = dict(self.bytes_alias_map)
+            needle_map.update(alias_map)
+            self._needle_map = needle_map   # string and bytes needles
+        else:
+            self.bytes_alias_map = alias_map
+            self._needle_map = alias_map
+
+    def __contains__(self, name):
+        return name in self._needle_map
+
+    def __repr__(self):
+        return "< OptionAliases object > " + self.alias_map.__str__()
+
+    def __str__(self):
+        return "< OptionAliases object > " + self.alias_map.__str__()
+
+    def canonical(self, name):
+        """Returns the canonical option name for an option name.  Names that are not registered are returned unchanged.
+
+        :param name: (string) Option name without dashes
+        :returns: string"""
+
+        return self._needle_map.get(name, name)
+
+    def canonicalize(self, names):
+        """Returns the canonical option names for an iterable of option names.
+
+        :param names: (iterable) Option names without dashes
+        :returns: tuple of strings"""
+
+        get = self._needle_map.get
+        return tuple(get(name, name) for name in names)
+
+    def get_alias_map(self, bytes_mode):
+        """Returns the name : canonical name mapping that canonicalizes the option keys of an argument list.
+
+        :param bytes_mode: (boolean) The argument list is parsed in bytes mode
+        :returns: dictionary"""
+
+        return self.bytes_alias_map if bytes_mode else self.alias_map
+
+
+def _encode_name(name):
+    """Returns the bytes spelling of an option name with the encoding of `commandlines.tokenizer.fsencode` (the
+    tokenizer imports this module).  Bytes names are returned unchanged.  This is not intended for public use."""
+
+    if isinstance(name, bytes):
+        return name
+    return name.encode(_FS_ENCODING, "surrogateescape")
+
+
+# Short / long alternatives of the standard options that are tested by the Command is_*_request methods
+STANDARD_ALIASES = OptionAliases(("help", "h"), ("version", "v"))
@@ -0,0 +1,165 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""The commandlines.batch module contains the parse_parallel function, a process pool batch parser for large
+collections of command line argument lists.
+
+The argument lists are read from any iterable (including a generator over a corpus that does not fit in memory), split
+into chunks, and parsed to `commandlines.tokenizer.ParseResult` objects in a `multiprocessing` worker pool.  Each worker
+uses the same parser as the Command object so the switches, mops, definitions, and multiple definitions are identical
+to single process parsing:
+
+    for result in parse_parallel(argv_lists, workers=8, chunksize=4096):
+        c = Command.from_parse_result(result)
+        ...
+
+The number of chunks that are submitted to the pool and not yet consumed is bounded so that memory use does not grow
+with the size of the input.
+"""
+
+from collections import deque
+
+try:
+    import queue
+except ImportError:   # Python 2
+    import Queue as queue
+
+from commandlines.tokenizer import ParseResult
+
+# parse options of the current worker process, set once per worker by the pool initializer
+_worker_spec = None
+_worker_aliases = None
+
+
+def parse_parallel(argv_iterable, workers=None, chunksize=1024, ordered=True, spec=None, aliases=None,
+                   max_pending=None):
+    """Parses an iterable of command line argument lists in a pool of worker processes and yields the
+    `commandlines.tokenizer.ParseResult` objects.  Use `Command.from_parse_result()` to create a Command object from a
+    result.
+
+    With `ordered=True` the results are yielded in input order.  With `ordered=False` (index, ParseResult) tuples are
+    yielded in the order that the chunks are completed, where index is the position of the argument list in the input.
+
+    :param argv_iterable: (iterable) Command line argument lists that maintain the argument order that was entered on command line
+    :param workers: (int) Number of worker processes.  Defaults to the number of CPUs.  Use 0 to parse in the current
+                    process.
+    :param chunksize: (int) Number of argument lists that are sent to a worker process in a single task
+    :param ordered: (boolean) Yield the results in input order
+    :param spec: (CompiledSpec) Optional compiled `commandlines.spec.OptionSpec` that defines the parse
+    :param aliases: (OptionAliases) Optional `commandlines.aliases.OptionAliases` that canonicalizes option keys
+    :param max_pending: (int) Maximum number of submitted chunks that have not been yielded.  Defaults to twice the
+                        number of worker processes.
+    :returns: generator of ParseResult objects or (int, ParseResult) tuples
+    :raises: ValueError if workers, chunksize, or max_pending is out of range"""
+
+    if workers is None:
+        import multiprocessing   # deferred so that importing commandlines does not import multiprocessing
+        workers = multiprocessing.cpu_count()
+    if workers < 0:
+        raise ValueError("parse_parallel workers must be zero or greater")
+    if chunksize < 1:
+        raise ValueError("parse_parallel chunksize must be greater than zero")
+    if max_pending is None:
+        max_pending = 2 * max(workers, 1)
+    elif max_pending < 1:
+        raise ValueError("parse_parallel max_pending must be greater than zero")
+
+    chunks = _iter_chunks(argv_iterable, chunksize)
+    if workers == 0:
+        return _parse_serial(chunks, ordered, spec, aliases)
+    return _parse_pool(chunks, workers, ordered, spec, aliases, max_pending)
+
+
+def _iter_chunks(argv_iterable, chunksize):
+    """Yields (start index, list of argument tuples) chunks from an iterable of argument lists.  This is not intended
+    for public use."""
+
+    chunk = []
+    start = 0
+    for argv in argv_iterable:
+        chunk.append(tuple(argv))
+        if len(chunk) == chunksize:
+            yield start, chunk
+            start += chunksize
+            chunk = []
+    if chunk:
+        yield start, chunk
+
+
+def _parse_serial(chunks, ordered, spec, aliases):
+    for start, chunk in chunks:
+        for offset, argv in enumerate(chunk):
+            result = ParseResult(argv, spec, aliases)
+            if ordered:
+                yield result
+            else:
+                yield start + offset, result
+
+
+def _parse_pool(chunks, workers, ordered, spec, aliases, max_pending):
+    import multiprocessing
+    pool = multiprocessing.Pool(workers, _initialize_worker, (spec, aliases))
+    finished = False
+    try:
+        if ordered:
+            pending = deque()
+            for chunk in chunks:
+                pending.append(pool.apply_async(_parse_chunk, chunk))
+                if len(pending) >= max_pending:
+                    for result in _check_chunk(pending.popleft().get())[1]:
+                        yield result
+            while pending:
+                for result in _check_chunk(pending.popleft().get())[1]:
+                    yield result
+        else:
+            completed = queue.Queue()
+            pending = 0
+            for chunk in chunks:
+                pool.apply_async(_parse_chunk, chunk, callback=completed.put)
+                pending += 1
+                if pending >= max_pending:
+                    for item in _enumerate_chunk(_check_chunk(completed.get())):
+                        yield item
+                    pending -= 1
+            while pending:
+                for item in _enumerate_chunk(_check_chunk(completed.get())):
+                    yield item
+                pending -= 1
+        finished = True
+    finally:
+        if finished:
+            pool.close()
+        else:
+            pool.terminate()   # the generator was closed early or a chunk raised an exception
+        pool.join()
+
+
+def _initialize_worker(spec, aliases):
+    global _worker_spec, _worker_aliases
+    _worker_spec = spec
+    _worker_aliases = aliases
+
+
+def _parse_chunk(start, chunk):
+    """Parses a chunk of argument lists in a worker process.  Exceptions are returned rather than raised so that the
+    parent process receives a completed chunk for every submitted chunk.  This is not intended for public use.
+
+    :returns: tuple of (int, list of ParseResult, Exception or None)"""
+
+    try:
+        return start, [ParseResult(argv, _worker_spec, _worker_aliases) for argv in chunk], None
+    except Exception as e:
+        return start, None, e
+
+
+def _check_chunk(parsed_chunk):
+    start, results, error = parsed_chunk
+    if error is not None:
+        raise error
+    return start, results
+
+
+def _enumerate_chunk(checked_chunk):
+    start, results = checked_chunk
+    for offset, result in enumerate(results):
+        yield start + offset, result
@@ -0,0 +1,151 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""The commandlines.cache module contains the ParseCache class, an opt-in bounded least recently used (LRU) cache of
+command line parse results keyed by the argument tuple.
+
+Use a ParseCache with the Command.from_argv() and Command.from_argv_list() class methods:
+
+`c = Command.from_argv(argv, cache=parse_cache)`
+
+Cached ParseResult objects are immutable and are shared by all Command objects that are instantiated from the same
+argument list.  Each Command object maintains its own mutable containers and defaults.
+"""
+
+import threading
+
+from commandlines.tokenizer import ParseResult
+
+# fields of the LRU linked list entries (collections.OrderedDict is not available in Python 2.6)
+_PREVIOUS, _NEXT, _KEY, _RESULT = 0, 1, 2, 3
+
+
+class ParseCache(object):
+    """A bounded least recently used cache of `commandlines.tokenizer.ParseResult` objects keyed by the tuple of
+    command line arguments.
+
+    Attributes:
+        maxsize : (int)
+                  Maximum number of cached parse results
+        hits : (int)
+               Number of requests that were served from the cache
+        misses : (int)
+                 Number of requests that required a new parse
+        evictions : (int)
+                    Number of least recently used parse results that were removed from the cache
+
+    :param maxsize: (int) Maximum number of cached parse results.  Must be greater than zero.
+    """
+    def __init__(self, maxsize=128):
+        if maxsize < 1:
+            raise ValueError("ParseCache maxsize must be greater than zero")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._results = {}   # key : [previous entry, next entry, key, ParseResult]
+        self._root = []   # sentinel of the circular doubly linked list, least recently used entry first
+        self._root[:] = [self._root, self._root, None, None]
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._results)
+
+    def __contains__(self, argv):
+        return tuple(argv) in self._results   # results parsed without a specification or aliases
+
+    def __repr__(self):
+        return "< ParseCache object > " + self._stats_string()
+
+    def __str__(self):
+        return "< ParseCache object > " + self._stats_string()
+
+    def parse(self, argv, spec=None, aliases=None):
+        """Returns the shared ParseResult for a command line argument list.  The argument list is parsed and added to
+        the cache on a cache miss.  The least recently used result is evicted when the cache is full.
+
+        :param argv: (iterable) Command line arguments that maintain the argument order that was entered on command line
+        :param spec: (CompiledSpec) Optional compiled `commandlines.spec.OptionSpec` that defines the parse
+        :param aliases: (OptionAliases) Optional `commandlines.aliases.OptionAliases` that canonicalizes option keys
+        :returns: ParseResult"""
+
+        argv = tuple(argv)
+        key = _cache_key(argv, spec, aliases)
+        with self._lock:
+            entry = self._results.get(key)
+            if entry is not None:
+                self._unlink(entry)
+                self._append(entry)   # the end of the list marks the result as most recently used
+                self.hits += 1
+                return entry[_RESULT]
+
+        result = ParseResult(argv, spec, aliases)   # parse outside of the lock
+
+        with self._lock:
+            self.misses += 1
+            entry = self._results.get(key)
+            if entry is not None:   # parsed by another thread while the lock was released
+                return entry[_RESULT]
+            entry = [None, None, key, result]
+            self._results[key] = entry
+            self._append(entry)
+            if len(self._results) > self.maxsize:
+                oldest = self._root[_NEXT]
+                self._unlink(oldest)
+                del self._results[oldest[_KEY]]
+                self.evictions += 1
+            return result
+
+    def contains(self, argv, spec=None, aliases=None):
+        """Tests whether the parse result of a command line argument list is cached.  The specification and aliases
+        must match the `parse()` call that cached the result.  The test does not change the LRU order or the counters.
+
+        :param argv: (iterable) Command line arguments that maintain the argument order that was entered on command line
+        :param spec: (CompiledSpec) Optional compiled `commandlines.spec.OptionSpec` that defined the parse
+        :param aliases: (OptionAliases) Optional `commandlines.aliases.OptionAliases` that defined the parse
+        :returns: boolean"""
+
+        return _cache_key(tuple(argv), spec, aliases) in self._results
+
+    def clear(self):
+        """Removes all cached parse results and resets the hit, miss, and eviction counters.
+
+        :returns: None"""
+
+        with self._lock:
+            self._results.clear()
+            self._root[:] = [self._root, self._root, None, None]
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def stats(self):
+        """Returns the cache counters as a dictionary.
+
+        :returns: dictionary with 'hits', 'misses', 'evictions', 'size', and 'maxsize' keys"""
+
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions,
+                "size": len(self._results), "maxsize": self.maxsize}
+
+    def _stats_string(self):
+        return "hits=" + str(self.hits) + " misses=" + str(self.misses) + " evictions=" + str(self.evictions) + \
+               " size=" + str(len(self._results)) + " maxsize=" + str(self.maxsize)
+
+    def _append(self, entry):
+        last = self._root[_PREVIOUS]
+        entry[_PREVIOUS] = last
+        entry[_NEXT] = self._root
+        last[_NEXT] = entry
+        self._root[_PREVIOUS] = entry
+
+    def _unlink(self, entry):
+        entry[_PREVIOUS][_NEXT] = entry[_NEXT]
+        entry[_NEXT][_PREVIOUS] = entry[_PREVIOUS]
+
+
+def _cache_key(argv, spec, aliases):
+    """Returns the cache key of an argument tuple.  This is not intended for public use."""
+
+    if spec is None and aliases is None:
+        return argv
+    return spec, aliases, argv   # results that are parsed with a specification or aliases are cached separately
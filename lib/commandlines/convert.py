@@ -0,0 +1,156 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""The commandlines.convert module contains the option value converters that are used with typed option declarations
+in a `commandlines.spec.OptionSpec`:
+
+    spec = OptionSpec()
+    spec.add_option("port", "p").set_type("port", int)
+    spec.add_option("timeout").set_type("timeout", "duration")
+    c = Command.from_argv(argv, spec=spec.compile())
+    c.get_typed_definition("timeout")   # "1m30s" -> 90.0
+
+A converter is any callable that takes the definition argument string and returns the typed value or raises
+ValueError or TypeError.  The built-in converters are available by name in the CONVERTERS dictionary.  Converted values
+are cached on the shared `commandlines.tokenizer.ParseResult` so that each definition argument is converted once.
+
+Repeated numeric definitions (e.g. `--weight=0.1 --weight=0.3`) are converted to `array.array` buffers, or NumPy
+arrays when NumPy is installed, with the `to_numeric_array` function.  Both types support the buffer protocol (e.g.
+`memoryview(weights)`) for zero copy handoff to numeric code.  NumPy is an optional dependency.
+"""
+
+import os
+
+from commandlines.tokenizer import fsdecode
+
+_TRUE_STRINGS = frozenset(("1", "true", "yes", "on", "y", "t"))
+_FALSE_STRINGS = frozenset(("0", "false", "no", "off", "n", "f"))
+
+_FLOAT_TYPECODES = frozenset("fd")
+_INTEGER_TYPECODES = frozenset("bBhHiIlLqQ")
+
+_DURATION_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0, "d": 86400.0, "w": 604800.0}
+_DURATION_PATTERN = r"(\d+(?:\.\d*)?|\.\d+)(ms|s|m|h|d|w)"
+_duration_part = None   # compiled on first use so that importing commandlines does not import re
+
+
+def to_bool(value):
+    """Converts a boolean argument string (`1`, `true`, `yes`, `on`, `y`, `t` or `0`, `false`, `no`, `off`, `n`, `f`,
+    case insensitive) to a boolean.
+
+    :param value: (string) The argument string
+    :returns: boolean
+    :raises: ValueError if the argument is not a boolean string"""
+
+    lowered = fsdecode(value).lower()
+    if lowered in _TRUE_STRINGS:
+        return True
+    if lowered in _FALSE_STRINGS:
+        return False
+    raise ValueError("invalid boolean value '" + fsdecode(value) + "'")
+
+
+def to_duration(value):
+    """Converts a duration argument string to seconds.  Durations are a number of seconds (e.g. `90` or `1.5`) or a
+    sequence of numbers with `ms`, `s`, `m`, `h`, `d`, or `w` units (e.g. `500ms`, `1h30m`).
+
+    :param value: (string) The argument string
+    :returns: float
+    :raises: ValueError if the argument is not a duration string"""
+
+    text = fsdecode(value).strip()
+    try:
+        return float(text)
+    except ValueError:
+        pass
+    global _duration_part
+    if _duration_part is None:
+        import re
+        _duration_part = re.compile(_DURATION_PATTERN)
+    seconds = 0.0
+    end = 0
+    for match in _duration_part.finditer(text):
+        if match.start() != end:
+            break
+        seconds += float(match.group(1)) * _DURATION_UNITS[match.group(2)]
+        end = match.end()
+    if end == 0 or end != len(text):
+        raise ValueError("invalid duration value '" + text + "'")
+    return seconds
+
+
+def to_path(value):
+    """Converts a path argument string to a path with the user home directory `~` expanded.  Bytes mode arguments
+    are returned as bytes.
+
+    :param value: (string) The argument string
+    :returns: string
+    :raises: ValueError if the argument is an empty string"""
+
+    if len(value) == 0:
+        raise ValueError("invalid empty path value")
+    return os.path.expanduser(value)
+
+
+# Converters that are available by name in `OptionSpec.set_type()`
+CONVERTERS = {"int": int, "float": float, "bool": to_bool, "duration": to_duration, "path": to_path}
+
+
+def get_converter(converter):
+    """Returns the converter callable for a converter name in the CONVERTERS dictionary or a callable.
+
+    :param converter: (string or callable) Converter name or callable
+    :returns: callable
+    :raises: ValueError if the converter is not a CONVERTERS name or a callable"""
+
+    if callable(converter):
+        return converter
+    try:
+        return CONVERTERS[converter]
+    except (KeyError, TypeError):
+        raise ValueError("unsupported option value converter '" + str(converter) + "'. Use a callable or one of " +
+                         str(sorted(CONVERTERS)) + ".")
+
+
+def get_numeric_converter(typecode):
+    """Returns the element converter (`float` or `int`) of a numeric array type code.
+
+    :param typecode: (string) An `array` module type code
+    :returns: callable
+    :raises: ValueError if the type code is not supported"""
+
+    if typecode in _FLOAT_TYPECODES:
+        return float
+    elif typecode in _INTEGER_TYPECODES:
+        return int
+    raise ValueError("unsupported numeric array type code '" + str(typecode) + "'")
+
+
+def to_numeric_array(values, typecode="d", use_numpy=None):
+    """Converts a sequence of numeric argument strings to a numeric array in a single conversion pass.
+
+    :param values: (sequence) The argument strings
+    :param typecode: (string) An `array` module type code.  Use `f` or `d` for floating point values and `b`, `B`,
+                     `h`, `H`, `i`, `I`, `l`, `L`, `q`, or `Q` (Python 3 only) for integer values.  The type code is
+                     also used as the NumPy dtype.
+    :param use_numpy: (boolean) Return a NumPy array.  Defaults to a NumPy array when NumPy is installed and an
+                      `array.array` otherwise.
+    :returns: array.array or numpy.ndarray
+    :raises: ValueError if the type code is not supported or an argument cannot be converted
+    :raises: ImportError if use_numpy is True and NumPy is not installed"""
+
+    converter = get_numeric_converter(typecode)
+    if use_numpy is not False:
+        try:
+            import numpy
+        except ImportError:
+            if use_numpy:
+                raise
+        else:
+            try:
+                return numpy.asarray(values, dtype=typecode)   # vectorized conversion of the argument strings
+            except (ValueError, TypeError):
+                # NumPy does not convert some strings that Python does (e.g. integers with surrounding whitespace)
+                return numpy.fromiter(map(converter, values), dtype=typecode, count=len(values))
+    from array import array   # deferred, the array module imports collections.abc on Python 3
+    return array(typecode, map(converter, values))
@@ -1,31 +1,63 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+from commandlines.tokenizer import fsdecode
+
 
 class CommandlinesError(Exception):
-    """Base exception class for all exceptions raised by the commandlines library"""
+    """Base exception class for all exceptions raised by the commandlines library.  Exception messages are formatted
+    on first access of the `error_message` attribute or of the string of the exception (exceptions that are caught
+    and handled do not format a message)."""
     def __init__(self, message):
         Exception.__init__(self, message)
 
+    def __str__(self):
+        return self.error_message
+
+    @property
+    def error_message(self):
+        return self._format_message()
+
+    def _format_message(self):
+        return self.args[0]
+
 
 class MissingArgumentError(CommandlinesError):
     """Missing argument exception"""
     def __init__(self, argument):
-        self.error_message = "Missing argument exception: the argument '" + argument + "' was not found."
-        CommandlinesError.__init__(self, self.error_message)
+        self.argument = argument
+        Exception.__init__(self, argument)
+
+    def _format_message(self):
+        return "Missing argument exception: the argument '" + fsdecode(self.argument) + "' was not found."
 
 
 class MissingDictionaryKeyError(CommandlinesError):
     """Missing dictionary key exception"""
     def __init__(self, dict_key):
-        self.error_message = "Missing dictionary key exception: the dictionary key '" + dict_key + "' was not found."
-        CommandlinesError.__init__(self, self.error_message)
+        self.dict_key = dict_key
+        Exception.__init__(self, dict_key)
+
+    def _format_message(self):
+        return "Missing dictionary key exception: the dictionary key '" + fsdecode(self.dict_key) + "' was not found."
 
 
 class IndexOutOfRangeError(CommandlinesError, IndexError):
     """Index out of range exception"""
+    error_message = "Index out of range exception.  The requested index fell outside of the index range."
+
     def __init__(self):
-        self.error_message = "Index out of range exception.  The requested index fell outside of the index range."
-        IndexError.__init__(self)
-        CommandlinesError.__init__(self, self.error_message)
+        Exception.__init__(self)
+
+
+class ConversionError(CommandlinesError, ValueError):
+    """Option value conversion exception.  The errors attribute is a list of (option, argument, reason) tuples for
+    every argument that could not be converted."""
+    def __init__(self, errors):
+        self.errors = errors
+        Exception.__init__(self, errors)
 
+    def _format_message(self):
+        failures = ["the argument '" + fsdecode(argument) + "' of the option '" + fsdecode(option) +
+                    "' could not be converted (" + reason + ")" for option, argument, reason in self.errors]
+        return "Option value conversion exception: " + "; ".join(failures) + "."
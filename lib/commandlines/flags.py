@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""The commandlines.flags module contains the OptionFlags class, a registry of flag bits for switches, and the
+FLAG_* bits of the POSIX / GNU standard options that are recognized by the Command object.
+
+Every Command object has a `flags` word with one bit for each registered switch that is included in the command
+string.  The standard option bits are computed when the argument list is parsed.  Register the switches of an
+application in an OptionFlags registry to add bits for them.  Tests of any combination of switches are then a single
+mask comparison:
+
+    flags = OptionFlags(("debug", "d"), ("color",))
+    c = Command(flags=flags)
+    verbose_not_quiet = (flags.mask("verbose"), flags.mask("quiet"))
+    if c.matches_flags(*verbose_not_quiet):
+        ...
+
+Register the canonical option names when the Command object is instantiated with an `aliases` registry.
+"""
+
+from commandlines.aliases import STANDARD_ALIASES
+from commandlines.tokenizer import FLAG_USER, STANDARD_FLAG_BITS, make_flag_tables, switch_flags
+# the standard FLAG_* bits are imported here for applications
+from commandlines.tokenizer import FLAG_HELP, FLAG_QUIET, FLAG_USAGE, FLAG_VERBOSE, FLAG_VERSION  # noqa: F401
+
+
+class OptionFlags(object):
+    """An immutable registry of switch flag bits.  The standard options are registered with the FLAG_* bits and each
+    group of option names is assigned the next free bit from FLAG_USER up.  The first name in each group is the
+    canonical option name.  Names are defined without the dashes that are used on the command line.
+
+    Attributes:
+        flag_map : (dict)
+                   Mapping of every registered option name : flag bit
+
+    :param groups: (tuple) One or more tuples of option names with the canonical name at index position 0
+    :raises: ValueError if a name is registered in more than one group or is a standard option name
+    """
+    def __init__(self, *groups):
+        flag_map = dict(STANDARD_FLAG_BITS)
+        for name, canonical in STANDARD_ALIASES.alias_map.items():
+            flag_map[name] = STANDARD_FLAG_BITS[canonical]
+        bit = FLAG_USER
+        for group in groups:
+            if len(group) == 0:
+                raise ValueError("option flag groups must include at least one option name")
+            for name in group:
+                if name in flag_map:
+                    raise ValueError("the option name '" + name + "' is registered in more than one flag group")
+                flag_map[name] = bit
+            bit <<= 1
+        self.flag_map = flag_map
+        self._tables = make_flag_tables(flag_map)
+
+    def __contains__(self, name):
+        return name in self.flag_map
+
+    def __repr__(self):
+        return "< OptionFlags object > " + self.flag_map.__str__()
+
+    def __str__(self):
+        return "< OptionFlags object > " + self.flag_map.__str__()
+
+    def mask(self, *names):
+        """Returns the bitwise OR of the flag bits of one or more option names.
+
+        :param names: (string) Option names without dashes
+        :returns: integer
+        :raises: ValueError if an option name is not registered"""
+
+        mask = 0
+        for name in names:
+            try:
+                mask |= self.flag_map[name]
+            except KeyError:
+                raise ValueError("the option name '" + name + "' is not registered in the flag registry")
+        return mask
+
+    def flags_of(self, switches, bytes_mode=False):
+        """Returns the flags word of a set of switches.
+
+        :param switches: (set or frozenset) Switch strings without dashes
+        :param bytes_mode: (boolean) The switches are bytes mode switches
+        :returns: integer"""
+
+        return switch_flags(switches, self._tables[bytes_mode])
+
+
+# Registry of the standard options only, the flags of a Command object that is instantiated without a registry
+STANDARD_FLAGS = OptionFlags()
@@ -13,7 +13,19 @@ Exceptions raised by this module are in the `commandlines.exceptions` module.
 """
 
 import sys
-from commandlines.exceptions import IndexOutOfRangeError, MissingArgumentError, MissingDictionaryKeyError
+from itertools import islice
+
+try:
+    from _collections_abc import Sequence   # loaded at interpreter startup, collections.abc imports collections
+except ImportError:   # Python 2, Python 3.3
+    from collections import Sequence
+
+from commandlines.exceptions import ConversionError, IndexOutOfRangeError, MissingArgumentError, \
+    MissingDictionaryKeyError
+from commandlines.flags import STANDARD_FLAGS
+from commandlines.tokenizer import FLAG_HELP, FLAG_QUIET, FLAG_USAGE, FLAG_VERBOSE, FLAG_VERSION, ParseResult, \
+    collect, fsdecode, is_bytes_argv, make_events, mops_from_mask, mops_mask, scan_definitions, scan_mops, \
+    scan_switches, tokenize
 
 
 class Command(object):
@@ -21,6 +33,14 @@ class Command(object):
     the development of Python command line applications.
 
     The class is instantiated from the list of command line arguments that are passed to a Python script in `sys.argv`.
+    Use the `Command.from_argv()` and `Command.from_argv_list()` class methods to parse explicit argument lists.
+
+    Argument lists of bytes (e.g. `[os.fsencode(arg) for arg in sys.argv[1:]]`) are parsed in bytes mode without
+    decoding.  In bytes mode the arguments, option keys, definition arguments, and multi-option short syntax characters
+    are bytes, and needles for the contains_* and get_* methods should be bytes.
+
+    By default all attributes are parsed at instantiation.  Instantiate with `lazy=True` to defer the parsing of each
+    attribute to its first access.  Deferred attributes are cached after they are parsed.
 
     Attributes:
         arg0 : (string)
@@ -43,6 +63,8 @@ class Command(object):
                   Dictionary of default key : value mapped as option : argument value
         defs: (Definitions, dict)
                Dictionary of key=option : value=argument definition pairs
+        flags: (int)
+               Bitwise OR of the `commandlines.flags` bits of the standard and registered switches in the command string
         mdefs: (MultiDefinitions, Definitions, dict)
                 Dictionary of key=option : value=argument definition pairs for options included more than once in command
         mops: (set)
@@ -53,31 +75,162 @@ class Command(object):
                The second positional argument (=arg1)
         switches: (set)
                Set of long and short switch syntax arguments
+
+    :param lazy: (boolean) Defer the parsing of command line argument dependent attributes to first access
+    :param spec: (CompiledSpec) Optional compiled `commandlines.spec.OptionSpec` that replaces the heuristic option
+                 parsing with a declared option specification.  The alias names that are declared in the spec are
+                 accepted by the Command option methods when the `aliases` parameter is not used.
+    :param aliases: (OptionAliases) Optional `commandlines.aliases.OptionAliases` registry of alternative option names.
+                    Option keys in the switches, defs, and mdefs containers are canonicalized at parse time and option
+                    needles are canonicalized in the Command contains_*, get_*, and find_* option methods.
+    :param flags: (OptionFlags) Optional `commandlines.flags.OptionFlags` registry of switch flag bits that are included
+                  in the `flags` word in addition to the standard option bits
     """
-    def __init__(self):
-        self.argv = sys.argv[1:]
-        self.arguments = Arguments(self.argv)
-        self.defaults = {}
-        self.switches = Switches(self.argv)
-        self.mops = Mops(self.argv)
-        self.defs = Definitions(self.argv)
-        self.mdefs = MultiDefinitions(self.argv)
+    def __init__(self, lazy=False, spec=None, aliases=None, flags=None):
+        self._initialize(sys.argv[1:], lazy, None, spec, aliases, flags)
+
+    @classmethod
+    def from_argv(cls, argv, lazy=False, cache=None, spec=None, aliases=None, flags=None):
+        """Instantiates a Command object from an explicit list of command line arguments rather than `sys.argv`.  The
+        argument list should not include the executable (i.e. use the equivalent of `sys.argv[1:]`).
+
+        :param argv: (list) A list of command line arguments that maintain the argument order that was entered on command line
+        :param lazy: (boolean) Defer the parsing of command line argument dependent attributes to first access
+        :param cache: (ParseCache) Optional `commandlines.cache.ParseCache` that is used to share parse results for
+                      repeated argument lists
+        :param spec: (CompiledSpec) Optional compiled `commandlines.spec.OptionSpec` that defines the parse
+        :param aliases: (OptionAliases) Optional `commandlines.aliases.OptionAliases` option name alias registry
+        :param flags: (OptionFlags) Optional `commandlines.flags.OptionFlags` switch flag bit registry
+        :returns: Command"""
+
+        obj = cls.__new__(cls)
+        obj._initialize(argv, lazy, cache, spec, aliases, flags)
+        return obj
+
+    @classmethod
+    def from_argv_list(cls, argv_list, lazy=False, cache=None, spec=None, aliases=None, flags=None):
+        """Instantiates a Command object for each command line argument list in an iterable of argument lists.  The
+        argument lists should not include the executable.  Global `sys.argv` state is neither read nor modified.
+
+        :param argv_list: (iterable) An iterable of command line argument lists
+        :param lazy: (boolean) Defer the parsing of command line argument dependent attributes to first access
+        :param cache: (ParseCache) Optional `commandlines.cache.ParseCache` that is used to share parse results for
+                      repeated argument lists
+        :param spec: (CompiledSpec) Optional compiled `commandlines.spec.OptionSpec` that defines the parse
+        :param aliases: (OptionAliases) Optional `commandlines.aliases.OptionAliases` option name alias registry
+        :param flags: (OptionFlags) Optional `commandlines.flags.OptionFlags` switch flag bit registry
+        :returns: list of Command objects in the order of the argument lists in `argv_list`"""
+
+        commands = []
+        append = commands.append
+        new = cls.__new__
+        for argv in argv_list:
+            obj = new(cls)
+            obj._initialize(argv, lazy, cache, spec, aliases, flags)
+            append(obj)
+        return commands
+
+    @classmethod
+    def from_parse_result(cls, parse_result, lazy=False, spec=None, aliases=None, flags=None):
+        """Instantiates a Command object from a `commandlines.tokenizer.ParseResult` (e.g. a result that was returned
+        by the `commandlines.batch` parsers) without parsing the argument list again.
+
+        :param parse_result: (ParseResult) The parse result
+        :param lazy: (boolean) Defer the building of the option containers to first access
+        :param spec: (CompiledSpec) The compiled `commandlines.spec.OptionSpec` that was used to parse the result, if
+                     any.  The spec declares the option types of the typed definition getters.
+        :param aliases: (OptionAliases) The `commandlines.aliases.OptionAliases` registry that was used to parse the
+                        result, if any
+        :param flags: (OptionFlags) Optional `commandlines.flags.OptionFlags` switch flag bit registry
+        :returns: Command"""
+
+        obj = cls.__new__(cls)
+        obj._parsed = parse_result
+        obj._initialize(parse_result.argv, lazy, None, spec, aliases, flags)
+        return obj
+
+    def __getattr__(self, name):
+        # only called when normal attribute lookup fails, i.e. for an attribute that was deferred in lazy mode.
+        # The value is cached in the instance dictionary so that this method is not called again for the attribute.
+        try:
+            make_attribute = _DEFERRED_ATTRIBUTES[name]
+        except KeyError:
+            raise AttributeError("'Command' object has no attribute '" + name + "'")
+        value = make_attribute(self)
+        self.__dict__[name] = value
+        return value
+
+    def _initialize(self, argv, lazy, cache, spec, aliases, flags=None):
+        """Defines the instance attributes from a list of command line arguments.  This is not intended for public use.
+
+        :param argv: (iterable) Command line arguments that maintain the argument order that was entered on command line
+        :param lazy: (boolean) Defer the parsing of command line argument dependent attributes to first access
+        :param cache: (ParseCache) Parse cache or None
+        :param spec: (CompiledSpec) Compiled option specification or None for heuristic parsing
+        :param aliases: (OptionAliases) Option name alias registry or None
+        :param flags: (OptionFlags) Switch flag bit registry or None for the standard option bits
+        :returns: None"""
+
+        if cache is None:
+            self.argv = list(argv)
+        else:
+            self._parsed = cache.parse(argv, spec, aliases)
+            self.argv = list(self._parsed.argv)
         self.argc = len(self.argv)
-        self.arg0 = self.arguments.get_argument_for_commandobj(0)
-        self.arg1 = self.arguments.get_argument_for_commandobj(1)
-        self.arg2 = self.arguments.get_argument_for_commandobj(2)
-        self.arg3 = self.arguments.get_argument_for_commandobj(3)
-        self.arg4 = self.arguments.get_argument_for_commandobj(4)
-        self.arglp = self.arguments.get_argument_for_commandobj(self.argc - 1)
+        self.defaults = {}
+        self._bytes_mode = is_bytes_argv(self.argv)
+        self._spec = spec
+        self._aliases = aliases
+        # option needles are canonicalized with the aliases registry or with the alias names declared in the spec
+        self._needle_aliases = aliases if aliases is not None or spec is None else spec.aliases
+        self._flags = flags
+        # in lazy mode the remaining attributes are parsed on first access, see Command.__getattr__
+        if not lazy:
+            self._make_attributes()
+
+    def _make_attributes(self):
+        """Parses all command line argument dependent instance attributes.  This is not intended for public use.
+
+        :returns: None"""
+
+        # single classification pass over the argument list shared by all of the option containers.  The containers
+        # are filled directly from the collected parse data unless a shared ParseResult is used (cache or
+        # from_parse_result).  The flags word and the token event record are built on first access.
+        argv = self.argv
+        argc = self.argc
+        if "_parsed" in self.__dict__:
+            parsed = self._parsed
+            arguments = Arguments._from_parsed(argv, parsed.double_dash)
+            switches = Switches._from_parsed(parsed.switches)
+            mops = Mops._from_mask(parsed.mops, parsed.mops_other)
+            defs = Definitions._from_parsed(parsed.defs)
+            mdefs = MultiDefinitions._from_parsed(_copy_multi_definitions(parsed.mdefs))
+        else:
+            collected = self._collected = _collect(self)
+            arguments = Arguments._from_parsed(argv, collected[5])
+            switches = Switches._from_parsed(collected[1])
+            mops = Mops._from_parsed(collected[2])
+            defs = Definitions._from_parsed(collected[3])
+            mdefs = MultiDefinitions._from_parsed(collected[4])
+        self.arguments = arguments
+        self.switches = switches
+        self.mops = mops
+        self.defs = defs
+        self.mdefs = mdefs
+        # arg0 - arg4 are empty strings for index positions that are out of the argument list index range
+        if argc >= 5:
+            self.arg0, self.arg1, self.arg2, self.arg3, self.arg4 = argv[:5]
+        else:
+            padding = [b"" if self._bytes_mode else ""] * (5 - argc)
+            self.arg0, self.arg1, self.arg2, self.arg3, self.arg4 = argv + padding
+        self.arglp = argv[-1] if argc > 0 else self.arg0
         self.subcmd = self.arg0
         self.subsubcmd = self.arg1
-        self.has_args = (len(self.arguments) > 0)
-        self.has_switches = (len(self.switches) > 0)
-        self.has_mops = (len(self.mops) > 0)
-        self.has_defs = (len(self.defs) > 0)
-        self.has_mdefs = (len(self.mdefs) > 0)
-
-    # TODO: implement support for short / long option alternatives
+        self.has_args = argc > 0
+        self.has_switches = len(switches) > 0
+        self.has_mops = len(mops) > 0
+        self.has_defs = len(defs) > 0
+        self.has_mdefs = len(mdefs) > 0
 
     def __repr__(self):
         return "< Command object > instantiated from arguments: " + self.argv.__str__()
@@ -183,6 +336,25 @@ class Command(object):
 
         self.defaults.update(default_dictionary)
 
+    def resolve(self, env_prefix=None, config=None, environ=None):
+        """Returns a `commandlines.resolve.ResolvedOptions` map that merges the command line definitions, the
+        environment variables with a name prefix, an optional configuration file, and the Command.defaults
+        definitions, in that order of precedence.  The map records the source of each option value.  The map is built
+        once and is not updated with later changes to the Command definitions or defaults.
+
+        :param env_prefix: (string) Environment variable name prefix (e.g. `MYAPP_`).  Environment variables are not
+                           used when None.
+        :param config: (string or dict) JSON configuration file path or option : value mapping.  Optional.
+        :param environ: (dict) Environment variable mapping.  Defaults to `os.environ`.
+        :returns: ResolvedOptions"""
+
+        from commandlines.resolve import ResolvedOptions   # deferred to keep the import of commandlines inexpensive
+
+        definitions = self.defs
+        if self._bytes_mode:
+            definitions = dict((fsdecode(key), fsdecode(value)) for key, value in definitions.items())
+        return ResolvedOptions(definitions, env_prefix, config, self.defaults, environ, self._needle_aliases)
+
     def contains_defaults(self, *default_needles):
         """Tests for the presence of one or more default option : argument definitions in the Command.defaults parameter
 
@@ -209,6 +381,17 @@ class Command(object):
         else:
             raise MissingDictionaryKeyError(default_needle)
 
+    def find_default(self, default_needle, default=None):
+        """Returns the value for a default option : argument definition in the Command.defaults parameter, or the
+        `default` parameter value if the default option is not defined.  This is the non-raising alternative to the
+        `get_default()` method.
+
+        :param default_needle: (string) The default option for which a value is requested
+        :param default: The value that is returned when the default option is not defined
+        :returns: User-specified type or the `default` parameter value"""
+
+        return self.defaults.get(default_needle, default)
+
     # //////////////////////////////////////////////////////////////
     #
     # Application logic methods
@@ -223,6 +406,8 @@ class Command(object):
         :param switch_needles: (tuple) One or more expected switch strings.
         :returns: boolean"""
 
+        if self._needle_aliases is not None:
+            switch_needles = self._needle_aliases.canonicalize(switch_needles)
         return self.switches.contains(switch_needles)
 
     def contains_mops(self, *mops_needles):
@@ -242,6 +427,8 @@ class Command(object):
         :param def_needles: (tuple) One or more expected definition option key(s).
         :returns: boolean"""
 
+        if self._needle_aliases is not None:
+            def_needles = self._needle_aliases.canonicalize(def_needles)
         return self.defs.contains(def_needles)
 
     def contains_multi_definitions(self, *def_needles):
@@ -255,6 +442,8 @@ class Command(object):
         :param def_needles: (tuple) One or more expected definition option key(s).
         :returns: boolean"""
 
+        if self._needle_aliases is not None:
+            def_needles = self._needle_aliases.canonicalize(def_needles)
         return self.mdefs.contains(def_needles)
 
     def has_command_sequence(self, *cmd_list):
@@ -283,14 +472,11 @@ class Command(object):
         :param argument_needle: (string) The test argument that is known to be present in the command
         :raises: MissingArgumentError when argument_needle is not found in the parsed argument list"""
 
-        if argument_needle in self.arguments:
-            position = self.arguments.get_arg_position(argument_needle)
-            if len(self.argv) > (position + number):
-                return True
-            else:
-                return False
+        position = self.arguments.get_arg_position(argument_needle)   # raises MissingArgumentError if not found
+        if self.argc > (position + number):
+            return True
         else:
-            raise MissingArgumentError(argument_needle)
+            return False
 
     def next_arg_is_in(self, start_argument, supported_at_next_position):
         """Test for the presence of a supported argument in the n+1 index position for a known argument at the
@@ -300,15 +486,12 @@ class Command(object):
         :param supported_at_next_position: (list) list of strings that define supported arguments in the n+1 index
         :raises: MissingArgumentError when start_argument is not found in the parsed argument list"""
 
-        if start_argument in self.arguments:
-            position = self.arguments.get_arg_position(start_argument)
-            test_argument = self.arguments.get_arg_next(position)
-            if test_argument in supported_at_next_position:
-                return True
-            else:
-                return False
+        position = self.arguments.get_arg_position(start_argument)   # raises MissingArgumentError if not found
+        test_argument = self.arguments.get_arg_next(position)
+        if test_argument in supported_at_next_position:
+            return True
         else:
-            raise MissingArgumentError(start_argument)
+            return False
 
     # //////////////////////////////////////////////////////////////
     #
@@ -321,10 +504,7 @@ class Command(object):
 
         :returns: boolean. True = has double dash token. False = does not contain double dash token."""
 
-        if "--" in self.arguments:
-            return True
-        else:
-            return False
+        return self.arguments._get_double_dash() >= 0
 
     # //////////////////////////////////////////////////////////////
     #
@@ -339,8 +519,23 @@ class Command(object):
         :returns: string
         :raises: MissingDictionaryKeyError when the option string is not found"""
 
+        if self._needle_aliases is not None:
+            def_needle = self._needle_aliases.canonical(def_needle)
         return self.defs.get_def_argument(def_needle)
 
+    def find_definition(self, def_needle, default=None):
+        """Returns the argument to an option that is part of an option-argument definition pair, or the `default`
+        parameter value if the option is not defined.  This is the non-raising alternative to the `get_definition()`
+        method.
+
+        :param def_needle: (string) The option string of the option-argument pair
+        :param default: The value that is returned when the option is not defined
+        :returns: string or the `default` parameter value"""
+
+        if self._needle_aliases is not None:
+            def_needle = self._needle_aliases.canonical(def_needle)
+        return self.defs.find_def_argument(def_needle, default)
+
     def get_multiple_definitions(self, def_needle):
         """Returns a list of argument strings to an option that is included multiple times using option-argument
         syntax on the command line (e.g. `$ executable -o file1 -o file2`)
@@ -349,8 +544,204 @@ class Command(object):
         :returns: string
         :raises: MissingDictionaryKeyError when the option string is not found"""
 
+        if self._needle_aliases is not None:
+            def_needle = self._needle_aliases.canonical(def_needle)
         return self.mdefs.get_def_argument(def_needle)
 
+    def find_multiple_definitions(self, def_needle, default=None):
+        """Returns the list of argument strings to an option that is included multiple times using option-argument
+        syntax on the command line, or the `default` parameter value if the option is not a multiple definition option.
+        This is the non-raising alternative to the `get_multiple_definitions()` method.
+
+        :param def_needle: (string) The option string of the option-argument pair
+        :param default: The value that is returned when the option is not a multiple definition option
+        :returns: list or the `default` parameter value"""
+
+        if self._needle_aliases is not None:
+            def_needle = self._needle_aliases.canonical(def_needle)
+        return self.mdefs.find_def_argument(def_needle, default)
+
+    def get_typed_definition(self, def_needle):
+        """Returns the converted argument to a definition option with a type that is declared with
+        `OptionSpec.set_type()` in the Command spec.  The argument is converted on first access and the converted
+        value is cached on the shared parse result.  The argument string is returned for options without a declared
+        type.
+
+        :param def_needle: (string) The option string of the option-argument pair
+        :returns: The converted value
+        :raises: MissingDictionaryKeyError when the option string is not found
+        :raises: ConversionError when the argument cannot be converted"""
+
+        if self._needle_aliases is not None:
+            def_needle = self._needle_aliases.canonical(def_needle)
+        value = self.defs.get_def_argument(def_needle)
+        converter = self._get_converter(def_needle)
+        if converter is None:
+            return value
+        try:
+            return _convert_value(self._typed, def_needle, value, converter)
+        except (ValueError, TypeError) as e:
+            raise ConversionError([(def_needle, value, str(e))])
+
+    def get_typed_multiple_definitions(self, def_needle):
+        """Returns the list of converted arguments to an option that is included multiple times on the command line
+        with a type that is declared with `OptionSpec.set_type()` in the Command spec.  The arguments are converted in
+        a single pass on first access and the converted values are cached on the shared parse result.  The list of
+        argument strings is returned for options without a declared type.
+
+        :param def_needle: (string) The option string of the option-argument pair
+        :returns: list
+        :raises: MissingDictionaryKeyError when the option string is not found
+        :raises: ConversionError with every argument that cannot be converted"""
+
+        if self._needle_aliases is not None:
+            def_needle = self._needle_aliases.canonical(def_needle)
+        values = self.mdefs.get_def_argument(def_needle)
+        converter = self._get_converter(def_needle)
+        if converter is None:
+            return values
+        try:
+            return _convert_values(self._typed, def_needle, values, converter)
+        except (ValueError, TypeError):
+            raise ConversionError(_conversion_errors(def_needle, values, converter))
+
+    def get_numeric_definitions(self, def_needle, typecode="d", use_numpy=None):
+        """Returns all arguments to a definition option as a numeric array that is filled in a single conversion pass.
+        The arguments of an option that is used more than once are read from the multiple definitions container.  An
+        option that is used once returns an array of length one.  The arrays support the buffer protocol (e.g.
+        `memoryview(array)`) for zero copy handoff to numeric code.
+
+        :param def_needle: (string) The option string of the option-argument pair
+        :param typecode: (string) An `array` module type code (e.g. `d` for floating point or `l` for integer values)
+        :param use_numpy: (boolean) Return a NumPy array.  Defaults to a NumPy array when NumPy is installed and an
+                          `array.array` otherwise.
+        :returns: array.array or numpy.ndarray
+        :raises: MissingDictionaryKeyError when the option string is not found
+        :raises: ConversionError with every argument that cannot be converted
+        :raises: ValueError if the type code is not supported"""
+
+        from commandlines.convert import get_numeric_converter, to_numeric_array   # deferred, see Command.resolve()
+
+        if self._needle_aliases is not None:
+            def_needle = self._needle_aliases.canonical(def_needle)
+        values = self.mdefs.find_def_argument(def_needle)
+        if values is None:
+            values = [self.defs.get_def_argument(def_needle)]
+        converter = get_numeric_converter(typecode)   # raises ValueError for an unsupported type code
+        try:
+            return to_numeric_array(values, typecode, use_numpy)
+        except (ValueError, TypeError, OverflowError):
+            errors = _conversion_errors(def_needle, values, converter)
+            if errors:
+                raise ConversionError(errors)
+            raise   # e.g. an integer value that is out of the type code range
+
+    def convert_definitions(self):
+        """Converts the arguments of all typed definition options and multiple definition options and reports every
+        argument that cannot be converted in a single exception.  Options without a declared type maintain the
+        argument strings.
+
+        :returns: tuple of (dict, dict) with the {option : converted value} definitions and the
+                  {option : list of converted values} multiple definitions
+        :raises: ConversionError with every argument that cannot be converted"""
+
+        cache = self._typed
+        get_converter = self._get_converter
+        errors = []
+        definitions = {}
+        for key, value in self.defs.items():
+            converter = get_converter(key)
+            if converter is None:
+                definitions[key] = value
+                continue
+            try:
+                definitions[key] = _convert_value(cache, key, value, converter)
+            except (ValueError, TypeError) as e:
+                errors.append((key, value, str(e)))
+        multiple_definitions = {}
+        for key, values in self.mdefs.items():
+            converter = get_converter(key)
+            if converter is None:
+                multiple_definitions[key] = list(values)
+                continue
+            try:
+                multiple_definitions[key] = _convert_values(cache, key, values, converter)
+            except (ValueError, TypeError):
+                reported = frozenset((option, argument) for option, argument, reason in errors)
+                errors.extend(error for error in _conversion_errors(key, values, converter)
+                              if (key, error[1]) not in reported)
+        if errors:
+            raise ConversionError(errors)
+        return definitions, multiple_definitions
+
+    def _get_converter(self, key):
+        """Returns the declared converter of an option or None.  This is not intended for public use."""
+
+        if self._spec is None:
+            return None
+        return self._spec.converters.get(key)
+
+    def get_option_positions(self, option_needle):
+        """Returns the argument list index positions of the switch and definition uses of an option in ascending order.
+        The positions are read from the ordered `commandlines.tokenizer.TokenEvents` record of the parse (i.e. they
+        refer to the argument list that was parsed) and the argument list is not searched.  The option needle should
+        not include the dashes that are used at the beginning of the option on the command line.
+
+        :param option_needle: (string) The option string
+        :returns: tuple of integers
+        :raises: MissingArgumentError when the option is not included in the command string"""
+
+        if self._needle_aliases is not None:
+            option_needle = self._needle_aliases.canonical(option_needle)
+        positions = self._events.positions_of(option_needle)
+        if len(positions) == 0:
+            raise MissingArgumentError(option_needle)
+        return positions
+
+    def find_option_positions(self, option_needle, default=None):
+        """Returns the argument list index positions of the switch and definition uses of an option in ascending order,
+        or the `default` parameter value if the option is not included in the command string.  This is the non-raising
+        alternative to the `get_option_positions()` method.
+
+        :param option_needle: (string) The option string
+        :param default: The value that is returned when the option is not included in the command string
+        :returns: tuple of integers or the `default` parameter value"""
+
+        if self._needle_aliases is not None:
+            option_needle = self._needle_aliases.canonical(option_needle)
+        return self._events.positions_of(option_needle) or default
+
+    def get_definition_occurrences(self, def_needle):
+        """Returns every use of a definition option in command line order as (option position, definition argument
+        position, definition argument string) tuples.  The occurrences are read from the same parse event record as the
+        last definition value in `Command.defs` and the definition value lists in `Command.mdefs`.  The definition
+        needle should not include the dashes that are used at the beginning of the option on the command line.
+
+        :param def_needle: (string) The definition option string
+        :returns: tuple of (int, int, string) tuples
+        :raises: MissingDictionaryKeyError when the option is not a definition option in the command string"""
+
+        if self._needle_aliases is not None:
+            def_needle = self._needle_aliases.canonical(def_needle)
+        occurrences = self._events.occurrences(def_needle)
+        if len(occurrences) == 0:
+            raise MissingDictionaryKeyError(def_needle)
+        return occurrences
+
+    def find_definition_occurrences(self, def_needle, default=None):
+        """Returns every use of a definition option in command line order as (option position, definition argument
+        position, definition argument string) tuples, or the `default` parameter value if the option is not a
+        definition option in the command string.  This is the non-raising alternative to the
+        `get_definition_occurrences()` method.
+
+        :param def_needle: (string) The definition option string
+        :param default: The value that is returned when the option is not a definition option in the command string
+        :returns: tuple of (int, int, string) tuples or the `default` parameter value"""
+
+        if self._needle_aliases is not None:
+            def_needle = self._needle_aliases.canonical(def_needle)
+        return self._events.occurrences(def_needle) or default
+
     def get_arg_after(self, target_arg):
         """Returns the next positional argument at index position n + 1 to a command line argument at index position n.
 
@@ -359,28 +750,60 @@ class Command(object):
            :raises: MissingArgumentError when target_arg is not found in the parsed argument list
            :raises: IndexOutOfRangeError when target_arg is the last positional argument"""
 
-        if target_arg in self.argv:
-            recipient_position = self.arguments.get_arg_position(target_arg)
-            return self.arguments.get_arg_next(recipient_position)
-        else:
-            raise MissingArgumentError(target_arg)
+        recipient_position = self.arguments.get_arg_position(target_arg)   # raises MissingArgumentError if not found
+        return self.arguments.get_arg_next(recipient_position)
+
+    def find_arg_after(self, target_arg, default=None):
+        """Returns the next positional argument at index position n + 1 to a command line argument at index position n,
+        or the `default` parameter value if target_arg is not in the argument list or is the last argument.  This is
+        the non-raising alternative to the `get_arg_after()` method.
+
+        :param target_arg: (string) Argument string for the test.
+        :param default: The value that is returned when there is no argument after target_arg
+        :returns: string or the `default` parameter value"""
+
+        recipient_position = self.arguments.find_arg_position(target_arg)
+        if recipient_position is None:
+            return default
+        return self.arguments.find_arg_next(recipient_position, default)
 
     def get_double_dash_args(self):
-        """Returns the arguments after the double dash `--` command line idiom as a list.
+        """Returns the arguments after the double dash `--` command line idiom as a list.  Use the
+        `get_double_dash_view()` method to access the arguments without a copy.
 
-        :returns: list of strings"""
+        :returns: list of strings
+        :raises: MissingArgumentError when the double dash idiom is not included in the command string"""
 
-        if "--" in self.arguments:
-            dd_position = self.arguments.get_arg_position("--")
-            start_position = dd_position + 1
-            return self.arguments[start_position:]
-        else:
-            raise MissingArgumentError("--")
+        return self.arguments[self.arguments.get_double_dash_position() + 1:]
+
+    def get_double_dash_view(self):
+        """Returns a read-only ArgumentsView of the arguments after the double dash `--` command line idiom.  The view
+        does not copy the arguments.
+
+        :returns: ArgumentsView
+        :raises: MissingArgumentError when the double dash idiom is not included in the command string"""
+
+        return ArgumentsView(self.arguments, self.arguments.get_double_dash_position() + 1)
+
+    def get_pre_double_dash_view(self):
+        """Returns a read-only ArgumentsView of the arguments before the double dash `--` command line idiom.  The view
+        does not copy the arguments.  All arguments are included in the view when the command string does not include
+        the double dash idiom.
+
+        :returns: ArgumentsView"""
+
+        double_dash = self.arguments._get_double_dash()
+        if double_dash < 0:
+            return ArgumentsView(self.arguments)
+        return ArgumentsView(self.arguments, 0, double_dash)
 
     # /////////////////////////////////////////////////////////////
     #
     #  Default parsing methods for commonly used options/switches
     #    - Includes support for POSIX / Gnu standard options
+    #    - Short / long option alternatives are resolved with the
+    #      commandlines.aliases.STANDARD_ALIASES registry
+    #    - The tests are bit tests of the parsed flags word
     #
     # /////////////////////////////////////////////////////////////
 
@@ -389,50 +812,46 @@ class Command(object):
 
         :returns: boolean. True = included help option. False = did not include help option."""
 
-        if "help" in self.switches or "h" in self.switches:
-            return True
-        else:
-            return False
+        return (self.flags & FLAG_HELP) != 0
 
     def is_quiet_request(self):
         """Tests for `--quiet` option in command string
 
         :returns: boolean. True = included quiet option.  False = did not include quiet option."""
 
-        if "quiet" in self.switches:
-            return True
-        else:
-            return False
+        return (self.flags & FLAG_QUIET) != 0
 
     def is_usage_request(self):
         """Tests for `--usage` option in command string
 
         :returns: boolean. True = included usage option. False = did not include usage option."""
 
-        if "usage" in self.switches:
-            return True
-        else:
-            return False
+        return (self.flags & FLAG_USAGE) != 0
 
     def is_verbose_request(self):
         """Tests for `--verbose` option in command string
 
         :returns: boolean. True = included verbose option. False = did not include verbose option."""
 
-        if "verbose" in self.switches:
-            return True
-        else:
-            return False
+        return (self.flags & FLAG_VERBOSE) != 0
 
     def is_version_request(self):
         """Tests for `-v` and `--version` options in command string.
 
         :returns: boolean. True = included version option. False = did not include version option."""
 
-        if "version" in self.switches or "v" in self.switches:
-            return True
-        else:
-            return False
+        return (self.flags & FLAG_VERSION) != 0
+
+    def matches_flags(self, required, excluded=0):
+        """Tests the flags word of the command string with a single mask comparison.  Use the `commandlines.flags`
+        FLAG_* bits or the `OptionFlags.mask()` method to define the masks (e.g. `c.matches_flags(FLAG_VERBOSE,
+        FLAG_QUIET)` tests for `--verbose` without `--quiet`).
+
+        :param required: (int) Flag bits of the switches that must be included in the command string
+        :param excluded: (int) Flag bits of the switches that must not be included in the command string
+        :returns: boolean"""
+
+        return (self.flags & (required | excluded)) == required
 
     # /////////////////////////////////////////////////////////////
     #
@@ -469,10 +888,228 @@ class Command(object):
 
         :returns: string"""
 
-        if the_string == "":
+        if len(the_string) == 0:
             return "''"
         else:
-            return "'" + the_string + "'"
+            return "'" + fsdecode(the_string) + "'"
+
+
+def _copy_multi_definitions(mdefs):
+    """Returns a dictionary with new argument lists from the immutable multiple definitions data in a ParseResult so
+    that Command objects that share a ParseResult do not share mutable state.  This is not intended for public use.
+
+    :param mdefs: (iterable) (option, tuple of arguments) pairs
+    :returns: dictionary with {key = option string : value = list of definition argument strings} mapping"""
+
+    multimap = {}
+    for key, values in mdefs:
+        multimap[key] = list(values)
+    return multimap
+
+
+def _collect(cmd):
+    """Returns the (token stream, switch set, mops set, definitions dictionary, multiple definitions dictionary, double
+    dash position) data of a single classification pass over the argument list of a Command object.  This is not
+    intended for public use.
+
+    :param cmd: (Command) The Command object
+    :returns: tuple"""
+
+    if cmd._spec is None:
+        tokens = tokenize(cmd.argv)
+    else:
+        tokens = cmd._spec.tokenize(cmd.argv)
+    alias_map = None if cmd._aliases is None else cmd._aliases.get_alias_map(cmd._bytes_mode)
+    return (tokens,) + collect(tokens, alias_map, cmd._bytes_mode)
+
+
+def _make_arguments(cmd):
+    """Returns the Arguments object for a lazy Command object.  The argument list is not parsed for the double dash
+    `--` position unless the Command object has already been parsed or uses an option specification (where a valued
+    option may consume a `--` argument).  This is not intended for public use.
+
+    :param cmd: (Command) The Command object
+    :returns: Arguments"""
+
+    if "_parsed" in cmd.__dict__:
+        return Arguments._from_parsed(cmd.argv, cmd._parsed.double_dash)
+    if "_collected" in cmd.__dict__ or cmd._spec is not None:
+        return Arguments._from_parsed(cmd.argv, cmd._collected[5])
+    return Arguments(cmd.argv)
+
+
+def _make_switches(cmd):
+    """Returns the Switches object for a lazy Command object.  This is not intended for public use."""
+
+    if "_parsed" in cmd.__dict__:
+        return Switches._from_parsed(cmd._parsed.switches)
+    return Switches._from_parsed(cmd._collected[1])
+
+
+def _make_mops(cmd):
+    """Returns the Mops object for a lazy Command object.  This is not intended for public use."""
+
+    if "_parsed" in cmd.__dict__:
+        return Mops._from_mask(cmd._parsed.mops, cmd._parsed.mops_other)
+    return Mops._from_parsed(cmd._collected[2])
+
+
+def _make_defs(cmd):
+    """Returns the Definitions object for a lazy Command object.  This is not intended for public use."""
+
+    if "_parsed" in cmd.__dict__:
+        return Definitions._from_parsed(cmd._parsed.defs)
+    return Definitions._from_parsed(cmd._collected[3])
+
+
+def _make_mdefs(cmd):
+    """Returns the MultiDefinitions object for a lazy Command object.  This is not intended for public use."""
+
+    if "_parsed" in cmd.__dict__:
+        return MultiDefinitions._from_parsed(_copy_multi_definitions(cmd._parsed.mdefs))
+    return MultiDefinitions._from_parsed(cmd._collected[4])
+
+
+def _has_mops(cmd):
+    """Returns boolean that indicates whether the command string includes multi-option short syntax characters without
+    building the Mops object.  This is not intended for public use."""
+
+    if "_parsed" in cmd.__dict__:
+        return cmd._parsed.mops != 0 or len(cmd._parsed.mops_other) > 0
+    return len(cmd._collected[2]) > 0
+
+
+def _make_events(cmd):
+    """Returns the TokenEvents record of a Command object.  The record of a Command object that does not share a
+    ParseResult is built from the token stream of the parse on first access.  This is not intended for public use.
+
+    :param cmd: (Command) The Command object
+    :returns: TokenEvents"""
+
+    if "_parsed" in cmd.__dict__:
+        return cmd._parsed.events
+    return make_events(cmd._collected[0],
+                       None if cmd._aliases is None else cmd._aliases.get_alias_map(cmd._bytes_mode))
+
+
+def _make_typed_cache(cmd):
+    """Returns the typed option value cache of a Command object.  Command objects that share a ParseResult share its
+    cache.  This is not intended for public use.
+
+    :param cmd: (Command) The Command object
+    :returns: dictionary"""
+
+    if "_parsed" in cmd.__dict__:
+        return cmd._parsed._typed
+    return {}
+
+
+def _convert_value(cache, key, value, converter):
+    """Returns the converted value of a definition argument from the typed value cache of a parse result.  The value
+    is converted and cached on a cache miss.  This is not intended for public use.
+
+    :raises: ValueError or TypeError from the converter"""
+
+    cache_key = (key, converter, value)
+    try:
+        return cache[cache_key]
+    except KeyError:
+        typed = cache[cache_key] = converter(value)
+        return typed
+
+
+def _convert_values(cache, key, values, converter):
+    """Returns a new list of the converted values of multiple definition arguments from the typed value cache of a
+    parse result.  The arguments are converted in a single `map` pass and cached on a cache miss.  This is not intended
+    for public use.
+
+    :raises: ValueError or TypeError from the converter"""
+
+    cache_key = (key, converter, tuple(values))
+    try:
+        return list(cache[cache_key])
+    except KeyError:
+        typed = cache[cache_key] = tuple(map(converter, values))
+        return list(typed)
+
+
+def _conversion_errors(key, values, converter):
+    """Returns the (option, argument, reason) tuples of the arguments that cannot be converted.  This is not intended
+    for public use."""
+
+    errors = []
+    for value in values:
+        try:
+            converter(value)
+        except (ValueError, TypeError) as e:
+            errors.append((key, value, str(e)))
+    return errors
+
+
+def _make_flags(cmd):
+    """Returns the flags word of the parsed switches of a Command object.  The standard option bits of a shared
+    ParseResult are computed at parse time.  This is not intended for public use.
+
+    :param cmd: (Command) The Command object
+    :returns: integer"""
+
+    if "_parsed" in cmd.__dict__:
+        if cmd._flags is None:
+            return cmd._parsed.flags
+        switches = cmd._parsed.switches
+    else:
+        switches = cmd._collected[1]
+    return (STANDARD_FLAGS if cmd._flags is None else cmd._flags).flags_of(switches, cmd._bytes_mode)
+
+
+# Command attributes that are deferred to first access in lazy mode (and, for the flags word, the token event record,
+# and the typed value cache, in all modes).  Each value is a function that is called with the Command instance as the
+# only argument and that returns the attribute value.  The option containers share a single tokenizer pass through the
+# `_collected` attribute, or the `_parsed` ParseResult of a cached parse or of `Command.from_parse_result()`.
+_DEFERRED_ATTRIBUTES = {
+    "_parsed": lambda cmd: ParseResult(cmd.argv, cmd._spec, cmd._aliases),
+    "_collected": lambda cmd: _collect(cmd),
+    "_events": lambda cmd: _make_events(cmd),
+    "_typed": lambda cmd: _make_typed_cache(cmd),
+    "flags": lambda cmd: _make_flags(cmd),
+    "arguments": lambda cmd: _make_arguments(cmd),
+    "switches": lambda cmd: _make_switches(cmd),
+    "mops": lambda cmd: _make_mops(cmd),
+    "defs": lambda cmd: _make_defs(cmd),
+    "mdefs": lambda cmd: _make_mdefs(cmd),
+    "arg0": lambda cmd: cmd.arguments.get_argument_for_commandobj(0),
+    "arg1": lambda cmd: cmd.arguments.get_argument_for_commandobj(1),
+    "arg2": lambda cmd: cmd.arguments.get_argument_for_commandobj(2),
+    "arg3": lambda cmd: cmd.arguments.get_argument_for_commandobj(3),
+    "arg4": lambda cmd: cmd.arguments.get_argument_for_commandobj(4),
+    "arglp": lambda cmd: cmd.arguments.get_argument_for_commandobj(cmd.argc - 1),
+    "subcmd": lambda cmd: cmd.arg0,
+    "subsubcmd": lambda cmd: cmd.arg1,
+    "has_args": lambda cmd: cmd.argc > 0,
+    "has_switches": lambda cmd: len(cmd.switches) > 0,
+    "has_mops": lambda cmd: _has_mops(cmd),
+    "has_defs": lambda cmd: len(cmd.defs) > 0,
+    "has_mdefs": lambda cmd: len(cmd.mdefs) > 0,
+}
+
+
+def _invalidates(method, *attributes):
+    """Returns a wrapper for a list or set method that modifies a container object in place.  The wrapper discards
+    the data that are cached in the `attributes` instance attributes (by setting them to None) before the method is
+    called.  This is not intended for public use.
+
+    :param method: The Python list or set method
+    :param attributes: (tuple) The names of the instance attributes that cache data derived from the container items
+    :returns: function"""
+
+    def wrapper(self, *args, **kwargs):
+        for attribute in attributes:
+            setattr(self, attribute, None)
+        return method(self, *args, **kwargs)
+
+    wrapper.__name__ = method.__name__
+    wrapper.__doc__ = method.__doc__
+    return wrapper
 
 
 class Arguments(list):
@@ -481,15 +1118,52 @@ class Arguments(list):
 
       The class is derived from the Python list type.
 
+      Argument position requests are served from an argument string : index positions mapping that is built on the first
+      position request and discarded when the list is modified.  The position of the double dash `--` idiom is
+      recorded by the Command object parse and is determined with a list search when it is not known (e.g. after the
+      list is modified).
+
       :param argv: A list of command line arguments that maintain the argument order that was entered on command line"""
     def __init__(self, argv):
         list.__init__(self, argv)
+        self._position_index = None
+        self._double_dash = None
+
+    # list methods that modify the argument list invalidate the argument position index and double dash position
+    append = _invalidates(list.append, "_position_index", "_double_dash")
+    extend = _invalidates(list.extend, "_position_index", "_double_dash")
+    insert = _invalidates(list.insert, "_position_index", "_double_dash")
+    pop = _invalidates(list.pop, "_position_index", "_double_dash")
+    remove = _invalidates(list.remove, "_position_index", "_double_dash")
+    reverse = _invalidates(list.reverse, "_position_index", "_double_dash")
+    sort = _invalidates(list.sort, "_position_index", "_double_dash")
+    __setitem__ = _invalidates(list.__setitem__, "_position_index", "_double_dash")
+    __delitem__ = _invalidates(list.__delitem__, "_position_index", "_double_dash")
+    __iadd__ = _invalidates(list.__iadd__, "_position_index", "_double_dash")
+    __imul__ = _invalidates(list.__imul__, "_position_index", "_double_dash")
+    if hasattr(list, "clear"):   # Python 3.3+
+        clear = _invalidates(list.clear, "_position_index", "_double_dash")
+
+    @classmethod
+    def _from_parsed(cls, argv, double_dash):
+        """Instantiates an Arguments object with the double dash `--` idiom position that was recorded when the
+        argument list was parsed.  This is not intended for public use.
+
+        :param argv: (list) A list of command line arguments
+        :param double_dash: (int) Index position of the double dash argument that ends option parsing, or -1
+        :returns: Arguments"""
+
+        obj = cls.__new__(cls)
+        list.__init__(obj, argv)
+        obj._position_index = None
+        obj._double_dash = double_dash
+        return obj
 
     def __repr__(self):
         argument_string = ""
         if len(self) > 0:
             for argument in self:
-                argument_string = argument_string + "'" + argument + "', "
+                argument_string = argument_string + "'" + fsdecode(argument) + "', "
         argument_string = argument_string.rstrip()
         argument_string = argument_string.rstrip(',')
 
@@ -499,7 +1173,7 @@ class Arguments(list):
         argument_string = ""
         if len(self) > 0:
             for argument in self:
-                argument_string = argument_string + "'" + argument + "', "
+                argument_string = argument_string + "'" + fsdecode(argument) + "', "
         argument_string = argument_string.rstrip()
         argument_string = argument_string.rstrip(',')
 
@@ -515,7 +1189,8 @@ class Arguments(list):
         if (len(self) > position) and (position >= 0):
             return self[position]
         else:
-            return ""   # intentionally set as empty string rather than raise exception for Command obj instantation
+            # intentionally set as empty string rather than raise exception for Command obj instantation
+            return b"" if is_bytes_argv(self) else ""
 
     def get_argument(self, position):
         """Returns an argument string by the argument list index position.
@@ -529,20 +1204,168 @@ class Arguments(list):
         else:
             raise IndexOutOfRangeError()
 
+    def find_argument(self, position, default=None):
+        """Returns an argument string by the argument list index position, or the `default` parameter value if the
+        index position falls outside of the list index range.  This is the non-raising alternative to the
+        `get_argument()` method.
+
+        :param position: (integer) The command line index position
+        :param default: The value that is returned when the index position is out of range
+        :returns: string or the `default` parameter value"""
+
+        if (len(self) > position) and (position >= 0):
+            return self[position]
+        else:
+            return default
+
     def get_arg_position(self, test_arg):
-        """Returns the index position of the `test_arg` parameter candidate argument string.  The argument string
-        should include the dashes at the beginning of the argument string that would be expected with use on the
-        command line.
+        """Returns the index position of the first occurrence of the `test_arg` parameter candidate argument string.
+        The argument string should include the dashes at the beginning of the argument string that would be expected
+        with use on the command line.
 
         :param test_arg: (string) The argument string for which the index position is requested
-        :returns: string
+        :returns: integer
         :raises: MissingArgumentError if the requested argument is not in the Argument list"""
 
-        if test_arg in self:
-            return self.index(test_arg)
-        else:
+        return self.get_arg_positions(test_arg)[0]
+
+    def find_arg_position(self, test_arg, default=None):
+        """Returns the index position of the first occurrence of the `test_arg` parameter candidate argument string, or
+        the `default` parameter value if the argument is not in the Argument list.  This is the non-raising
+        alternative to the `get_arg_position()` method.
+
+        :param test_arg: (string) The argument string for which the index position is requested
+        :param default: The value that is returned when the argument is not in the Argument list
+        :returns: integer or the `default` parameter value"""
+
+        positions = self.find_arg_positions(test_arg)
+        if positions is None:
+            return default
+        return positions[0]
+
+    def get_arg_positions(self, test_arg):
+        """Returns the index positions of all occurrences of the `test_arg` parameter candidate argument string in
+        ascending order.  The argument string should include the dashes at the beginning of the argument string that
+        would be expected with use on the command line.
+
+        :param test_arg: (string) The argument string for which the index positions are requested
+        :returns: tuple of integers
+        :raises: MissingArgumentError if the requested argument is not in the Argument list"""
+
+        index = self._position_index
+        if index is None:
+            index = self._make_position_index()
+        try:
+            return index[test_arg]
+        except KeyError:
             raise MissingArgumentError(test_arg)
 
+    def find_arg_positions(self, test_arg, default=None):
+        """Returns the index positions of all occurrences of the `test_arg` parameter candidate argument string in
+        ascending order, or the `default` parameter value if the argument is not in the Argument list.  This is the
+        non-raising alternative to the `get_arg_positions()` method.
+
+        :param test_arg: (string) The argument string for which the index positions are requested
+        :param default: The value that is returned when the argument is not in the Argument list
+        :returns: tuple of integers or the `default` parameter value"""
+
+        index = self._position_index
+        if index is None:
+            index = self._make_position_index()
+        return index.get(test_arg, default)
+
+    def get_nth_arg_position(self, test_arg, n):
+        """Returns the index position of the nth occurrence of the `test_arg` parameter candidate argument string where
+        n = 1 is the first occurrence.  The argument string should include the dashes at the beginning of the argument
+        string that would be expected with use on the command line.
+
+        :param test_arg: (string) The argument string for which the index position is requested
+        :param n: (integer) The occurrence number, beginning at 1
+        :returns: integer
+        :raises: MissingArgumentError if the requested argument is not in the Argument list
+        :raises: IndexOutOfRangeError if the argument occurs fewer than n times or n is less than 1"""
+
+        positions = self.get_arg_positions(test_arg)
+        if 0 < n <= len(positions):
+            return positions[n - 1]
+        else:
+            raise IndexOutOfRangeError()
+
+    def find_nth_arg_position(self, test_arg, n, default=None):
+        """Returns the index position of the nth occurrence of the `test_arg` parameter candidate argument string where
+        n = 1 is the first occurrence, or the `default` parameter value if the argument occurs fewer than n times.
+        This is the non-raising alternative to the `get_nth_arg_position()` method.
+
+        :param test_arg: (string) The argument string for which the index position is requested
+        :param n: (integer) The occurrence number, beginning at 1
+        :param default: The value that is returned when the argument occurs fewer than n times or n is less than 1
+        :returns: integer or the `default` parameter value"""
+
+        positions = self.find_arg_positions(test_arg, ())
+        if 0 < n <= len(positions):
+            return positions[n - 1]
+        else:
+            return default
+
+    def _make_position_index(self):
+        """Builds the argument string : index positions mapping that is used for argument position requests.  This is
+        not intended for public use.
+
+        :returns: dictionary with {key = argument string : value = tuple of index positions} mapping"""
+
+        positions = {}
+        position = 0
+        for argument in self:
+            if argument in positions:
+                positions[argument].append(position)
+            else:
+                positions[argument] = [position]
+            position += 1
+
+        index = {}
+        for argument in positions:
+            index[argument] = tuple(positions[argument])
+        self._position_index = index
+        return index
+
+    def get_double_dash_position(self):
+        """Returns the index position of the double dash `--` command line idiom that ends option parsing.
+
+        :returns: integer
+        :raises: MissingArgumentError if the double dash idiom is not in the Argument list"""
+
+        double_dash = self._get_double_dash()
+        if double_dash < 0:
+            raise MissingArgumentError("--")
+        return double_dash
+
+    def find_double_dash_position(self, default=None):
+        """Returns the index position of the double dash `--` command line idiom that ends option parsing, or the
+        `default` parameter value if the double dash idiom is not in the Argument list.  This is the non-raising
+        alternative to the `get_double_dash_position()` method.
+
+        :param default: The value that is returned when the double dash idiom is not in the Argument list
+        :returns: integer or the `default` parameter value"""
+
+        double_dash = self._get_double_dash()
+        if double_dash < 0:
+            return default
+        return double_dash
+
+    def _get_double_dash(self):
+        """Returns the index position of the double dash `--` idiom or -1.  This is not intended for public use.
+
+        :returns: integer"""
+
+        double_dash = self._double_dash
+        if double_dash is None:
+            try:
+                double_dash = list.index(self, b"--" if is_bytes_argv(self) else "--")
+            except ValueError:
+                double_dash = -1
+            self._double_dash = double_dash
+        return double_dash
+
     def get_arg_next(self, position):
         """Returns the next argument at index `position` + 1 in the command sequence.
 
@@ -555,6 +1378,20 @@ class Arguments(list):
         else:
             raise IndexOutOfRangeError()
 
+    def find_arg_next(self, position, default=None):
+        """Returns the next argument at index `position` + 1 in the command sequence, or the `default` parameter value
+        if the `position` + 1 index falls outside of the existing index range.  This is the non-raising alternative to
+        the `get_arg_next()` method.
+
+        :param position: (integer) The argument index position in the Argument list
+        :param default: The value that is returned when the next index position is out of range
+        :returns: string or the `default` parameter value"""
+
+        if len(self) > (position + 1):
+            return self[position + 1]
+        else:
+            return default
+
     def contains(self, needle):
         """Returns boolean that indicates the presence (True) or absence (False) of a tuple of one or more test
         arguments.
@@ -562,14 +1399,106 @@ class Arguments(list):
         :param needle: (iterable) An iterable that contains one or more test argument strings.
         :returns: boolean"""
 
+        index = self._position_index
+        if index is None:
+            index = self._make_position_index()
         for expected_argument in needle:
-            if expected_argument in self:
-                pass
-            else:
+            if expected_argument not in index:
                 return False
 
         return True  # if all tests above pass
 
+    def contains_any(self, needle):
+        """Returns boolean that indicates the presence (True) of at least one, or absence (False) of all, of a tuple of
+        test arguments.
+
+        :param needle: (iterable) An iterable that contains one or more test argument strings.
+        :returns: boolean"""
+
+        index = self._position_index
+        if index is None:
+            index = self._make_position_index()
+        for expected_argument in needle:
+            if expected_argument in index:
+                return True
+
+        return False
+
+
+class ArgumentsView(Sequence):
+    """A read-only sequence view of a contiguous range of an Arguments list that does not copy the arguments.  Views
+    are returned by the Command `get_double_dash_view()` and `get_pre_double_dash_view()` methods and can be passed
+    wherever a sequence of arguments is accepted (e.g. as the `args` of `subprocess.Popen`).
+
+    Views read the underlying Arguments list on each access.  Create a new view after the list is modified.
+
+    :param arguments: (Arguments) The argument list
+    :param start: (int) The index position of the first argument in the view
+    :param stop: (int) The index position after the last argument in the view, or None for the end of the list
+    """
+    __slots__ = ("_arguments", "_start", "_stop")
+
+    def __init__(self, arguments, start=0, stop=None):
+        self._arguments = arguments
+        self._start = start
+        self._stop = stop
+
+    def __len__(self):
+        return max(self._get_stop() - self._start, 0)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list.__getitem__(self._arguments, slice(self._start, self._get_stop()))[index]
+        length = self.__len__()
+        if index < 0:
+            index += length
+        if index < 0 or index >= length:
+            raise IndexError("ArgumentsView index out of range")
+        return list.__getitem__(self._arguments, self._start + index)
+
+    def __iter__(self):
+        return islice(self._arguments, self._start, self._get_stop())
+
+    def __contains__(self, argument):
+        return argument in islice(self._arguments, self._start, self._get_stop())
+
+    def __eq__(self, other):
+        if not isinstance(other, (list, tuple, ArgumentsView)):
+            return NotImplemented
+        if len(self) != len(other):
+            return False
+        for argument, other_argument in zip(self, other):
+            if argument != other_argument:
+                return False
+        return True
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        if equal is NotImplemented:
+            return equal
+        return not equal
+
+    __hash__ = None
+
+    def __repr__(self):
+        return "< ArgumentsView object > " + self.to_list().__repr__()
+
+    def __str__(self):
+        return "< ArgumentsView object > " + self.to_list().__str__()
+
+    def to_list(self):
+        """Returns a list copy of the arguments in the view.
+
+        :returns: list"""
+
+        return list.__getitem__(self._arguments, slice(self._start, self._get_stop()))
+
+    def _get_stop(self):
+        length = len(self._arguments)
+        if self._stop is None or self._stop > length:
+            return length
+        return self._stop
+
 
 class Switches(set):
     """A class that is instantiated with all command line switches that have the syntax `-s`, `--longswitch`,
@@ -582,11 +1511,23 @@ class Switches(set):
     def __init__(self, argv):
         set.__init__(self, self._make_switch_set(argv))
 
+    @classmethod
+    def _from_parsed(cls, switchset):
+        """Instantiates a Switches object from a set of switches that was previously parsed from the command string.
+        This is not intended for public use.
+
+        :param switchset: (set) Parsed switch strings
+        :returns: Switches"""
+
+        obj = cls.__new__(cls)
+        set.__init__(obj, switchset)
+        return obj
+
     def __repr__(self):
         switch_string = ""
         if len(self) > 0:
             for switch in self:
-                switch_string = switch_string + "'" + switch + "', "
+                switch_string = switch_string + "'" + fsdecode(switch) + "', "
             switch_string = switch_string.rstrip()
             switch_string = switch_string.rstrip(",")
 
@@ -596,7 +1537,7 @@ class Switches(set):
         switch_string = ""
         if len(self) > 0:
             for switch in self:
-                switch_string = switch_string + "'" + switch + "', "
+                switch_string = switch_string + "'" + fsdecode(switch) + "', "
             switch_string = switch_string.rstrip()
             switch_string = switch_string.rstrip(",")
 
@@ -609,17 +1550,7 @@ class Switches(set):
         :param argv: (list) A list of command line arguments that maintain the argument order that was entered on command line
         :returns: set"""
 
-        switchset = set()
-        for switch_candidate in argv:
-            if "-" in switch_candidate[0] and "=" not in switch_candidate:
-                # ignore everything after the double dash idiom, no longer considered switch context
-                if switch_candidate == "--":
-                    break
-                else:
-                    switch_candidate = switch_candidate.lstrip("-")
-                    switchset.add(switch_candidate)
-
-        return switchset
+        return scan_switches(argv)
 
     def contains(self, needle):
         """Returns boolean that indicates the presence (True) or absence (False) of a tuple of test switches.
@@ -629,13 +1560,7 @@ class Switches(set):
         :param needle: (iterable) An iterable that contains one or more test argument strings.
         :returns: boolean"""
 
-        for expected_argument in needle:
-            if expected_argument in self:
-                pass
-            else:
-                return False
-
-        return True  # if all tests above pass
+        return self.issuperset(needle)
 
 
 class Mops(set):
@@ -647,18 +1572,73 @@ class Mops(set):
     Each alphabetic character in the option token is parsed to a separate option token.
 
     The class is derived from the Python set type and the single character option switches are stored as set items.
+    Membership tests of precomputed needle masks with the `contains_mask()` method use a bitmask with one bit for each
+    ASCII letter and digit (see `commandlines.tokenizer.mops_mask`).  The bitmask is discarded when the set is modified.
 
     :param argv: (list) A list of command line arguments that maintain the argument order that was entered on command line
     """
 
     def __init__(self, argv):
         set.__init__(self, self._make_mops_set(argv))
+        self._mask = None
+
+    # set methods that modify the set invalidate the bitmask
+    add = _invalidates(set.add, "_mask")
+    clear = _invalidates(set.clear, "_mask")
+    discard = _invalidates(set.discard, "_mask")
+    pop = _invalidates(set.pop, "_mask")
+    remove = _invalidates(set.remove, "_mask")
+    update = _invalidates(set.update, "_mask")
+    difference_update = _invalidates(set.difference_update, "_mask")
+    intersection_update = _invalidates(set.intersection_update, "_mask")
+    symmetric_difference_update = _invalidates(set.symmetric_difference_update, "_mask")
+    __iand__ = _invalidates(set.__iand__, "_mask")
+    __ior__ = _invalidates(set.__ior__, "_mask")
+    __isub__ = _invalidates(set.__isub__, "_mask")
+    __ixor__ = _invalidates(set.__ixor__, "_mask")
+
+    @classmethod
+    def _from_parsed(cls, mopsset):
+        """Instantiates a Mops object from a set of option characters that was previously parsed from the command
+        string.  The bitmask is built on the first `contains()` request.  This is not intended for public use.
+
+        :param mopsset: (set) Parsed option characters
+        :returns: Mops"""
+
+        obj = cls.__new__(cls)
+        set.__init__(obj, mopsset)
+        obj._mask = None
+        return obj
+
+    @classmethod
+    def _from_mask(cls, mask, other):
+        """Instantiates a Mops object from the bitmask representation of option characters that were previously parsed
+        from the command string.  This is not intended for public use.
+
+        :param mask: (int) Bitmask of the ASCII letter and digit option characters
+        :param other: (frozenset) Option characters that are not represented in the bitmask
+        :returns: Mops"""
+
+        obj = cls.__new__(cls)
+        set.__init__(obj, mops_from_mask(mask))
+        if other:
+            set.update(obj, other)
+        obj._mask = (mask, other)
+        return obj
+
+    @property
+    def mask(self):
+        """The bitmask of the ASCII letter and digit option characters in the set.
+
+        :returns: int"""
+
+        return self._get_mask()[0]
 
     def __repr__(self):
         mops_string = ""
         if len(self) > 0:
             for switch in self:
-                mops_string = mops_string + "'" + switch + "', "
+                mops_string = mops_string + "'" + fsdecode(switch) + "', "
             mops_string = mops_string.rstrip()
             mops_string = mops_string.rstrip(",")
 
@@ -668,7 +1648,7 @@ class Mops(set):
         mops_string = ""
         if len(self) > 0:
             for switch in self:
-                mops_string = mops_string + "'" + switch + "', "
+                mops_string = mops_string + "'" + fsdecode(switch) + "', "
             mops_string = mops_string.rstrip()
             mops_string = mops_string.rstrip(",")
 
@@ -681,15 +1661,7 @@ class Mops(set):
         :param argv: (list) A list of command line arguments that maintain the argument order that was entered on command line
         :returns: set"""
 
-        mopsset = set()
-        for mops_candidate in argv:
-            if "-" in mops_candidate[0] and "=" not in mops_candidate:
-                if len(mops_candidate) > 2:  # the argument includes '-' and more than one character following dash
-                    if mops_candidate[1] != "-":  # it is not long option syntax (e.g. --long)
-                        mops_candidate = mops_candidate.replace("-", "")
-                        for switch in mops_candidate:
-                            mopsset.add(switch)
-        return mopsset
+        return scan_mops(argv)
 
     def contains(self, needle):
         """Returns boolean that indicates the presence (True) or absence (False) of a tuple of test Mops syntax option
@@ -699,13 +1671,28 @@ class Mops(set):
         :param needle: (iterable) An iterable that contains one or more test argument characters as strings.
         :returns: boolean"""
 
-        for expected_argument in needle:
-            if expected_argument in self:
-                pass
-            else:
-                return False
+        # a set lookup is faster than building the bitmask of the needle, precomputed needle masks are tested with
+        # the contains_mask() method
+        return self.issuperset(needle)
 
-        return True
+    def contains_mask(self, needle_mask):
+        """Returns boolean that indicates the presence (True) or absence (False) of all of the option characters in a
+        precomputed bitmask.  Create the bitmask with `commandlines.tokenizer.mops_mask`.
+
+        :param needle_mask: (int) Bitmask of the ASCII letter and digit test option characters
+        :returns: boolean"""
+
+        return (self._get_mask()[0] & needle_mask) == needle_mask
+
+    def _get_mask(self):
+        """Returns the (bitmask, fallback frozenset) representation of the set.  This is not intended for public use.
+
+        :returns: tuple of (int, frozenset)"""
+
+        mask = self._mask
+        if mask is None:
+            mask = self._mask = mops_mask(self)
+        return mask
 
 
 class Definitions(dict):
@@ -729,6 +1716,18 @@ class Definitions(dict):
     def __init__(self, argv):
         dict.__init__(self, self._make_definitions_obj(argv))
 
+    @classmethod
+    def _from_parsed(cls, defmap):
+        """Instantiates a Definitions (or MultiDefinitions) object from a dictionary that was previously parsed from
+        the command string.  This is not intended for public use.
+
+        :param defmap: (dict) Parsed {key = option string : value = definition argument} mapping
+        :returns: Definitions"""
+
+        obj = cls.__new__(cls)
+        dict.__init__(obj, defmap)
+        return obj
+
     def _make_definitions_obj(self, argv):
         """Parses definition options from a list of ordered command line arguments to define the dictionary that
         is used to instantiate the Definitions class.  Option string keys are stripped of dash characters before the
@@ -737,32 +1736,7 @@ class Definitions(dict):
         :param argv: (list) A list of command line arguments that maintain the argument order that was entered on command line
         :returns: dictionary with {key = option string : value = definition argument string} mapping"""
 
-        defmap = {}
-        arglist_length = len(argv)
-        counter = 0
-        for def_candidate in argv:
-            # performance improvement to eliminate multiple string testing calls within this loop
-            # dash_truth_test = def_candidate.startswith("-")
-            dash_truth_test = ("-" in def_candidate[0])
-            if dash_truth_test is True:
-                # ignore all definition syntax strings after the double dash `--` command line idiom
-                if def_candidate == "--":
-                    break
-                else:
-                    # defines -option=definition syntax
-                    if "=" in def_candidate:
-                        split_def = def_candidate.split("=")
-                        cleaned_key = split_def[0].lstrip("-")  # remove dash characters from the option
-                        defmap[cleaned_key] = split_def[1]
-                    # defines -d <positional def> or --define <positional def> syntax
-                    elif counter < (arglist_length - 1):
-                        if not argv[counter + 1].startswith("-"):
-                            def_candidate = def_candidate.lstrip("-")
-                            defmap[def_candidate] = argv[counter + 1]
-
-            counter += 1
-
-        return defmap
+        return scan_definitions(argv)
 
     def contains(self, needle):
         """Returns boolean that indicates the presence (True) or absence (False) of a tuple of option-argument
@@ -775,9 +1749,7 @@ class Definitions(dict):
         :returns: boolean"""
 
         for expected_definition in needle:
-            if expected_definition in self.keys():
-                pass
-            else:
+            if expected_definition not in self:
                 return False
 
         return True  # if all tests above pass returns True
@@ -791,11 +1763,22 @@ class Definitions(dict):
         :returns: string
         :raises: MissingDictionaryKeyError if the option needle is not a key defined in the Definitions object"""
 
-        if needle in self.keys():
+        try:
             return self[needle]
-        else:
+        except KeyError:
             raise MissingDictionaryKeyError(needle)
 
+    def find_def_argument(self, needle, default=None):
+        """Returns the definition argument string for a definition option test, or the `default` parameter value if
+        the option needle is not a key defined in the Definitions object.  This is the non-raising alternative to the
+        `get_def_argument()` method.
+
+        :param needle: (string) The requested option string from the definition option-argument pair.
+        :param default: The value that is returned when the option needle is not defined
+        :returns: string or the `default` parameter value"""
+
+        return self.get(needle, default)
+
 
 class MultiDefinitions(Definitions):
     """A class that is used to parse option-argument definitions from a command line argument list where command line
@@ -820,41 +1803,10 @@ class MultiDefinitions(Definitions):
         Definitions.__init__(self, argv)
 
     def _make_definitions_obj(self, argv):
-        defmap = {}
-        arglist_length = len(argv)
-        counter = 0
-        for def_candidate in argv:
-            # performance improvement to eliminate multiple string testing calls within this loop
-            # dash_truth_test = def_candidate.startswith("-")
-            dash_truth_test = ("-" in def_candidate[0])
-            if dash_truth_test is True:
-                # ignore all definition syntax strings after the double dash `--` command line idiom
-                if def_candidate == "--":
-                    break
-                else:
-                    # defines -option=definition syntax
-                    if "=" in def_candidate:
-                        split_def = def_candidate.split("=")
-                        cleaned_key = split_def[0].lstrip("-")  # remove dash characters from the option
-                        if cleaned_key in defmap.keys():
-                            defmap[cleaned_key].append(split_def[1])
-                        else:
-                            defmap[cleaned_key] = [split_def[1]]
-                    # defines -d <positional def> or --define <positional def> syntax
-                    elif counter < (arglist_length - 1):
-                        if not argv[counter + 1].startswith("-"):
-                            def_candidate = def_candidate.lstrip("-")
-                            if def_candidate in defmap.keys():
-                                defmap[def_candidate].append(argv[counter + 1])
-                            else:
-                                defmap[def_candidate] = [argv[counter + 1]]
-
-            counter += 1
-
-        # keep only the dictionary key:value pairs that include multiple values from key:value items parsed above
-        multi_map = {}
-        for key in defmap.keys():
-            if len(defmap[key]) > 1:
-                multi_map[key] = defmap[key]
-
-        return multi_map
+        """Parses multiple definition options from a list of ordered command line arguments to define the dictionary
+        that is used to instantiate the MultiDefinitions class.
+
+        :param argv: (list) A list of command line arguments that maintain the argument order that was entered on command line
+        :returns: dictionary with {key = option string : value = list of definition argument strings} mapping"""
+
+        return scan_definitions(argv, True)
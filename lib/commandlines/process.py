@@ -0,0 +1,264 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""The commandlines.process module contains the ProcessScanner class, a process table scanner that parses the
+`/proc/<pid>/cmdline` argument list of every process, and the ProcessTable and ProcessEntry objects that it returns.
+
+A ProcessScanner keeps the parse results of the previous scan keyed by the raw cmdline bytes.  Processes with command
+lines that are unchanged since the last scan (and processes with identical command lines, e.g. the workers of a
+server) share a single ParseResult and are not parsed again:
+
+    scanner = ProcessScanner()
+    needs_config = Query(definitions=("config",))
+    while True:
+        for entry in scanner.scan().filter(needs_config):
+            ...
+
+Use the `proc_root` parameter to scan a fake `/proc` directory tree in tests.
+"""
+
+import errno
+import os
+
+from commandlines.library import Command
+from commandlines.stream import split_argv
+from commandlines.tokenizer import ParseResult
+
+_READ_SIZE = 1 << 16   # bytes per cmdline read, most command lines are read with a single system call
+_SKIPPED_ERRNOS = frozenset((errno.ENOENT, errno.ESRCH, errno.EACCES, errno.EPERM))
+
+
+class ProcessScanner(object):
+    """Scans the `/proc/<pid>/cmdline` files of all processes and parses the command line arguments that follow the
+    executable.  Processes without a command line (e.g. kernel threads) and processes that exit or cannot be read
+    during the scan are not included in the returned ProcessTable.
+
+    Attributes:
+        proc_root : (string)
+                    The proc file system directory path
+        decode : (boolean)
+                 Command line arguments are decoded to strings
+        parsed : (int)
+                 Number of command lines that were parsed in the last scan
+        reused : (int)
+                 Number of processes that reused a parse result in the last scan
+
+    :param proc_root: (string) The proc file system directory path
+    :param spec: (CompiledSpec) Optional compiled `commandlines.spec.OptionSpec` that defines the parse
+    :param aliases: (OptionAliases) Optional `commandlines.aliases.OptionAliases` that canonicalizes option keys
+    :param decode: (boolean) Decode the command line arguments to strings.  Use False to parse the undecoded arguments
+                   in bytes mode (see `commandlines.tokenizer`).
+    """
+    def __init__(self, proc_root="/proc", spec=None, aliases=None, decode=True):
+        self.proc_root = proc_root
+        self.decode = decode
+        self.parsed = 0
+        self.reused = 0
+        self._spec = spec
+        self._aliases = aliases
+        self._results = {}   # raw cmdline bytes : (executable, ParseResult) from the last scan
+
+    def __repr__(self):
+        return "< ProcessScanner object > proc_root=" + self.proc_root
+
+    def __str__(self):
+        return "< ProcessScanner object > proc_root=" + self.proc_root
+
+    def scan(self):
+        """Reads and parses the command line of every process.
+
+        :returns: ProcessTable"""
+
+        previous = self._results
+        results = {}
+        entries = {}
+        parsed = 0
+        reused = 0
+        read_cmdline = self._read_cmdline
+        spec = self._spec
+        aliases = self._aliases
+        for name in os.listdir(self.proc_root):
+            if not name.isdigit():
+                continue
+            raw = read_cmdline(name)
+            if not raw:
+                continue
+            try:
+                executable, result = results[raw]
+            except KeyError:
+                try:
+                    executable, result = previous[raw]
+                except KeyError:
+                    argv = split_argv(raw, self.decode)
+                    executable = argv[0]
+                    result = ParseResult(argv[1:], spec, aliases)
+                    parsed += 1
+                else:
+                    reused += 1
+                results[raw] = (executable, result)
+            else:
+                reused += 1
+            pid = int(name)
+            entries[pid] = ProcessEntry(pid, executable, result, aliases, spec)
+
+        self._results = results   # results of processes that exited are released
+        self.parsed = parsed
+        self.reused = reused
+        return ProcessTable(entries, aliases if aliases is not None or spec is None else spec.aliases)
+
+    def _read_cmdline(self, name):
+        """Returns the raw cmdline bytes of a process, or None if the process exited or cannot be read.  This is not
+        intended for public use."""
+
+        try:
+            fd = os.open(os.path.join(self.proc_root, name, "cmdline"), os.O_RDONLY)
+        except OSError as e:
+            if e.errno in _SKIPPED_ERRNOS:
+                return None
+            raise
+        try:
+            chunks = []
+            while True:
+                chunk = os.read(fd, _READ_SIZE)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+        except OSError as e:
+            if e.errno in _SKIPPED_ERRNOS:
+                return None
+            raise
+        finally:
+            os.close(fd)
+        if len(chunks) == 1:
+            return chunks[0]
+        return b"".join(chunks)
+
+
+class ProcessEntry(object):
+    """A process in a ProcessTable.
+
+    Attributes:
+        pid : (int)
+              The process ID
+        executable : (string or bytes)
+                     The first argument of the process command line
+        result : (ParseResult)
+                 The parse result of the command line arguments that follow the executable
+
+    :param pid: (int) The process ID
+    :param executable: (string or bytes) The first argument of the process command line
+    :param result: (ParseResult) The parse result of the command line arguments that follow the executable
+    :param aliases: (OptionAliases) Optional `commandlines.aliases.OptionAliases` that was used to parse the result
+    :param spec: (CompiledSpec) Optional compiled `commandlines.spec.OptionSpec` that was used to parse the result
+    """
+    __slots__ = ("pid", "executable", "result", "_aliases", "_spec", "_command")
+
+    def __init__(self, pid, executable, result, aliases=None, spec=None):
+        self.pid = pid
+        self.executable = executable
+        self.result = result
+        self._aliases = aliases
+        self._spec = spec
+        self._command = None
+
+    def __repr__(self):
+        return "< ProcessEntry object > pid=" + str(self.pid) + " " + [self.executable].__str__() + \
+               list(self.result.argv).__str__()
+
+    def __str__(self):
+        return "< ProcessEntry object > pid=" + str(self.pid) + " " + [self.executable].__str__() + \
+               list(self.result.argv).__str__()
+
+    @property
+    def command(self):
+        """A lazy Command object for the command line arguments that follow the executable.  The Command object is
+        created on first access."""
+
+        if self._command is None:
+            self._command = Command.from_parse_result(self.result, lazy=True, spec=self._spec,
+                                                      aliases=self._aliases)
+        return self._command
+
+
+class ProcessTable(object):
+    """A queryable snapshot of the process command lines that is returned by `ProcessScanner.scan()`.  ProcessTable
+    objects are containers of ProcessEntry objects keyed by process ID.
+
+    The option needles of the `with_switch()` and `get_definitions()` methods accept any registered spelling of an
+    option when the scanner was instantiated with aliases or a spec.
+
+    :param entries: (dict) process ID : ProcessEntry mapping
+    :param aliases: (OptionAliases) Optional `commandlines.aliases.OptionAliases` that canonicalizes option needles
+    """
+    def __init__(self, entries, aliases=None):
+        self._entries = entries
+        self._aliases = aliases
+        self._definitions = {}   # id(ParseResult) : definitions dictionary, built on first get_definitions() call
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __iter__(self):
+        return iter(self._entries.values())
+
+    def __contains__(self, pid):
+        return pid in self._entries
+
+    def __getitem__(self, pid):
+        return self._entries[pid]
+
+    def __repr__(self):
+        return "< ProcessTable object > processes=" + str(len(self._entries))
+
+    def __str__(self):
+        return "< ProcessTable object > processes=" + str(len(self._entries))
+
+    def pids(self):
+        """Returns the sorted process IDs in the table.
+
+        :returns: list of int"""
+
+        return sorted(self._entries)
+
+    def filter(self, query):
+        """Returns the entries with command lines that match a `commandlines.query.Query`.
+
+        :param query: (Query) The query
+        :returns: list of ProcessEntry objects sorted by process ID"""
+
+        matches = query.matches
+        entries = self._entries
+        return [entries[pid] for pid in sorted(entries) if matches(entries[pid].command)]
+
+    def with_switch(self, switch):
+        """Returns the entries with command lines that include a switch.  The switch should not include the dashes
+        that are used at the beginning of the switch on the command line.
+
+        :param switch: (string) The switch
+        :returns: list of ProcessEntry objects sorted by process ID"""
+
+        if self._aliases is not None:
+            switch = self._aliases.canonical(switch)
+        entries = self._entries
+        return [entries[pid] for pid in sorted(entries) if switch in entries[pid].result.switches]
+
+    def get_definitions(self, option):
+        """Returns the definition argument of an option for each process that defines the option.  The option should
+        not include the dashes that are used at the beginning of the option on the command line.
+
+        :param option: (string) The definition option
+        :returns: dictionary of process ID : argument string"""
+
+        if self._aliases is not None:
+            option = self._aliases.canonical(option)
+        result_definitions = self._definitions   # processes with identical command lines share a ParseResult
+        definitions = {}
+        for pid, entry in self._entries.items():
+            result = entry.result
+            try:
+                defs = result_definitions[id(result)]   # the entries keep the results alive, ids are not reused
+            except KeyError:
+                defs = result_definitions[id(result)] = dict(result.defs)
+            if option in defs:
+                definitions[pid] = defs[option]
+        return definitions
@@ -0,0 +1,135 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""The commandlines.query module contains the Query class, a pre-compiled multi-needle membership test that can be
+evaluated against any number of Command objects.
+
+The needle sets are built once when the Query is instantiated and each evaluation is a set subset (all), intersection
+(any), or disjoint (none) operation against the parsed Command containers:
+
+    needs_output = Query(switches=("o", "output"), mode=ANY)
+    for c in commands:
+        if needs_output.matches(c):
+            ...
+"""
+
+from commandlines.tokenizer import mops_mask
+
+ALL = "all"
+ANY = "any"
+NONE = "none"
+
+
+class Query(object):
+    """A pre-compiled membership test for switches, multi-option short syntax characters, definition options, multiple
+    definition options, and positional arguments.  Option needles should not include the dashes that are used at the
+    beginning of the option on the command line.  Argument needles are full argument strings.
+
+    With the `all` mode a Command matches when every needle is present, with the `any` mode a Command matches when at
+    least one needle is present, and with the `none` mode a Command matches when no needle is present.
+
+    :param switches: (iterable) Switch needles
+    :param mops: (iterable) Multi-option short syntax character needles
+    :param definitions: (iterable) Definition option needles
+    :param multi_definitions: (iterable) Multiple definition option needles
+    :param arguments: (iterable) Positional argument needles
+    :param mode: (string) One of `commandlines.query.ALL`, `ANY`, or `NONE`
+    :param aliases: (OptionAliases) Optional `commandlines.aliases.OptionAliases` that canonicalizes the option needles.
+                    Use the registry that was used to parse the Command objects.
+    :raises: ValueError if the mode is not supported
+    """
+    def __init__(self, switches=(), mops=(), definitions=(), multi_definitions=(), arguments=(), mode=ALL,
+                 aliases=None):
+        if mode not in (ALL, ANY, NONE):
+            raise ValueError("unsupported Query mode '" + str(mode) + "'. Use 'all', 'any', or 'none'.")
+        if aliases is not None:
+            switches = aliases.canonicalize(switches)
+            definitions = aliases.canonicalize(definitions)
+            multi_definitions = aliases.canonicalize(multi_definitions)
+        self.mode = mode
+        self.switches = frozenset(switches)
+        self.mops = frozenset(mops)
+        self.definitions = frozenset(definitions)
+        self.multi_definitions = frozenset(multi_definitions)
+        self.arguments = frozenset(arguments)
+        self._mops_mask, self._mops_other = mops_mask(self.mops)
+
+    def __repr__(self):
+        return "< Query object > " + self._needle_string()
+
+    def __str__(self):
+        return "< Query object > " + self._needle_string()
+
+    def matches(self, command):
+        """Evaluates the query against a Command object.
+
+        :param command: (Command) The parsed Command object
+        :returns: boolean"""
+
+        if self.mode == ALL:
+            return self._matches_all(command)
+        elif self.mode == ANY:
+            return self._matches_any(command)
+        else:
+            return not self._matches_any(command)
+
+    def filter(self, commands):
+        """Returns the Command objects in an iterable of Command objects that match the query.
+
+        :param commands: (iterable) Parsed Command objects
+        :returns: list of Command objects"""
+
+        matches = self.matches
+        return [command for command in commands if matches(command)]
+
+    def _matches_all(self, command):
+        if self.switches and not self.switches.issubset(command.switches):
+            return False
+        if self._mops_mask and not command.mops.contains_mask(self._mops_mask):
+            return False
+        if self._mops_other and not self._mops_other.issubset(command.mops):
+            return False
+        if self.definitions and not command.defs.contains(self.definitions):
+            return False
+        if self.multi_definitions and not command.mdefs.contains(self.multi_definitions):
+            return False
+        if self.arguments and not command.arguments.contains(self.arguments):
+            return False
+        return True
+
+    def _matches_any(self, command):
+        if self.switches and not self.switches.isdisjoint(command.switches):
+            return True
+        if self._mops_mask and (command.mops.mask & self._mops_mask):
+            return True
+        if self._mops_other and not self._mops_other.isdisjoint(command.mops):
+            return True
+        if self.definitions and _contains_any(command.defs, self.definitions):
+            return True
+        if self.multi_definitions and _contains_any(command.mdefs, self.multi_definitions):
+            return True
+        if self.arguments and command.arguments.contains_any(self.arguments):
+            return True
+        return False
+
+    def _needle_string(self):
+        needle_string = "mode=" + self.mode
+        for name in ("switches", "mops", "definitions", "multi_definitions", "arguments"):
+            needles = getattr(self, name)
+            if needles:
+                needle_string = needle_string + " " + name + "=" + str(sorted(needles))
+        return needle_string
+
+
+def _contains_any(dictionary, needles):
+    """Returns boolean that indicates the presence of at least one needle key in a dictionary.  This is not intended
+    for public use.
+
+    :param dictionary: (dict) The dictionary
+    :param needles: (frozenset) The needle keys
+    :returns: boolean"""
+
+    for needle in needles:
+        if needle in dictionary:
+            return True
+    return False
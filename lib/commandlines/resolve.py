@@ -0,0 +1,159 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""The commandlines.resolve module contains the ResolvedOptions class, a merged option value map of the command line
+definitions, prefixed environment variables, an optional configuration file, and the Command defaults.
+
+The layers are merged once, in order of precedence (command line > environment > configuration > defaults), into a
+single dictionary and the source layer of each option is recorded.  Option lookups are a single dictionary lookup
+rather than a chain of getter calls and exception handlers:
+
+    c = Command()
+    c.set_defaults({"output": "stdout", "level": "1"})
+    options = c.resolve(env_prefix="MYAPP_", config="myapp.json")
+    output = options.get("output")
+    if options.source("level") == SOURCE_ENVIRONMENT:
+        ...
+
+Environment variable names are mapped to option names by the removal of the prefix, conversion to lowercase, and
+replacement of underscores with dashes (e.g. `MYAPP_OUTPUT_DIR` defines the `output-dir` option).  Configuration files
+are JSON files with a single object of option : value pairs.  Use a mapping for other configuration formats (e.g.
+`dict(parser.items("myapp"))` for a ConfigParser section).
+"""
+
+import os
+
+from commandlines.exceptions import MissingDictionaryKeyError
+from commandlines.tokenizer import fsdecode
+
+# Option value sources in order of precedence
+SOURCE_COMMAND_LINE = "command line"
+SOURCE_ENVIRONMENT = "environment"
+SOURCE_CONFIG = "config"
+SOURCE_DEFAULTS = "defaults"
+
+
+class ResolvedOptions(object):
+    """A merged option value map with the source of each option value.  The map is built once at instantiation.
+    Changes to the layer mappings after instantiation are not included.  Use `Command.resolve()` to create a
+    ResolvedOptions object for a Command object.
+
+    Attributes:
+        values : (dict)
+                 Mapping of option : resolved value
+        sources : (dict)
+                  Mapping of option : source of the resolved value (one of the SOURCE_* strings)
+
+    :param definitions: (dict) Command line option : definition argument mapping
+    :param env_prefix: (string) Environment variable name prefix.  Environment variables are not used when None.
+    :param config: (string or dict) Configuration file path or option : value mapping.  Optional.
+    :param defaults: (dict) Default option : value mapping.  Optional.
+    :param environ: (dict) Environment variable mapping.  Defaults to `os.environ`.
+    :param aliases: (OptionAliases) Optional `commandlines.aliases.OptionAliases` that canonicalizes the option names
+                    of every layer
+    """
+    def __init__(self, definitions, env_prefix=None, config=None, defaults=None, environ=None, aliases=None):
+        self._aliases = aliases
+        layers = []   # (source, mapping) in ascending order of precedence
+        if defaults:
+            layers.append((SOURCE_DEFAULTS, defaults))
+        if config is not None:
+            layers.append((SOURCE_CONFIG, _read_config(config)))
+        if env_prefix is not None:
+            layers.append((SOURCE_ENVIRONMENT, _environment_options(os.environ if environ is None else environ,
+                                                                    env_prefix)))
+        layers.append((SOURCE_COMMAND_LINE, definitions))
+
+        values = {}
+        sources = {}
+        for source, mapping in layers:
+            if aliases is not None:
+                canonical = aliases.canonical
+                mapping = dict((canonical(key), mapping[key]) for key in mapping)
+            values.update(mapping)
+            sources.update(dict.fromkeys(mapping, source))
+        self.values = values
+        self.sources = sources
+
+    def __contains__(self, option):
+        return self._canonical(option) in self.values
+
+    def __getitem__(self, option):
+        option = self._canonical(option)
+        try:
+            return self.values[option]
+        except KeyError:
+            raise MissingDictionaryKeyError(option)
+
+    def __iter__(self):
+        return iter(self.values)
+
+    def __len__(self):
+        return len(self.values)
+
+    def __repr__(self):
+        return "< ResolvedOptions object > " + self.values.__repr__()
+
+    def __str__(self):
+        return "< ResolvedOptions object > " + self.values.__str__()
+
+    def get(self, option, default=None):
+        """Returns the resolved value of an option, or the `default` parameter value if no layer defines the option.
+        The option should not include the dashes that are used at the beginning of the option on the command line.
+
+        :param option: (string) The option name
+        :param default: The value that is returned when the option is not defined
+        :returns: The resolved value or the `default` parameter value"""
+
+        if self._aliases is not None:
+            option = self._aliases.canonical(option)
+        return self.values.get(option, default)
+
+    def source(self, option, default=None):
+        """Returns the source of the resolved value of an option (`SOURCE_COMMAND_LINE`, `SOURCE_ENVIRONMENT`,
+        `SOURCE_CONFIG`, or `SOURCE_DEFAULTS`), or the `default` parameter value if no layer defines the option.
+
+        :param option: (string) The option name
+        :param default: The value that is returned when the option is not defined
+        :returns: string or the `default` parameter value"""
+
+        return self.sources.get(self._canonical(option), default)
+
+    def _canonical(self, option):
+        if self._aliases is None:
+            return option
+        return self._aliases.canonical(option)
+
+
+def _environment_options(environ, env_prefix):
+    """Returns the option : value mapping of the environment variables with a name prefix.  This is not intended for
+    public use.
+
+    :param environ: (dict) Environment variable mapping
+    :param env_prefix: (string) Environment variable name prefix
+    :returns: dictionary"""
+
+    start = len(env_prefix)
+    options = {}
+    for name in environ:
+        if name.startswith(env_prefix) and len(name) > start:
+            options[name[start:].lower().replace("_", "-")] = environ[name]
+    return options
+
+
+def _read_config(config):
+    """Returns the option : value mapping of a configuration file path or mapping.  This is not intended for public
+    use.
+
+    :param config: (string or dict) JSON configuration file path or option : value mapping
+    :returns: dictionary
+    :raises: ValueError if the configuration file does not define a JSON object"""
+
+    if hasattr(config, "keys"):
+        return config
+    import json   # deferred so that importing commandlines does not import json
+    with open(config, "r") as f:
+        options = json.load(f)
+    if not isinstance(options, dict):
+        raise ValueError("the configuration file '" + fsdecode(config) + "' does not define a JSON object")
+    return options
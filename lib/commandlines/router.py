@@ -0,0 +1,190 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""The commandlines.router module contains the Router class, a subcommand dispatcher that stores command sequences
+(e.g. `("remote", "add")`) in a trie.
+
+The longest registered command sequence at the beginning of an argument list is resolved in a single walk over the
+arguments, independent of the number of registered routes, and the handler of the route is called with the arguments
+that follow the command sequence:
+
+    router = Router()
+
+    @router.route("remote", "add")
+    def remote_add(argv):
+        c = Command.from_argv(argv)
+        ...
+
+    router.add_route(("remote",), list_remotes)
+    c = Command()
+    router.dispatch(c.arguments)
+"""
+
+from commandlines.exceptions import MissingArgumentError
+from commandlines.tokenizer import fsdecode, is_bytes_argv
+
+
+class Router(object):
+    """A trie of command sequence routes.  Routes are tuples of one or more positional argument strings that are
+    matched from index position 0 of the argument list.  Bytes mode argument lists are matched with the decoded
+    argument strings.
+
+    :param default: (callable) Optional handler that is called with the entire argument list when no route matches
+    """
+    def __init__(self, default=None):
+        self.default = default
+        self._root = _RouteNode()
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    def __contains__(self, route):
+        node = self._find_node(route)
+        return node is not None and node.route is not None
+
+    def __repr__(self):
+        return "< Router object > routes=" + str(self._count)
+
+    def __str__(self):
+        return "< Router object > routes=" + str(self._count)
+
+    def add_route(self, route, handler):
+        """Registers a command sequence route.
+
+        :param route: (tuple) The command sequence, e.g. `("remote", "add")`
+        :param handler: (callable) The handler that is called with the list of arguments that follow the command
+                        sequence
+        :returns: Router
+        :raises: ValueError if the route is empty or is already registered"""
+
+        route = tuple(route)
+        if len(route) == 0:
+            raise ValueError("a route must include at least one command")
+        node = self._root
+        for command in route:
+            child = node.children.get(command)
+            if child is None:
+                child = node.children[command] = _RouteNode()
+            node = child
+        if node.route is not None:
+            raise ValueError("the route " + str(list(route)) + " is already registered")
+        node.route = route
+        node.handler = handler
+        self._count += 1
+        return self
+
+    def route(self, *route):
+        """Returns a decorator that registers the decorated function as the handler of a command sequence route.
+
+        :param route: (tuple) The command sequence, e.g. `router.route("remote", "add")`
+        :returns: decorator function
+        :raises: ValueError if the route is empty or is already registered"""
+
+        def register(handler):
+            self.add_route(route, handler)
+            return handler
+        return register
+
+    def routes(self):
+        """Returns the registered routes.
+
+        :returns: list of tuples"""
+
+        routes = []
+        nodes = [self._root]
+        while nodes:
+            node = nodes.pop()
+            if node.route is not None:
+                routes.append(node.route)
+            nodes.extend(node.children.values())
+        return sorted(routes)
+
+    def resolve(self, argv):
+        """Returns the RouteMatch of the longest registered route at the beginning of an argument list, or None if no
+        route matches.  The argument list is walked once.
+
+        :param argv: (list) A list of command line arguments (e.g. `Command.arguments`) that does not include the
+                     executable
+        :returns: RouteMatch or None"""
+
+        decode = is_bytes_argv(argv)
+        node = self._root
+        match = None
+        depth = 0
+        for argument in argv:
+            node = node.children.get(fsdecode(argument) if decode else argument)
+            if node is None:
+                break
+            depth += 1
+            if node.route is not None:
+                match = node
+                match_depth = depth
+        if match is None:
+            return None
+        return RouteMatch(match.route, match.handler, list(argv[match_depth:]))
+
+    def dispatch(self, argv, *args, **kwargs):
+        """Calls the handler of the longest registered route at the beginning of an argument list with the list of
+        arguments that follow the route.  Additional positional and keyword arguments are passed to the handler.
+
+        :param argv: (list) A list of command line arguments (e.g. `Command.arguments`) that does not include the
+                     executable
+        :returns: The handler return value
+        :raises: MissingArgumentError if no route matches and the Router does not have a default handler"""
+
+        match = self.resolve(argv)
+        if match is not None:
+            return match.handler(match.arguments, *args, **kwargs)
+        if self.default is not None:
+            return self.default(list(argv), *args, **kwargs)
+        raise MissingArgumentError(argv[0] if len(argv) > 0 else "")
+
+    def _find_node(self, route):
+        node = self._root
+        for command in route:
+            node = node.children.get(command)
+            if node is None:
+                return None
+        return node
+
+
+class RouteMatch(object):
+    """A resolved route that is returned by `Router.resolve()`.
+
+    Attributes:
+        route : (tuple)
+                The matched command sequence
+        handler : (callable)
+                  The route handler
+        arguments : (list)
+                    The arguments that follow the command sequence
+
+    :param route: (tuple) The matched command sequence
+    :param handler: (callable) The route handler
+    :param arguments: (list) The arguments that follow the command sequence
+    """
+    __slots__ = ("route", "handler", "arguments")
+
+    def __init__(self, route, handler, arguments):
+        self.route = route
+        self.handler = handler
+        self.arguments = arguments
+
+    def __repr__(self):
+        return "< RouteMatch object > route=" + list(self.route).__str__() + " arguments=" + \
+               [fsdecode(argument) for argument in self.arguments].__str__()
+
+    def __str__(self):
+        return "< RouteMatch object > route=" + list(self.route).__str__() + " arguments=" + \
+               [fsdecode(argument) for argument in self.arguments].__str__()
+
+
+class _RouteNode(object):
+    """A route trie node.  This is not intended for public use."""
+    __slots__ = ("children", "route", "handler")
+
+    def __init__(self):
+        self.children = {}
+        self.route = None
+        self.handler = None
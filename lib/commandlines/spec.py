@@ -0,0 +1,220 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""The commandlines.spec module contains the OptionSpec and CompiledSpec classes.  These objects support an optional
+declarative specification of the flags, valued options, and repeatable options that an application accepts.
+
+By default, the Command object parses options heuristically (e.g. `-o value` is parsed as both a switch and a
+definition because the token after the option does not begin with a dash).  A compiled specification replaces the
+heuristics with a dispatch table that is built once and drives a single deterministic pass over the argument list:
+
+    spec = OptionSpec()
+    spec.add_flag("verbose", "v")
+    spec.add_option("output", "o")
+    spec.add_repeatable_option("include", "I")
+    compiled_spec = spec.compile()
+
+    c = Command.from_argv(argv, spec=compiled_spec)
+
+The first name of a declaration is the canonical option name that is used as the key in the Command switches,
+definitions, and multiple definitions containers.  Any additional names are aliases that are also accepted by the
+Command option methods (e.g. `c.get_definition("o")`).  Names are declared without dashes.  Single character names match the `-n` syntax and longer names match the `--name` and `-name` syntax.
+"""
+
+from commandlines.aliases import OptionAliases
+from commandlines.convert import get_converter
+from commandlines.tokenizer import TOKEN_SWITCH, TOKEN_MOPS, TOKEN_DEFINITION, TOKEN_DOUBLE_DASH, TOKEN_REPEATABLE, \
+    fsencode, is_bytes_argv
+
+
+class OptionSpec(object):
+    """A declarative specification of command line options.  Declaration methods return the OptionSpec so that calls
+    can be chained.  Use the `compile()` method to create the CompiledSpec that is passed to the Command object.
+
+    Attributes:
+        flags : (list)
+                Tuples of option names for options that do not take an argument
+        options : (list)
+                  Tuples of option names for options that take a single argument
+        repeatable_options : (list)
+                             Tuples of option names for options that take an argument and may be used more than once
+        types : (dict)
+                Mapping of option name : converter for typed options
+    """
+    def __init__(self):
+        self.flags = []
+        self.options = []
+        self.repeatable_options = []
+        self.types = {}
+
+    def add_flag(self, *names):
+        """Declares an option that does not take an argument (e.g. `-v` or `--verbose`).  Flags are parsed to the
+        Command switches container.
+
+        :param names: (tuple) The canonical option name followed by any alias names, without dashes
+        :returns: OptionSpec"""
+
+        self.flags.append(self._validate_names(names))
+        return self
+
+    def add_option(self, *names):
+        """Declares an option that takes a single argument with the `-o value`, `--output value`, or `--output=value`
+        syntax.  The token that follows the option is always consumed as the argument.  Options are parsed to the
+        Command definitions container.
+
+        :param names: (tuple) The canonical option name followed by any alias names, without dashes
+        :returns: OptionSpec"""
+
+        self.options.append(self._validate_names(names))
+        return self
+
+    def add_repeatable_option(self, *names):
+        """Declares an option that takes an argument and may be used more than once (e.g. `-I dir1 -I dir2`).  All
+        arguments are parsed to the Command multiple definitions container, even when the option is used once.  The
+        last argument is parsed to the Command definitions container.
+
+        :param names: (tuple) The canonical option name followed by any alias names, without dashes
+        :returns: OptionSpec"""
+
+        self.repeatable_options.append(self._validate_names(names))
+        return self
+
+    def set_type(self, name, converter):
+        """Declares the type of an option or repeatable option.  The definition arguments of a typed option are converted
+        on first access with the `Command.get_typed_definition()`, `Command.get_typed_multiple_definitions()`, and
+        `Command.convert_definitions()` methods.
+
+        :param name: (string) Any declared name of the option, without dashes
+        :param converter: (string or callable) A converter name in the `commandlines.convert.CONVERTERS` dictionary
+                          (`int`, `float`, `bool`, `duration`, or `path`) or a callable that takes the argument string
+                          and raises ValueError or TypeError for an invalid argument
+        :returns: OptionSpec
+        :raises: ValueError if the converter is not supported"""
+
+        self.types[name] = get_converter(converter)
+        return self
+
+    def compile(self):
+        """Compiles the specification to a dispatch table.
+
+        :returns: CompiledSpec
+        :raises: ValueError if an option name is declared more than once or a type is set for a name that is not a
+                 declared option or repeatable option"""
+
+        return CompiledSpec(self)
+
+    def _validate_names(self, names):
+        if len(names) == 0:
+            raise ValueError("at least one option name is required")
+        for name in names:
+            if len(name) == 0 or name.startswith("-") or "=" in name:
+                raise ValueError("invalid option name '" + name + "'. Declare option names without dashes.")
+        return tuple(names)
+
+
+class CompiledSpec(object):
+    """A compiled OptionSpec.  The dispatch table maps every command line spelling of every declared option name
+    (e.g. `-o`, `--output`, `-output`) to the token kind and the canonical option name.  CompiledSpec objects are not
+    modified after they are created and can be shared across Command objects.
+
+    Attributes:
+        aliases : (OptionAliases)
+                  Registry of every declared option name : canonical option name.  Bytes mode names are included.
+        converters : (dict)
+                     Mapping of canonical option name : converter for typed options.  Bytes mode canonical names are
+                     included.
+
+    :param spec: (OptionSpec) The option specification
+    :raises: ValueError if an option name is declared more than once or a type is set for a name that is not a
+             declared option or repeatable option
+    """
+    def __init__(self, spec):
+        table = {}
+        for declarations, kind in ((spec.flags, TOKEN_SWITCH),
+                                   (spec.options, TOKEN_DEFINITION),
+                                   (spec.repeatable_options, TOKEN_DEFINITION | TOKEN_REPEATABLE)):
+            for names in declarations:
+                canonical = names[0]
+                for name in names:
+                    if len(name) == 1:
+                        spellings = ("-" + name,)
+                    else:
+                        spellings = ("--" + name, "-" + name)
+                    for spelling in spellings:
+                        if spelling in table:
+                            raise ValueError("the option name '" + name + "' is declared more than once")
+                        table[spelling] = (kind, canonical)
+        self._table = table
+        groups = spec.flags + spec.options + spec.repeatable_options
+        self.aliases = OptionAliases(*groups)
+        canonical_names = dict((name, names[0]) for names in spec.options + spec.repeatable_options for name in names)
+        converters = {}
+        for name, converter in spec.types.items():
+            if name not in canonical_names:
+                raise ValueError("the type of '" + name + "' is set but it is not a declared option")
+            canonical = canonical_names[name]
+            converters[canonical] = converter
+            converters[fsencode(canonical)] = converter
+        self.converters = converters
+        # dispatch table for bytes mode argument lists
+        self._bytes_table = dict((fsencode(spelling), (kind, fsencode(canonical)))
+                                 for spelling, (kind, canonical) in table.items())
+
+    def __contains__(self, token):
+        return token in self._table
+
+    def tokenize(self, argv):
+        """Classifies the command line arguments in `argv` with the dispatch table in a single pass and returns a token
+        stream in the `commandlines.tokenizer.tokenize` format.
+
+        Declared flags are switches and declared options consume the next token as the argument.  Undeclared options
+        are parsed as switches, with the exception of the unambiguous `--name=value` definition syntax.  Undeclared
+        single dash tokens with more than one character (e.g. `-rnj`) are parsed as multi-option short syntax.
+        Parsing of options ends at the double dash `--` idiom, and the `-` token is a positional argument.  Bytes mode
+        argument lists are classified with a bytes copy of the dispatch table.
+
+        :param argv: (list) A list of command line arguments that maintain the argument order that was entered on command line
+        :returns: list of (int, string, string, int, int) tuples"""
+
+        if is_bytes_argv(argv):
+            dash, double_dash, equals, empty, table = b"-", b"--", b"=", b"", self._bytes_table
+        else:
+            dash, double_dash, equals, empty, table = "-", "--", "=", "", self._table
+        tokens = []
+        append = tokens.append
+        argc = len(argv)
+        position = 0
+        while position < argc:
+            token_position = position
+            token = argv[position]
+            position += 1
+            if token[:1] != dash or token == dash:
+                continue
+            if token == double_dash:
+                append((TOKEN_DOUBLE_DASH, empty, None, token_position, -1))
+                break
+            entry = table.get(token)
+            if entry is not None:
+                kind, key = entry
+                if kind & TOKEN_DEFINITION:
+                    if position < argc:
+                        append((kind, key, argv[position], token_position, position))
+                        position += 1
+                    else:
+                        append((TOKEN_SWITCH, key, None, token_position, -1))   # the option argument is missing
+                else:
+                    append((kind, key, None, token_position, -1))
+            elif equals in token:
+                name, value = token.split(equals, 1)
+                entry = table.get(name)
+                if entry is None:
+                    append((TOKEN_DEFINITION, name.lstrip(dash), value, token_position, token_position))
+                else:
+                    append(((entry[0] & TOKEN_REPEATABLE) | TOKEN_DEFINITION, entry[1], value, token_position,
+                            token_position))
+            elif len(token) > 2 and token[1:2] != dash:
+                append((TOKEN_MOPS, token[1:], None, token_position, -1))
+            else:
+                append((TOKEN_SWITCH, token.lstrip(dash), None, token_position, -1))
+
+        return tokens
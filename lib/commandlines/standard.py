@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""The commandlines.standard module contains fast path tests for the POSIX / GNU standard options that end a program
+early (`-h` / `--help`, `-v` / `--version`, and `--usage`).
+
+The tests scan the argument list for the standard option switches and stop at the double dash `--` idiom or at the
+first match.  No Command object or option containers are built, which minimizes the start up cost of a script that
+prints help or version text and exits:
+
+    request = get_standard_request()
+    if request == "version":
+        print(VERSION)
+        sys.exit(0)
+    c = Command()
+    ...
+
+A standard option is recognized with the same switch syntax as the Command `is_*_request()` methods.  The tests do
+not use an OptionSpec or a user OptionAliases registry.
+
+This module does not import the Command object or the tokenizer, so a script that exits early does not pay their
+import cost.
+"""
+
+import sys
+
+from commandlines.aliases import STANDARD_ALIASES
+
+_BYTES_MODE_SUPPORTED = bytes is not str   # the `commandlines.tokenizer.is_bytes_argv` test
+
+# Canonical names of the standard options that are tested by default
+STANDARD_REQUESTS = ("help", "version", "usage")
+
+_lookups = {}   # (requests, bytes mode) : option name lookup dictionary
+
+
+def _get_lookup(requests, bytes_mode):
+    """Returns the option name : canonical option name mapping for every spelling of the requested standard options.
+    The mappings are built once per requests tuple.  This is not intended for public use.
+
+    :param requests: (tuple) Canonical standard option names
+    :param bytes_mode: (boolean) Use bytes option names
+    :returns: dictionary"""
+
+    try:
+        return _lookups[(requests, bytes_mode)]
+    except KeyError:
+        lookup = dict((name, canonical) for name, canonical in STANDARD_ALIASES.alias_map.items()
+                      if canonical in requests)
+        for canonical in requests:
+            lookup[canonical] = canonical
+        if bytes_mode:
+            # the standard option names are ASCII strings
+            lookup = dict((name.encode("ascii"), canonical) for name, canonical in lookup.items())
+        _lookups[(requests, bytes_mode)] = lookup
+        return lookup
+
+
+def get_standard_request(argv=None, requests=STANDARD_REQUESTS):
+    """Returns the canonical name of the first standard option switch in a command line argument list, or None if the
+    argument list does not include one of the requested standard options before the double dash `--` idiom.
+
+    :param argv: (list) A list of command line arguments that does not include the executable.  Defaults to
+                 `sys.argv[1:]`.
+    :param requests: (tuple) Canonical names of the standard options that are tested (e.g. `("version",)`).  Short
+                     spellings in the `commandlines.aliases.STANDARD_ALIASES` registry are recognized.
+    :returns: string or None"""
+
+    if argv is None:
+        argv = sys.argv[1:]
+    if _BYTES_MODE_SUPPORTED and len(argv) > 0 and type(argv[0]) is bytes:
+        lookup = _get_lookup(requests, True)
+        dash, double_dash, equals = b"-", b"--", b"="
+    else:
+        lookup = _get_lookup(requests, False)
+        dash, double_dash, equals = "-", "--", "="
+    for token in argv:
+        if token[:1] == dash:
+            if token == double_dash:
+                return None
+            canonical = lookup.get(token.lstrip(dash))
+            if canonical is not None and equals not in token:
+                return canonical
+    return None
+
+
+def is_help_request(argv=None):
+    """Tests for `-h` and `--help` options in a command line argument list without parsing the argument list.
+
+    :param argv: (list) A list of command line arguments.  Defaults to `sys.argv[1:]`.
+    :returns: boolean"""
+
+    return get_standard_request(argv, ("help",)) is not None
+
+
+def is_usage_request(argv=None):
+    """Tests for the `--usage` option in a command line argument list without parsing the argument list.
+
+    :param argv: (list) A list of command line arguments.  Defaults to `sys.argv[1:]`.
+    :returns: boolean"""
+
+    return get_standard_request(argv, ("usage",)) is not None
+
+
+def is_version_request(argv=None):
+    """Tests for `-v` and `--version` options in a command line argument list without parsing the argument list.
+
+    :param argv: (list) A list of command line arguments.  Defaults to `sys.argv[1:]`.
+    :returns: boolean"""
+
+    return get_standard_request(argv, ("version",)) is not None
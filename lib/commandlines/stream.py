@@ -0,0 +1,174 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""The commandlines.stream module contains generators that read NUL delimited command line argument data (e.g.
+`/proc/<pid>/cmdline` files, `find -print0` output, and `xargs -0` spools) from a file path, file descriptor, or binary
+file object.
+
+The data are read in large chunks and split with the bytes `split` method.  Python code runs once per record and
+once per chunk, not once per byte.  Memory use is bounded by the chunk size and the length of the longest record:
+
+    for result in parse_stream("commands.spool", b"\n"):
+        c = Command.from_parse_result(result)
+        ...
+
+The argument list readers do not assume a record format.  The caller chooses the `record_delimiter` for the source:
+
+- `None`: the entire source is a single argument list of NUL terminated arguments (e.g. a `/proc/<pid>/cmdline` file).
+  Arguments may include any byte other than NUL.
+- a single byte (e.g. `b"\n"`): each record is a list of NUL terminated arguments that ends with the delimiter byte.
+  The delimiter byte must not occur inside an argument.  A newline delimiter splits arguments that include a newline
+  (e.g. the script of a multi-line `sh -c` command) and is not safe for arbitrary `/proc/<pid>/cmdline` data.
+
+Use `iter_records()` with the default NUL delimiter to read each argument of `find -print0` output or an `xargs -0`
+spool.
+"""
+
+import os
+
+from commandlines.tokenizer import ParseResult, fsdecode
+
+DEFAULT_CHUNKSIZE = 1 << 20   # bytes per read
+
+
+def iter_records(source, delimiter=b"\0", chunksize=DEFAULT_CHUNKSIZE):
+    """Reads a file path, file descriptor, or binary file object in chunks and yields the byte string records that
+    are separated by a single byte delimiter.  A delimiter at the end of the data does not create an empty final
+    record.
+
+    :param source: (string, int, or file) A file path, an open file descriptor, or a binary file object.  File paths
+                   are opened and closed by the generator.  File descriptors and file objects are not closed.
+    :param delimiter: (bytes) The single byte record delimiter
+    :param chunksize: (int) Number of bytes per read
+    :returns: generator of bytes
+    :raises: ValueError if the delimiter is not a single byte or chunksize is less than one"""
+
+    if len(delimiter) != 1:
+        raise ValueError("the record delimiter must be a single byte")
+    if chunksize < 1:
+        raise ValueError("chunksize must be greater than zero")
+    return _split_chunks(_iter_chunks(source, chunksize), delimiter)
+
+
+def iter_argv(source, record_delimiter, chunksize=DEFAULT_CHUNKSIZE, decode=True):
+    """Yields the command line argument list in each record of NUL delimited arguments.  The NUL byte that terminates
+    the last argument of a record is optional.
+
+    :param source: (string, int, or file) A file path, an open file descriptor, or a binary file object
+    :param record_delimiter: (bytes) The single byte argument list delimiter, or None if the entire source is one
+                             argument list.  The delimiter byte must not occur inside an argument.
+    :param chunksize: (int) Number of bytes per read
+    :param decode: (boolean) Decode the arguments to strings with the file system encoding and the `surrogateescape`
+                   error handler, as Python does for `sys.argv`.  Use False to yield lists of bytes.
+    :returns: generator of lists"""
+
+    if record_delimiter is None:
+        records = _iter_whole(source, chunksize)
+    else:
+        records = iter_records(source, record_delimiter, chunksize)
+    for record in records:
+        yield split_argv(record, decode)
+
+
+def parse_stream(source, record_delimiter, chunksize=DEFAULT_CHUNKSIZE, executable=True, cache=None, spec=None,
+                 aliases=None, decode=True):
+    """Yields a `commandlines.tokenizer.ParseResult` for each record of NUL delimited arguments.  Use
+    `Command.from_parse_result()` to create a Command object from a result.
+
+    :param source: (string, int, or file) A file path, an open file descriptor, or a binary file object
+    :param record_delimiter: (bytes) The single byte argument list delimiter, or None if the entire source is one
+                             argument list.  The delimiter byte must not occur inside an argument.
+    :param chunksize: (int) Number of bytes per read
+    :param executable: (boolean) The first argument of each record is the executable (as in `/proc/<pid>/cmdline`) and
+                       is not parsed (i.e. the equivalent of `sys.argv[1:]` is parsed)
+    :param cache: (ParseCache) Optional `commandlines.cache.ParseCache` that is used to share parse results for
+                  repeated records
+    :param spec: (CompiledSpec) Optional compiled `commandlines.spec.OptionSpec` that defines the parse
+    :param aliases: (OptionAliases) Optional `commandlines.aliases.OptionAliases` that canonicalizes option keys
+    :param decode: (boolean) Decode the arguments to strings.  Use False to parse the undecoded arguments in bytes mode
+                   (see `commandlines.tokenizer`).
+    :returns: generator of ParseResult objects"""
+
+    for argv in iter_argv(source, record_delimiter, chunksize, decode):
+        if executable:
+            argv = argv[1:]
+        if cache is None:
+            yield ParseResult(argv, spec, aliases)
+        else:
+            yield cache.parse(argv, spec, aliases)
+
+
+def read_argv(path, decode=True):
+    """Reads a single NUL delimited argument list file (e.g. `/proc/<pid>/cmdline`).  The returned list includes the
+    executable.
+
+    :param path: (string) The file path
+    :param decode: (boolean) Decode the arguments to strings with the file system encoding and the `surrogateescape`
+                   error handler.  Use False to return a list of bytes.
+    :returns: list"""
+
+    for argv in iter_argv(path, None, DEFAULT_CHUNKSIZE, decode):
+        return argv
+
+
+def split_argv(data, decode=True):
+    """Splits a byte string of NUL delimited arguments (e.g. the contents of a `/proc/<pid>/cmdline` file) to an
+    argument list.  The NUL byte that terminates the last argument is optional.
+
+    :param data: (bytes) The NUL delimited arguments
+    :param decode: (boolean) Decode the arguments to strings with the file system encoding and the `surrogateescape`
+                   error handler.  Use False to return a list of bytes.
+    :returns: list"""
+
+    if decode:
+        arguments = fsdecode(data).split("\0")
+    else:
+        arguments = data.split(b"\0")
+    if not arguments[-1]:
+        arguments.pop()   # NUL terminator of the last argument, or empty data
+    return arguments
+
+
+def _iter_chunks(source, chunksize):
+    """Yields the byte string chunks of a file path, file descriptor, or binary file object.  This is not intended for
+    public use."""
+
+    if isinstance(source, int):
+        read = os.read
+        chunk = read(source, chunksize)
+        while chunk:
+            yield chunk
+            chunk = read(source, chunksize)
+    elif hasattr(source, "read"):
+        read = getattr(source, "buffer", source).read   # text file objects are read from the binary buffer
+        chunk = read(chunksize)
+        while chunk:
+            yield chunk
+            chunk = read(chunksize)
+    else:
+        with open(source, "rb") as f:
+            for chunk in _iter_chunks(f, chunksize):
+                yield chunk
+
+
+def _iter_whole(source, chunksize):
+    yield b"".join(_iter_chunks(source, chunksize))
+
+
+def _split_chunks(chunks, delimiter):
+    partial = []   # pieces of a record that spans chunks
+    for chunk in chunks:
+        if delimiter not in chunk:
+            partial.append(chunk)
+            continue
+        records = chunk.split(delimiter)
+        if partial:
+            partial.append(records[0])
+            records[0] = b"".join(partial)
+        partial = [records.pop()]
+        for record in records:
+            yield record
+    if partial:
+        record = b"".join(partial)
+        if record:
+            yield record
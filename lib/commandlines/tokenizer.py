@@ -0,0 +1,719 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""The commandlines.tokenizer module contains the single pass command line token classifier that is shared by the
+Switches, Mops, Definitions, and MultiDefinitions classes in the `commandlines.library` module.
+
+Each command line argument string is examined exactly once by the `tokenize` function and recorded in a compact token
+stream of `(kind, key, value, position, value position)` tuples.  The `collect` function then builds the data for all
+four container types in a single traversal of the token stream.  The ordered TokenEvents record of the parse is built
+from the same token stream with the `make_events` function when it is requested.  The `scan_*` functions apply the
+same classification rules to build the data for a single container type without a token stream (used by the
+standalone container constructors).
+
+Multi-option short syntax characters are stored in ParseResult objects as an integer bitmask with one bit for each
+ASCII letter and digit (see `mops_mask` and `mops_from_mask`).  Other characters are stored in a fallback frozenset.
+
+Argument lists of bytes (e.g. `[os.fsencode(arg) for arg in sys.argv[1:]]` or the arguments of a raw
+`/proc/<pid>/cmdline` buffer) are parsed in bytes mode without decoding.  In bytes mode the option keys, definition
+arguments, and multi-option short syntax characters are bytes.  The mode is determined by the type of the first
+argument (see `is_bytes_argv`).
+"""
+
+import sys
+
+from commandlines.aliases import STANDARD_ALIASES
+
+if sys.version_info[0] >= 3:
+    _intern = sys.intern
+    _FS_ENCODING = sys.getfilesystemencoding()
+else:
+    _intern = intern  # noqa: F821 (Python 2 built-in)
+
+# Token kind bit flags.  A single command line argument may be classified with more than one kind
+# (e.g. `-mops value` is a switch, a multi-option short syntax token, and a definition option).
+TOKEN_SWITCH = 1
+TOKEN_MOPS = 2
+TOKEN_DEFINITION = 4
+TOKEN_DOUBLE_DASH = 8
+TOKEN_REPEATABLE = 16   # definition option that is declared repeatable in a `commandlines.spec.OptionSpec`
+
+# Multi-option short syntax character : bit mapping for the ASCII letters and digits
+MOPS_MASK_CHARACTERS = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789"  # ASCII letters, digits
+MOPS_BITS = dict((character, 1 << index) for index, character in enumerate(MOPS_MASK_CHARACTERS))
+_MOPS_CHARACTERS_BY_BIT = dict((bit, character) for character, bit in MOPS_BITS.items())
+_EMPTY_FROZENSET = frozenset()
+
+# Standard option flag bits of the ParseResult `flags` word.  The bits from FLAG_USER up are assigned to user options by
+# a `commandlines.flags.OptionFlags` registry.
+FLAG_HELP = 1
+FLAG_QUIET = 2
+FLAG_USAGE = 4
+FLAG_VERBOSE = 8
+FLAG_VERSION = 16
+FLAG_USER = 32
+STANDARD_FLAG_BITS = {"help": FLAG_HELP, "quiet": FLAG_QUIET, "usage": FLAG_USAGE, "verbose": FLAG_VERBOSE,
+                      "version": FLAG_VERSION}
+
+
+_BYTES_MODE_SUPPORTED = bytes is not str   # Python 2 str arguments are bytes and are always parsed as strings
+
+
+def is_bytes_argv(argv):
+    """Returns boolean that indicates whether an argument list is parsed in bytes mode.  Python 3 argument lists that
+    begin with a bytes argument are parsed in bytes mode.
+
+    :param argv: (list) A list of command line arguments
+    :returns: boolean"""
+
+    return _BYTES_MODE_SUPPORTED and len(argv) > 0 and type(argv[0]) is bytes
+
+
+def fsencode(string):
+    """Encodes a string to a bytes mode argument with the file system encoding and the `surrogateescape` error handler.
+    Python 2 strings are returned unchanged.
+
+    :param string: (string) The string
+    :returns: bytes"""
+
+    if _BYTES_MODE_SUPPORTED:
+        return string.encode(_FS_ENCODING, "surrogateescape")
+    return string
+
+
+def fsdecode(data):
+    """Decodes a bytes mode argument to a string with the file system encoding and the `surrogateescape` error handler
+    (the decode that Python applies to `sys.argv`).  Strings (and all Python 2 arguments) are returned unchanged.
+
+    :param data: (bytes or string) The argument
+    :returns: string"""
+
+    if _BYTES_MODE_SUPPORTED and isinstance(data, bytes):
+        return data.decode(_FS_ENCODING, "surrogateescape")
+    return data
+
+
+def make_flag_tables(flag_map):
+    """Returns the string and bytes mode switch : flag bit lookup dictionaries for an option name : flag bit mapping.
+
+    :param flag_map: (dict) Option name (without dashes) : flag bit mapping that includes every spelling of the options
+    :returns: tuple of (dict, dict) indexed by the bytes mode boolean"""
+
+    return flag_map, dict((fsencode(name), bit) for name, bit in flag_map.items())
+
+
+def switch_flags(switches, flag_table):
+    """Returns the flags word of a switch set.  The word is the bitwise OR of the flag bits of the switches in a flag
+    lookup dictionary that was returned by `make_flag_tables`.
+
+    :param switches: (set or frozenset) Switch strings
+    :param flag_table: (dict) Switch : flag bit lookup dictionary
+    :returns: integer"""
+
+    flags = 0
+    for switch in switches.intersection(flag_table):   # iterates the few flag switches that are present
+        flags |= flag_table[switch]
+    return flags
+
+
+_STANDARD_FLAG_TABLES = make_flag_tables(dict(
+    [(name, STANDARD_FLAG_BITS[canonical]) for name, canonical in STANDARD_ALIASES.alias_map.items()] +
+    list(STANDARD_FLAG_BITS.items())))
+
+
+def tokenize(argv):
+    """Classifies the command line arguments in `argv` in a single pass and returns the token stream.  Positional
+    arguments that do not begin with a dash are not included in the stream.
+
+    Stream items are `(kind, key, value, position, value position)` tuples where kind is a bitwise OR of the TOKEN_*
+    flags, key is the option string with all dash characters at the beginning of the string removed, value is the
+    definition argument string (or None when the token does not define an option-argument pair), position is the index
+    of the argument in `argv`, and value position is the index of the argument that includes the definition argument
+    string (or -1).  Keys and values are bytes when `argv` is a bytes mode argument list.
+
+    :param argv: (list) A list of command line arguments that maintain the argument order that was entered on command line
+    :returns: list of (int, string, string, int, int) tuples"""
+
+    if is_bytes_argv(argv):
+        dash, double_dash, equals, empty = b"-", b"--", b"=", b""
+    else:
+        dash, double_dash, equals, empty = "-", "--", "=", ""
+    tokens = []
+    append = tokens.append
+    last_position = len(argv) - 1
+    option_context = True   # False after the double dash `--` idiom, only Mops syntax is recognized after it
+    position = -1
+    for token in argv:
+        position += 1
+        if token[:1] != dash:
+            continue
+        if option_context:
+            if token == double_dash:
+                option_context = False
+                append((TOKEN_DOUBLE_DASH, empty, None, position, -1))
+            elif equals in token:
+                # defines -option=definition syntax
+                split_def = token.split(equals)
+                append((TOKEN_DEFINITION, split_def[0].lstrip(dash), split_def[1], position, position))
+            else:
+                kind = TOKEN_SWITCH
+                if len(token) > 2 and token[1:2] != dash:
+                    kind |= TOKEN_MOPS
+                # defines -d <positional def> or --define <positional def> syntax
+                if position < last_position and not argv[position + 1].startswith(dash):
+                    append((kind | TOKEN_DEFINITION, token.lstrip(dash), argv[position + 1], position, position + 1))
+                else:
+                    append((kind, token.lstrip(dash), None, position, -1))
+        elif equals not in token and len(token) > 2 and token[1:2] != dash:
+            append((TOKEN_MOPS, token.lstrip(dash), None, position, -1))
+
+    return tokens
+
+
+def collect(tokens, alias_map=None, bytes_mode=False):
+    """Builds the switch set, mops set, definitions dictionary, and multiple definitions dictionary from a token stream
+    that was returned by the `tokenize` function in a single traversal of the stream.
+
+    :param tokens: (list) A token stream returned by the `tokenize` function
+    :param alias_map: (dict) Optional option name : canonical option name mapping that is used to canonicalize the
+                      switch and definition option keys
+    :param bytes_mode: (boolean) The token stream was parsed from a bytes mode argument list
+    :returns: tuple of (set, set, dict, dict, int) where the int is the index position of the double dash `--` argument
+              that ends option parsing, or -1"""
+
+    switchset = set()
+    mopsset = set()
+    defmap = {}
+    multimap = {}
+    double_dash = -1
+    for kind, key, value, position, value_position in tokens:
+        if kind & TOKEN_MOPS:
+            if bytes_mode:
+                characters = key.replace(b"-", b"")
+                mopsset.update(characters[index:index + 1] for index in range(len(characters)))
+            else:
+                mopsset.update(key.replace("-", ""))
+        if alias_map is not None:
+            key = alias_map.get(key, key)
+        if kind & TOKEN_SWITCH:
+            switchset.add(key)
+        if kind & TOKEN_DEFINITION:
+            # the value list of an option is created at its second occurrence (or first occurrence of an option that is
+            # declared repeatable) so that single use options do not allocate lists
+            if key in defmap:
+                if key in multimap:
+                    multimap[key].append(value)
+                else:
+                    multimap[key] = [defmap[key], value]
+            elif kind & TOKEN_REPEATABLE:
+                multimap[key] = [value]
+            defmap[key] = value
+        elif kind == TOKEN_DOUBLE_DASH:
+            double_dash = position
+
+    return switchset, mopsset, defmap, multimap, double_dash
+
+
+def scan_switches(argv):
+    """Returns the switch set of an argument list without building a token stream.  The result is equal to the switch
+    set that is returned by `collect(tokenize(argv))`.
+
+    :param argv: (list) A list of command line arguments that maintain the argument order that was entered on command line
+    :returns: set"""
+
+    if is_bytes_argv(argv):
+        dash, double_dash, equals = b"-", b"--", b"="
+    else:
+        dash, double_dash, equals = "-", "--", "="
+    switchset = set()
+    add = switchset.add
+    for token in argv:
+        if token[:1] != dash or equals in token:
+            continue
+        if token == double_dash:
+            break
+        add(token.lstrip(dash))
+    return switchset
+
+
+def scan_mops(argv):
+    """Returns the multi-option short syntax character set of an argument list without building a token stream.  The
+    result is equal to the mops set that is returned by `collect(tokenize(argv))`.
+
+    :param argv: (list) A list of command line arguments that maintain the argument order that was entered on command line
+    :returns: set"""
+
+    bytes_mode = is_bytes_argv(argv)
+    if bytes_mode:
+        dash, equals, empty = b"-", b"=", b""
+    else:
+        dash, equals, empty = "-", "=", ""
+    mopsset = set()
+    for token in argv:
+        # the syntax is recognized on both sides of the double dash `--` idiom
+        if token[:1] != dash or len(token) < 3 or token[1:2] == dash or equals in token:
+            continue
+        characters = token.replace(dash, empty)
+        if bytes_mode:
+            mopsset.update(characters[index:index + 1] for index in range(len(characters)))
+        else:
+            mopsset.update(characters)
+    return mopsset
+
+
+def scan_definitions(argv, multiple=False):
+    """Returns the definitions dictionary (or the multiple definitions dictionary) of an argument list without building
+    a token stream.  The result is equal to the dictionary that is returned by `collect(tokenize(argv))`.
+
+    :param argv: (list) A list of command line arguments that maintain the argument order that was entered on command line
+    :param multiple: (boolean) Return the option : list of definition arguments dictionary of the options that are
+                     defined more than once
+    :returns: dictionary"""
+
+    if is_bytes_argv(argv):
+        dash, double_dash, equals = b"-", b"--", b"="
+    else:
+        dash, double_dash, equals = "-", "--", "="
+    defmap = {}
+    multimap = {}
+    last_position = len(argv) - 1
+    for position, token in enumerate(argv):
+        if token[:1] != dash:
+            continue
+        if equals in token:
+            split_def = token.split(equals)
+            key = split_def[0].lstrip(dash)
+            value = split_def[1]
+        elif token == double_dash:
+            break
+        elif position < last_position and not argv[position + 1].startswith(dash):
+            key = token.lstrip(dash)
+            value = argv[position + 1]
+        else:
+            continue
+        if multiple and key in defmap:
+            if key in multimap:
+                multimap[key].append(value)
+            else:
+                multimap[key] = [defmap[key], value]
+        defmap[key] = value
+    if multiple:
+        return multimap
+    return defmap
+
+
+def make_events(tokens, alias_map=None):
+    """Returns the TokenEvents record of a token stream that was returned by the `tokenize` function.  The token
+    fields are transposed with C level iteration rather than a Python loop.
+
+    :param tokens: (list) A token stream returned by the `tokenize` function
+    :param alias_map: (dict) Optional option name : canonical option name mapping that is used to canonicalize the
+                      option keys
+    :returns: TokenEvents"""
+
+    if len(tokens) == 0:
+        return TokenEvents(_event_array(), _event_array(), _event_array(), (), ())
+    kinds, keys, values, positions, value_positions = zip(*tokens)
+    if alias_map is not None:
+        keys = tuple(map(alias_map.get, keys, keys))
+    return TokenEvents(_event_array(positions), _event_array(kinds), _event_array(value_positions), keys, values)
+
+
+def _event_array(values=()):
+    """Returns a TokenEvents integer field array (a signed integer type with at least 32 bits).  The array module is
+    imported on first use because it imports collections.abc on Python 3.  This is not intended for public use.
+
+    :param values: (iterable) The integer values
+    :returns: array"""
+
+    from array import array
+    return array("i" if array("i").itemsize >= 4 else "l", values)
+
+
+def mops_mask(characters):
+    """Returns the bitmask representation of multi-option short syntax characters.  Characters that are not ASCII
+    letters or digits are returned in a fallback frozenset.
+
+    :param characters: (iterable) Single character option strings
+    :returns: tuple of (int, frozenset)"""
+
+    mask = 0
+    other = None
+    bits = MOPS_BITS
+    for character in characters:
+        bit = bits.get(character)
+        if bit is None:
+            if other is None:
+                other = set()
+            other.add(character)
+        else:
+            mask |= bit
+    if other is None:
+        return mask, _EMPTY_FROZENSET
+    return mask, frozenset(other)
+
+
+def mops_from_mask(mask):
+    """Returns the multi-option short syntax characters that are represented by a bitmask.
+
+    :param mask: (int) A bitmask returned by the `mops_mask` function
+    :returns: list of strings"""
+
+    characters = []
+    by_bit = _MOPS_CHARACTERS_BY_BIT
+    while mask:
+        bit = mask & -mask   # lowest set bit
+        characters.append(by_bit[bit])
+        mask ^= bit
+    return characters
+
+
+class TokenEvents(object):
+    """An ordered record of the option tokens of a parse (the switches, definitions, multi-option short syntax tokens,
+    and the double dash `--` idiom) in command line order.  Every parsed container is derivable from the record and
+    position requests are index lookups that do not search the argument list.
+
+    Event `i` is the `(positions[i], kinds[i], keys[i], value_positions[i])` record with the definition argument string
+    in `values[i]`.  The integer fields are stored in arrays.  Option keys are canonicalized when the parse uses a
+    `commandlines.aliases.OptionAliases` registry.  TokenEvents objects are immutable because cached ParseResult
+    objects share them.  The integer field attributes return copies of the arrays.
+
+    Attributes:
+        positions : (array)
+                    Copy of the index positions of the option arguments in the argument list
+        kinds : (array)
+                Copy of the bitwise OR of the `TOKEN_*` kind flags
+        value_positions : (array)
+                          Copy of the index positions of the arguments that include the definition argument strings,
+                          or -1
+        keys : (tuple)
+               Option keys
+        values : (tuple)
+                 Definition argument strings or None
+
+    :param positions: (array) Index positions of the option arguments in the argument list
+    :param kinds: (array) Bitwise OR of the `TOKEN_*` kind flags
+    :param value_positions: (array) Index positions of the arguments that include the definition argument strings
+    :param keys: (tuple) Option keys
+    :param values: (tuple) Definition argument strings or None
+    """
+    __slots__ = ("_positions", "_kinds", "_value_positions", "keys", "values", "_key_index", "_position_index")
+
+    def __init__(self, positions, kinds, value_positions, keys, values):
+        object.__setattr__(self, "_positions", positions)
+        object.__setattr__(self, "_kinds", kinds)
+        object.__setattr__(self, "_value_positions", value_positions)
+        object.__setattr__(self, "keys", tuple(keys))
+        object.__setattr__(self, "values", tuple(values))
+        object.__setattr__(self, "_key_index", None)
+        object.__setattr__(self, "_position_index", None)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("TokenEvents objects are immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("TokenEvents objects are immutable")
+
+    def __reduce__(self):
+        return TokenEvents, (self._positions, self._kinds, self._value_positions, self.keys, self.values)
+
+    def __len__(self):
+        return len(self.keys)
+
+    def __iter__(self):
+        # zip returns a list on Python 2
+        return iter(zip(self._positions, self._kinds, self.keys, self._value_positions))
+
+    def __getitem__(self, index):
+        key = self.keys[index]   # raises IndexError for an index that is out of range
+        return self._positions[index], self._kinds[index], key, self._value_positions[index]
+
+    @property
+    def positions(self):
+        return self._positions[:]
+
+    @property
+    def kinds(self):
+        return self._kinds[:]
+
+    @property
+    def value_positions(self):
+        return self._value_positions[:]
+
+    def __eq__(self, other):
+        if not isinstance(other, TokenEvents):
+            return NotImplemented
+        return self._positions == other._positions and self._kinds == other._kinds and \
+            self._value_positions == other._value_positions and self.keys == other.keys and self.values == other.values
+
+    def __ne__(self, other):
+        if not isinstance(other, TokenEvents):
+            return NotImplemented
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        return hash((self.keys, self.values))
+
+    def __repr__(self):
+        return "< TokenEvents object > " + list(self).__repr__()
+
+    def __str__(self):
+        return "< TokenEvents object > " + list(self).__str__()
+
+    def positions_of(self, key, kind_mask=TOKEN_SWITCH | TOKEN_DEFINITION):
+        """Returns the argument list index positions of the events for an option key in ascending order.
+
+        :param key: (string) The option key without the dashes that are used at the beginning of the option
+        :param kind_mask: (int) Bitwise OR of the TOKEN_* kind flags.  Events that do not include one of the kinds are
+                          excluded.  Defaults to switch and definition events.
+        :returns: tuple of integers"""
+
+        key_index = self._key_index
+        if key_index is None:
+            key_index = self._make_key_index()
+        positions = self._positions
+        kinds = self._kinds
+        return tuple([positions[index] for index in key_index.get(key, ()) if kinds[index] & kind_mask])
+
+    def occurrences(self, key):
+        """Returns the definition events of an option key in command line order.  The last occurrence is the value in
+        the Definitions object and the values of all occurrences are the list in the MultiDefinitions object.
+
+        :param key: (string) The option key without the dashes that are used at the beginning of the option
+        :returns: tuple of (option position, definition argument position, definition argument string) tuples"""
+
+        key_index = self._key_index
+        if key_index is None:
+            key_index = self._make_key_index()
+        positions = self._positions
+        kinds = self._kinds
+        value_positions = self._value_positions
+        values = self.values
+        return tuple([(positions[index], value_positions[index], values[index])
+                      for index in key_index.get(key, ()) if kinds[index] & TOKEN_DEFINITION])
+
+    def event_at(self, position):
+        """Returns the index of the event for an argument list index position, or -1 if the argument at the position
+        is not an option token (e.g. a positional argument or a definition argument that follows its option).
+
+        :param position: (int) The argument list index position
+        :returns: integer"""
+
+        position_index = self._position_index
+        if position_index is None:
+            position_index = dict(zip(self._positions, range(len(self._positions))))
+            object.__setattr__(self, "_position_index", position_index)
+        return position_index.get(position, -1)
+
+    def _make_key_index(self):
+        key_index = {}
+        index = 0
+        for key in self.keys:
+            if key in key_index:
+                key_index[key].append(index)
+            else:
+                key_index[key] = [index]
+            index += 1
+        object.__setattr__(self, "_key_index", key_index)
+        return key_index
+
+
+class ParseResult(object):
+    """An immutable record of the parsed components of a command line argument list.  A single ParseResult can be
+    shared by multiple Command objects (e.g. through a `commandlines.cache.ParseCache`).  Command objects copy the
+    parsed data into their own mutable container objects.  ParseResult objects pickle to a flat tuple of interned
+    strings and integers for inexpensive transfer between processes.  Use `Command.from_parse_result()` to create a
+    Command object from a ParseResult.
+
+    Attributes:
+        argv : (tuple)
+               The command line arguments
+        switches : (frozenset)
+                   Switch strings
+        mops : (int)
+               Bitmask of the multi-option short syntax option characters that are ASCII letters or digits
+        mops_other : (frozenset)
+                     Multi-option short syntax option characters that are not represented in the `mops` bitmask (all
+                     characters of a bytes mode argument list)
+        defs : (tuple)
+               (option, argument) definition pairs with the last definition of an option maintained
+        mdefs : (tuple)
+                (option, tuple of arguments) pairs for options that are defined more than once
+        double_dash : (int)
+                      Index position of the double dash `--` argument that ends option parsing, or -1
+        events : (TokenEvents)
+                 Ordered record of the option tokens with argument list positions
+        flags : (int)
+                Bitwise OR of the FLAG_* bits of the standard options (`-h` / `--help`, `--quiet`, `--usage`,
+                `--verbose`, and `-v` / `--version`) that are included as switches
+
+    ParseResult objects also hold a cache of the typed option values that are converted by Command objects (see
+    `commandlines.convert`).  The cache is not included in comparisons or pickles.
+
+    :param argv: (iterable) The command line arguments that maintain the argument order that was entered on command line
+    :param spec: (CompiledSpec) Optional compiled `commandlines.spec.OptionSpec` that defines the parse
+    :param aliases: (OptionAliases) Optional `commandlines.aliases.OptionAliases` that canonicalizes option keys
+    """
+    __slots__ = ("argv", "switches", "mops", "mops_other", "defs", "mdefs", "double_dash", "events", "flags",
+                 "_typed")
+
+    def __init__(self, argv, spec=None, aliases=None):
+        argv = tuple(argv)
+        bytes_mode = is_bytes_argv(argv)
+        alias_map = None if aliases is None else aliases.get_alias_map(bytes_mode)
+        if spec is None:
+            tokens = tokenize(argv)
+        else:
+            tokens = spec.tokenize(argv)
+        switchset, mopsset, defmap, multimap, double_dash = collect(tokens, alias_map, bytes_mode)
+        object.__setattr__(self, "argv", argv)
+        object.__setattr__(self, "switches", frozenset(switchset))
+        mask, other = mops_mask(mopsset)
+        object.__setattr__(self, "mops", mask)
+        object.__setattr__(self, "mops_other", other)
+        object.__setattr__(self, "defs", tuple(defmap.items()))
+        object.__setattr__(self, "mdefs", tuple((key, tuple(multimap[key])) for key in multimap))
+        object.__setattr__(self, "double_dash", double_dash)
+        object.__setattr__(self, "events", make_events(tokens, alias_map))
+        object.__setattr__(self, "flags", switch_flags(switchset, _STANDARD_FLAG_TABLES[bytes_mode]))
+        object.__setattr__(self, "_typed", {})
+
+    def __setattr__(self, name, value):
+        raise AttributeError("ParseResult objects are immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("ParseResult objects are immutable")
+
+    def __repr__(self):
+        return "< ParseResult object > parsed from arguments: " + list(self.argv).__str__()
+
+    def __str__(self):
+        return "< ParseResult object > parsed from arguments: " + list(self.argv).__str__()
+
+    def __reduce__(self):
+        return _restore_parse_result, _flatten_parse_result(self)
+
+    def __eq__(self, other):
+        if not isinstance(other, ParseResult):
+            return NotImplemented
+        return self._state() == other._state()
+
+    def __ne__(self, other):
+        if not isinstance(other, ParseResult):
+            return NotImplemented
+        return self._state() != other._state()
+
+    def __hash__(self):
+        return hash(self._state())
+
+    def _state(self):
+        return self.argv, self.switches, self.mops, self.mops_other, self.defs, self.mdefs, self.double_dash, \
+            self.events
+
+
+def _flatten_parse_result(result):
+    """Returns the flat pickle representation of a ParseResult.  This is not intended for public use.
+
+    The representation is a single tuple of interned strings and small integers.  Every variable length field is
+    preceded by its item count:
+
+        (argc, *argv, switch count, *switches, mops mask, other mops count, *other mops,
+         definition count, *(option, argument), multiple definition count, *(option, argument count, *arguments),
+         double dash position, event count, *(position, kind, value position, key[, argument if a definition]))
+
+    Interned strings are shared objects, so a string that occurs more than once (e.g. an option that is both a switch
+    and a definition) is written once and referenced by the pickle memo.
+
+    :param result: (ParseResult) The parse result
+    :returns: tuple"""
+
+    flat = [len(result.argv)]
+    flat.extend(result.argv)
+    flat.append(len(result.switches))
+    flat.extend(result.switches)
+    flat.append(result.mops)
+    flat.append(len(result.mops_other))
+    flat.extend(result.mops_other)
+    flat.append(len(result.defs))
+    for key, value in result.defs:
+        flat.append(key)
+        flat.append(value)
+    flat.append(len(result.mdefs))
+    for key, values in result.mdefs:
+        flat.append(key)
+        flat.append(len(values))
+        flat.extend(values)
+    flat.append(result.double_dash)
+    events = result.events
+    flat.append(len(events))
+    for position, kind, key, value_position, value in zip(events._positions, events._kinds, events.keys,
+                                                          events._value_positions, events.values):
+        flat.extend((position, kind, value_position, key))
+        if kind & TOKEN_DEFINITION:
+            flat.append(value)
+    return tuple([_intern(item) if type(item) is str else item for item in flat])
+
+
+def _restore_parse_result(*flat):
+    """Restores a ParseResult from the flat representation that is returned by `_flatten_parse_result` without parsing
+    the argument list again.  This is not intended for public use.
+
+    :returns: ParseResult"""
+
+    flat = [_intern(item) if type(item) is str else item for item in flat]
+    position = 1
+    end = position + flat[0]
+    argv = tuple(flat[position:end])
+    position = end + 1
+    end = position + flat[end]
+    switches = frozenset(flat[position:end])
+    mops = flat[end]
+    position = end + 2
+    end = position + flat[end + 1]
+    mops_other = frozenset(flat[position:end]) if end > position else _EMPTY_FROZENSET
+    count = flat[end]
+    position = end + 1
+    end = position + 2 * count
+    defs = tuple(zip(flat[position:end:2], flat[position + 1:end:2]))
+    count = flat[end]
+    position = end + 1
+    mdefs = []
+    for _ in range(count):
+        key = flat[position]
+        end = position + 2 + flat[position + 1]
+        mdefs.append((key, tuple(flat[position + 2:end])))
+        position = end
+    double_dash = flat[position]
+    count = flat[position + 1]
+    position += 2
+    positions = _event_array()
+    kinds = _event_array()
+    value_positions = _event_array()
+    keys = []
+    values = []
+    for _ in range(count):
+        kind = flat[position + 1]
+        positions.append(flat[position])
+        kinds.append(kind)
+        value_positions.append(flat[position + 2])
+        keys.append(flat[position + 3])
+        if kind & TOKEN_DEFINITION:
+            values.append(flat[position + 4])
+            position += 5
+        else:
+            values.append(None)
+            position += 4
+
+    result = object.__new__(ParseResult)
+    object.__setattr__(result, "argv", argv)
+    object.__setattr__(result, "switches", switches)
+    object.__setattr__(result, "mops", mops)
+    object.__setattr__(result, "mops_other", mops_other)
+    object.__setattr__(result, "defs", defs)
+    object.__setattr__(result, "mdefs", tuple(mdefs))
+    object.__setattr__(result, "double_dash", double_dash)
+    object.__setattr__(result, "events", TokenEvents(positions, kinds, value_positions, tuple(keys), tuple(values)))
+    # the flags word is derived from the switches and is not included in the flat representation
+    object.__setattr__(result, "flags", switch_flags(switches, _STANDARD_FLAG_TABLES[is_bytes_argv(argv)]))
+    object.__setattr__(result, "_typed", {})
+    return result
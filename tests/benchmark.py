@@ -0,0 +1,189 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Benchmark suite for the commandlines library.
+
+Usage:
+    python tests/benchmark.py [--quick] [--output=<path>] [--filter=<substring>] [--repeat=<n>]
+
+Times Command object instantiation, the Command contains_*/get_*/has_*/is_* methods, and the Arguments, Switches,
+Mops, Definitions, and MultiDefinitions container classes across several argument list shapes with 0 to 100,000
+tokens.  Results are written as JSON to the standard output stream or to the --output file path.
+
+Options:
+    --quick      limit argument list sizes to 1,000 tokens
+    --output     write the JSON results to a file path instead of the standard output stream
+    --filter     only run benchmarks with names that include the substring
+    --repeat     number of timing repeats (default 3); the best and mean per call times are reported
+"""
+
+import json
+import platform
+import sys
+import time
+import timeit
+
+from commandlines import Command
+from commandlines.flags import FLAG_QUIET, FLAG_VERBOSE
+from commandlines.library import Arguments, Definitions, Mops, MultiDefinitions, Switches
+from commandlines.router import Router
+from commandlines.standard import get_standard_request
+from commandlines.settings import major_version, minor_version, patch_version
+
+SIZES = (0, 1, 10, 100, 1000, 10000, 100000)
+QUICK_SIZES = (0, 1, 10, 100, 1000)
+METHOD_SIZE = 100
+MIN_TIME = 0.1   # seconds per timing repeat used to determine the number of loops
+
+# Repeating token patterns that are used to build argument lists of a requested size
+SHAPES = {
+    "positional": ["install", "package", "path/to/file.txt", "another"],
+    "switches": ["-s", "--long", "-v", "--verbose", "-q"],
+    "definitions": ["--name=value", "-o", "path", "--output", "file.txt", "--level=3"],
+    "mops": ["-rnj", "-tlx", "-abc"],
+    "mixed": ["subcmd", "-s", "--long", "-n", "shortdef", "--name=value", "-mops", "--file", "path", "lastpos"],
+    "double_dash": ["-t", "--flag", "-s", "--long", "value"],   # a `--` token is placed at the middle position
+}
+
+
+def make_argv(shape, size):
+    """Returns an argument list with `size` tokens built from the repeating token pattern for `shape`."""
+
+    pattern = SHAPES[shape]
+    argv = []
+    while len(argv) < size:
+        argv.extend(pattern)
+    argv = argv[:size]
+    if shape == "double_dash" and size > 0:
+        argv[size // 2] = "--"
+    return argv
+
+
+def time_callable(func, repeat):
+    """Times a callable and returns (number, best, mean) where best and mean are seconds per call."""
+
+    timer = timeit.Timer(func)
+    number = 1
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= MIN_TIME or number >= 10 ** 7:
+            break
+        number *= 10 if elapsed < MIN_TIME / 10 else 2
+    times = timer.repeat(repeat=repeat, number=number)
+    return number, min(times) / number, sum(times) / len(times) / number
+
+
+def construction_benchmarks(sizes):
+    """Yields (name, group, shape, tokens, callable) tuples for Command and container instantiation."""
+
+    for shape in sorted(SHAPES):
+        for size in sizes:
+            argv = make_argv(shape, size)
+            sys_argv = ["executable"] + argv
+
+            def command_sysargv(sys_argv=sys_argv):
+                sys.argv = sys_argv
+                Command()
+
+            yield "Command()", "construction", shape, size, command_sysargv
+            yield "Command.from_argv", "construction", shape, size, lambda argv=argv: Command.from_argv(argv)
+            yield "Command.from_argv(lazy=True)", "construction", shape, size, \
+                lambda argv=argv: Command.from_argv(argv, lazy=True)
+            for container in (Arguments, Switches, Mops, Definitions, MultiDefinitions):
+                yield container.__name__ + "()", "containers", shape, size, lambda c=container, argv=argv: c(argv)
+
+
+def method_benchmarks():
+    """Yields (name, group, shape, tokens, callable) tuples for the Command methods and container contains methods."""
+
+    argv = make_argv("mixed", METHOD_SIZE) + ["-o", "file1", "-o", "file2", "--id", "1", "--id", "2", "--", "tail1",
+                                              "tail2"]
+    c = Command.from_argv(argv)
+    c.set_defaults({"output": "stdout", "level": "1"})
+    options = c.resolve()
+    router = Router()
+    for index in range(METHOD_SIZE):
+        router.add_route(("cmd" + str(index), "sub"), None)
+    router.add_route(("subcmd",), None).add_route(("subcmd", "-s", "--long"), None)
+    size = len(argv)
+    methods = [
+        ("contains_switches", lambda: c.contains_switches("s", "long")),
+        ("contains_mops", lambda: c.contains_mops("m", "o", "p")),
+        ("contains_definitions", lambda: c.contains_definitions("name", "file")),
+        ("contains_multi_definitions", lambda: c.contains_multi_definitions("o")),
+        ("contains_defaults", lambda: c.contains_defaults("output", "level")),
+        ("get_definition", lambda: c.get_definition("name")),
+        ("get_multiple_definitions", lambda: c.get_multiple_definitions("o")),
+        ("get_numeric_definitions", lambda: c.get_numeric_definitions("id", "l", use_numpy=False)),
+        ("find_definition(missing)", lambda: c.find_definition("missing")),
+        ("get_default", lambda: c.get_default("output")),
+        ("ResolvedOptions.get", lambda: options.get("output")),
+        ("get_arg_after", lambda: c.get_arg_after("--file")),
+        ("get_double_dash_args", lambda: c.get_double_dash_args()),
+        ("get_double_dash_view", lambda: c.get_double_dash_view()),
+        ("has_command_sequence", lambda: c.has_command_sequence("subcmd", "-s")),
+        ("Router.resolve", lambda: router.resolve(c.arguments)),
+        ("has_args_after", lambda: c.has_args_after("--file")),
+        ("has_double_dash", lambda: c.has_double_dash()),
+        ("next_arg_is_in", lambda: c.next_arg_is_in("--file", ["path"])),
+        ("is_help_request", lambda: c.is_help_request()),
+        ("is_quiet_request", lambda: c.is_quiet_request()),
+        ("is_usage_request", lambda: c.is_usage_request()),
+        ("is_verbose_request", lambda: c.is_verbose_request()),
+        ("is_version_request", lambda: c.is_version_request()),
+        ("matches_flags", lambda: c.matches_flags(FLAG_VERBOSE, FLAG_QUIET)),
+        ("standard.get_standard_request", lambda: get_standard_request(argv)),
+        ("Arguments.contains", lambda: c.arguments.contains(("subcmd", "lastpos"))),
+        ("Arguments.get_arg_position", lambda: c.arguments.get_arg_position("tail2")),
+        ("Switches.contains", lambda: c.switches.contains(("s", "long"))),
+        ("Mops.contains", lambda: c.mops.contains(("m", "o"))),
+        ("Definitions.contains", lambda: c.defs.contains(("name", "file"))),
+        ("MultiDefinitions.contains", lambda: c.mdefs.contains(("o",))),
+    ]
+    for name, func in methods:
+        yield name, "methods", "mixed", size, func
+
+
+def run(sizes, name_filter, repeat):
+    """Runs the benchmarks and returns the list of result dictionaries."""
+
+    results = []
+    benchmarks = list(construction_benchmarks(sizes)) + list(method_benchmarks())
+    for name, group, shape, tokens, func in benchmarks:
+        if name_filter is not None and name_filter not in name:
+            continue
+        number, best, mean = time_callable(func, repeat)
+        results.append({"name": name, "group": group, "shape": shape, "tokens": tokens,
+                        "number": number, "repeat": repeat, "best": best, "mean": mean})
+        sys.stderr.write("{0:<28} {1:<12} {2:>7} tokens  {3:.3e} s\n".format(name, shape, tokens, best))
+    return results
+
+
+def main():
+    saved_argv = sys.argv
+    c = Command()
+    name_filter = c.get_definition("filter") if c.contains_definitions("filter") else None
+    repeat = int(c.get_definition("repeat")) if c.contains_definitions("repeat") else 3
+    sizes = QUICK_SIZES if c.contains_switches("quick") else SIZES
+
+    results = run(sizes, name_filter, repeat)
+    sys.argv = saved_argv   # Command() benchmarks modify sys.argv
+
+    report = {
+        "commandlines_version": major_version + "." + minor_version + "." + patch_version,
+        "python_implementation": platform.python_implementation(),
+        "python_version": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "results": results,
+    }
+    output = json.dumps(report, indent=2, sort_keys=True)
+    if c.contains_definitions("output"):
+        with open(c.get_definition("output"), "w") as f:
+            f.write(output + "\n")
+    else:
+        sys.stdout.write(output + "\n")
+
+
+if __name__ == '__main__':
+    main()
@@ -4,7 +4,6 @@
 
 from commandlines import Command
 
-import sys
 import shlex
 
 
@@ -14,12 +13,8 @@ test_command_18 = "executable -o path1 -o path2 --file tests/path1 --file tests/
 test_command_19 = "executable -mops -t --test=bogus --test=another --help me"
 
 
-def set_sysargv(argstring):
-    sys.argv = shlex.split(argstring)
+def create_argv(argstring):
+    return shlex.split(argstring)[1:]
 
-set_sysargv(test_command_13)
-
-c = Command()
+c = Command.from_argv(create_argv(test_command_13))
 print(c.obj_string())
-
-
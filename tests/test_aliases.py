@@ -0,0 +1,139 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+
+import sys
+import shlex
+import pytest
+
+from commandlines import Command
+from commandlines.cache import ParseCache
+from commandlines.spec import OptionSpec
+from commandlines.aliases import OptionAliases, STANDARD_ALIASES
+from commandlines.exceptions import MissingDictionaryKeyError
+
+# TESTS OVERVIEW: option alias registry tests
+
+test_command_1 = "executable -o path --verbose -I dir1 --include dir2 lastpos"
+test_command_2 = "executable --output=path -v -mops"
+test_command_3 = "executable -h -v"
+test_command_4 = "executable --help --version"
+test_command_5 = "executable -v"
+
+
+def set_sysargv(argstring):
+    sys.argv = shlex.split(argstring)
+
+
+def create_argv(argstring):
+    return shlex.split(argstring)[1:]
+
+
+def create_aliases():
+    return OptionAliases(("output", "o"), ("verbose", "v"), ("include", "I"))
+
+# BEGIN TESTS
+
+#
+# OptionAliases registry tests
+#
+
+
+def test_optionaliases_canonical():
+    aliases = create_aliases()
+    assert aliases.canonical("o") == "output"
+    assert aliases.canonical("output") == "output"
+    assert aliases.canonical("bogus") == "bogus"
+    assert aliases.canonicalize(("o", "verbose", "x")) == ("output", "verbose", "x")
+    assert "o" in aliases
+    assert "x" not in aliases
+
+
+def test_optionaliases_invalid_groups():
+    with pytest.raises(ValueError):
+        OptionAliases(())
+    with pytest.raises(ValueError):
+        OptionAliases(("output", "o"), ("other", "o"))
+
+
+def test_standard_aliases():
+    assert STANDARD_ALIASES.canonical("h") == "help"
+    assert STANDARD_ALIASES.canonical("v") == "version"
+
+#
+# Command parsing with aliases
+#
+
+
+def test_command_aliases_canonicalize_containers():
+    c = Command.from_argv(create_argv(test_command_1), aliases=create_aliases())
+    assert "output" in c.switches
+    assert "o" not in c.switches
+    assert c.defs["output"] == "path"
+    assert c.mdefs == {"include": ["dir1", "dir2"]}
+
+
+def test_command_aliases_lookup_with_either_spelling():
+    c = Command.from_argv(create_argv(test_command_1), aliases=create_aliases())
+    assert c.contains_switches("o", "output", "v", "verbose") is True
+    assert c.contains_definitions("o") is True
+    assert c.contains_definitions("output") is True
+    assert c.get_definition("o") == "path"
+    assert c.get_definition("output") == "path"
+    assert c.contains_multi_definitions("I") is True
+    assert c.get_multiple_definitions("I") == ["dir1", "dir2"]
+    with pytest.raises(MissingDictionaryKeyError):
+        c.get_definition("bogus")
+
+
+def test_command_aliases_equals_definition_syntax_and_mops():
+    c = Command.from_argv(create_argv(test_command_2), aliases=create_aliases())
+    assert c.get_definition("o") == "path"
+    assert c.contains_switches("verbose") is True
+    assert c.mops == {"m", "o", "p", "s"}   # mops characters are not canonicalized
+
+
+def test_command_aliases_sysargv_and_lazy():
+    set_sysargv(test_command_1)
+    c = Command(lazy=True, aliases=create_aliases())
+    assert c.get_definition("o") == "path"
+    assert c.obj_string() == Command.from_argv(create_argv(test_command_1), aliases=create_aliases()).obj_string()
+
+
+def test_command_aliases_with_spec_and_cache():
+    spec = OptionSpec().add_option("o").compile()
+    cache = ParseCache()
+    aliases = create_aliases()
+    c = Command.from_argv(["-o", "path"], cache=cache, spec=spec, aliases=aliases)
+    assert c.defs == {"output": "path"}
+    plain = Command.from_argv(["-o", "path"], cache=cache)
+    assert plain.defs == {"o": "path"}
+    assert cache.misses == 2
+    assert cache.contains(["-o", "path"], spec=spec, aliases=aliases) is True
+    assert cache.contains(["-o", "path"], spec=spec) is False
+    assert cache.contains(["-o", "path"]) is True
+    assert ["-o", "path"] in cache
+
+#
+# Standard option requests
+#
+
+
+def test_command_standard_short_options():
+    c = Command.from_argv(create_argv(test_command_3))
+    assert c.is_help_request() is True
+    assert c.is_version_request() is True
+    assert c.switches == {"h", "v"}   # containers are not canonicalized with the standard aliases
+
+
+def test_command_standard_long_options():
+    c = Command.from_argv(create_argv(test_command_4))
+    assert c.is_help_request() is True
+    assert c.is_version_request() is True
+    assert c.is_verbose_request() is False
+
+
+def test_command_user_alias_overrides_standard_alias():
+    c = Command.from_argv(create_argv(test_command_5), aliases=create_aliases())
+    assert c.is_version_request() is False   # `-v` is registered as the verbose option
+    assert c.is_verbose_request() is True
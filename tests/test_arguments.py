@@ -20,6 +20,7 @@ test_command_7 = "git commit -m 'initial commit'"
 test_command_8 = "find . -name tests/aaa.txt"
 test_command_9 = "executable -mops -t lastpos"
 test_command_10 = "executable subcmd subsubcmd"
+test_command_11 = "executable -o path1 -o path2 subcmd -o path3"
 test_command_empty_1 = "executable"
 test_command_empty_2 = "exe-dash"
 
@@ -91,6 +92,54 @@ def test_argument_get_arg_position():
         argu.get_arg_position("bogus")
 
 
+def test_argument_get_arg_position_first_occurrence():
+    argu = Arguments(create_argv(test_command_11))
+    assert argu.get_arg_position("-o") == 0
+    assert argu.get_arg_position("path3") == 6
+
+
+def test_argument_get_arg_positions():
+    argu = Arguments(create_argv(test_command_11))
+    assert argu.get_arg_positions("-o") == (0, 2, 5)
+    assert argu.get_arg_positions("subcmd") == (4,)
+    with pytest.raises(MissingArgumentError):
+        argu.get_arg_positions("bogus")
+
+
+def test_argument_get_nth_arg_position():
+    argu = Arguments(create_argv(test_command_11))
+    assert argu.get_nth_arg_position("-o", 1) == 0
+    assert argu.get_nth_arg_position("-o", 2) == 2
+    assert argu.get_nth_arg_position("-o", 3) == 5
+    with pytest.raises(IndexOutOfRangeError):
+        argu.get_nth_arg_position("-o", 4)
+    with pytest.raises(IndexOutOfRangeError):
+        argu.get_nth_arg_position("-o", 0)
+    with pytest.raises(MissingArgumentError):
+        argu.get_nth_arg_position("bogus", 1)
+
+
+def test_argument_position_index_invalidated_by_modification():
+    argu = Arguments(create_argv(test_command_11))
+    assert argu.get_arg_position("subcmd") == 4
+    argu.insert(0, "first")
+    assert argu.get_arg_position("subcmd") == 5
+    argu.append("-o")
+    assert argu.get_arg_positions("-o") == (1, 3, 6, 8)
+    argu[0] = "replaced"
+    assert argu.get_arg_position("replaced") == 0
+    with pytest.raises(MissingArgumentError):
+        argu.get_arg_position("first")
+    del argu[0]
+    argu.remove("subcmd")
+    assert argu.get_arg_positions("-o") == (0, 2, 4, 6)
+    argu += ["added"]
+    assert argu.get_arg_position("added") == 7
+    argu.extend(["extended"])
+    argu.pop(0)
+    assert argu.get_arg_position("extended") == 7
+
+
 def test_argument_contains():
     argu = Arguments(create_argv(test_command_1))
     assert len(argu) == 9
@@ -101,3 +150,28 @@ def test_argument_contains():
     assert argu.contains(['bogus']) == False   # missing argument test returns False
     assert argu.contains(['subcmd', 'bogus']) == False   # if any arguments are missing, returns False
 
+
+def test_arguments_double_dash_position():
+    a = Arguments(["-t", "--", "lastpos", "--"])
+    assert a.get_double_dash_position() == 1
+    with pytest.raises(MissingArgumentError):
+        Arguments(["-t", "lastpos"]).get_double_dash_position()
+
+
+
+def test_arguments_find_methods():
+    argu = Arguments(create_argv(test_command_11))
+    assert argu.find_argument(0) == "-o"
+    assert argu.find_argument(len(argu)) is None
+    assert argu.find_argument(-1, "missing") == "missing"
+    assert argu.find_arg_position("subcmd") == 4
+    assert argu.find_arg_position("missing") is None
+    assert argu.find_arg_positions("-o") == (0, 2, 5)
+    assert argu.find_arg_positions("missing", ()) == ()
+    assert argu.find_nth_arg_position("-o", 3) == 5
+    assert argu.find_nth_arg_position("-o", 4) is None
+    assert argu.find_nth_arg_position("missing", 1, -1) == -1
+    assert argu.find_arg_next(0) == "path1"
+    assert argu.find_arg_next(len(argu) - 1) is None
+    assert argu.find_double_dash_position() is None
+    assert Arguments(["a", "--", "b"]).find_double_dash_position() == 1
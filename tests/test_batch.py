@@ -0,0 +1,192 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+
+import pickle
+import shlex
+import pytest
+
+from commandlines import Command
+from commandlines.aliases import OptionAliases
+from commandlines.batch import parse_parallel
+from commandlines.spec import OptionSpec
+from commandlines.tokenizer import ParseResult
+
+# TESTS OVERVIEW: parse_parallel batch parser and Command.from_parse_result tests
+
+test_commands = [
+    "executable subcmd -s --long -n shortdef --name longdef --nameeq=longdefeq lastpos",
+    "executable -o path1 -o path2 -t --flag",
+    "executable -mops -- -tlx lastpos",
+    "executable -h --verbose",
+    "executable",
+    "executable -mops=value -- --name=value",
+    "executable -o path -I inc1 -Iinc2 -I inc3",
+]
+
+
+def create_argv(argstring):
+    return shlex.split(argstring)[1:]
+
+
+def create_corpus(count):
+    corpus = []
+    while len(corpus) < count:
+        corpus.extend(create_argv(command) for command in test_commands)
+    return corpus[:count]
+
+
+def assert_same_command(c1, c2):
+    assert c1.arguments == c2.arguments
+    assert c1.switches == c2.switches
+    assert c1.mops == c2.mops
+    assert c1.defs == c2.defs
+    assert c1.mdefs == c2.mdefs
+    assert c1.has_double_dash() == c2.has_double_dash()
+    if c1.has_double_dash():
+        assert c1.get_double_dash_args() == c2.get_double_dash_args()
+
+# BEGIN TESTS
+
+#
+# ParseResult pickle tests
+#
+
+
+def test_parseresult_pickle_roundtrip():
+    for command in test_commands:
+        result = ParseResult(create_argv(command))
+        restored = pickle.loads(pickle.dumps(result))
+        assert restored == result
+        assert hash(restored) == hash(result)
+        assert restored.defs == result.defs
+        assert restored.mdefs == result.mdefs
+
+
+def test_parseresult_pickle_protocols():
+    result = ParseResult(create_argv("executable sub -o a -o b -rnj -r+x --x=1 -- -q"))
+    assert result.mops_other == frozenset(["+"])
+    for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+        assert pickle.loads(pickle.dumps(result, protocol)) == result
+
+
+def test_parseresult_pickle_empty():
+    result = ParseResult([])
+    assert pickle.loads(pickle.dumps(result)) == result
+
+
+def test_parseresult_reduce_flat_tuple():
+    result = ParseResult(create_argv("executable -o a -o b -tlx --flag"))
+    restore, flat = result.__reduce__()
+    for item in flat:
+        assert type(item) in (str, int)
+    assert flat[:7] == (6, "-o", "a", "-o", "b", "-tlx", "--flag")
+    assert restore(*flat) == result
+
+
+def test_parseresult_pickle_smaller_than_command():
+    argv = create_argv(test_commands[0])
+    assert len(pickle.dumps(ParseResult(argv))) < len(pickle.dumps(Command.from_argv(argv)))
+
+
+def test_parseresult_pickle_restored_immutable():
+    restored = pickle.loads(pickle.dumps(ParseResult(create_argv(test_commands[0]))))
+    with pytest.raises(AttributeError):
+        restored.switches = frozenset()
+
+
+def test_parseresult_equality():
+    assert ParseResult(create_argv(test_commands[0])) == ParseResult(create_argv(test_commands[0]))
+    assert ParseResult(create_argv(test_commands[0])) != ParseResult(create_argv(test_commands[1]))
+
+
+#
+# Command.from_parse_result tests
+#
+
+
+def test_command_from_parse_result():
+    for command in test_commands:
+        argv = create_argv(command)
+        assert_same_command(Command.from_parse_result(ParseResult(argv)), Command.from_argv(argv))
+
+
+def test_command_from_parse_result_positional_parameters():
+    # the positional parameter order matches Command.from_argv(): lazy, spec, aliases, flags
+    spec = OptionSpec().add_option("output", "o").compile()
+    argv = ["-o", "path"]
+    c = Command.from_parse_result(ParseResult(argv, spec), False, spec)
+    assert_same_command(c, Command.from_argv(argv, False, None, spec))
+    assert c.get_definition("o") == "path"
+
+
+def test_command_from_parse_result_lazy():
+    argv = create_argv(test_commands[0])
+    assert_same_command(Command.from_parse_result(ParseResult(argv), lazy=True), Command.from_argv(argv))
+
+
+#
+# parse_parallel tests
+#
+
+
+def test_parse_parallel_ordered_matches_single_process():
+    corpus = create_corpus(200)
+    results = list(parse_parallel(corpus, workers=2, chunksize=16))
+    assert len(results) == len(corpus)
+    for argv, result in zip(corpus, results):
+        assert result == ParseResult(argv)
+        assert_same_command(Command.from_parse_result(result), Command.from_argv(argv))
+
+
+def test_parse_parallel_unordered_indices():
+    corpus = create_corpus(200)
+    results = list(parse_parallel(corpus, workers=2, chunksize=7, ordered=False))
+    assert sorted(index for index, result in results) == list(range(len(corpus)))
+    for index, result in results:
+        assert result == ParseResult(corpus[index])
+
+
+def test_parse_parallel_in_process():
+    corpus = create_corpus(50)
+    assert list(parse_parallel(corpus, workers=0, chunksize=8)) == [ParseResult(argv) for argv in corpus]
+    assert list(parse_parallel(corpus, workers=0, ordered=False)) == \
+        [(index, ParseResult(argv)) for index, argv in enumerate(corpus)]
+
+
+def test_parse_parallel_generator_input_and_bounded_pending():
+    corpus = create_corpus(100)
+    results = list(parse_parallel((argv for argv in corpus), workers=2, chunksize=3, max_pending=1))
+    assert results == [ParseResult(argv) for argv in corpus]
+
+
+def test_parse_parallel_spec_and_aliases():
+    spec = OptionSpec().add_flag("verbose").add_option("output", "o").add_repeatable_option("I").compile()
+    aliases = OptionAliases(("help", "h"))
+    corpus = create_corpus(40)
+    results = list(parse_parallel(corpus, workers=2, chunksize=5, spec=spec, aliases=aliases))
+    assert results == [ParseResult(argv, spec, aliases) for argv in corpus]
+
+
+def test_parse_parallel_empty_input():
+    assert list(parse_parallel([], workers=2)) == []
+
+
+def test_parse_parallel_early_close():
+    results = parse_parallel(create_corpus(1000), workers=2, chunksize=10)
+    assert next(results) == ParseResult(create_argv(test_commands[0]))
+    results.close()
+
+
+def test_parse_parallel_worker_exception():
+    with pytest.raises(TypeError):
+        list(parse_parallel([["-s"], [None]], workers=1))
+
+
+def test_parse_parallel_invalid_parameters():
+    with pytest.raises(ValueError):
+        parse_parallel([], workers=-1)
+    with pytest.raises(ValueError):
+        parse_parallel([], chunksize=0)
+    with pytest.raises(ValueError):
+        parse_parallel([], max_pending=0)
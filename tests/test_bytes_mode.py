@@ -0,0 +1,196 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+
+import io
+import os
+import shlex
+import pytest
+
+from commandlines import Command
+from commandlines.aliases import OptionAliases
+from commandlines.spec import OptionSpec
+from commandlines.exceptions import MissingArgumentError, MissingDictionaryKeyError
+from commandlines.library import Definitions, Mops, MultiDefinitions, Switches
+from commandlines.stream import parse_stream
+from commandlines.tokenizer import ParseResult, is_bytes_argv, tokenize
+
+# TESTS OVERVIEW: bytes mode parsing tests
+
+test_command_1 = "executable subcmd -s --long -n shortdef --name longdef --nameeq=longdefeq lastpos"
+test_command_2 = "executable -o path1 -o path2 -t --flag"
+test_command_3 = "executable -mops -- -tlx lastpos"
+test_command_4 = "executable -h --verbose --version"
+
+
+def create_argv(argstring):
+    return shlex.split(argstring)[1:]
+
+
+def create_argvb(argstring):
+    return [argument.encode("utf-8") for argument in create_argv(argstring)]
+
+
+def encode_set(strings):
+    return set(string.encode("utf-8") for string in strings)
+
+
+def encode_dict(dictionary):
+    encoded = {}
+    for key, value in dictionary.items():
+        if isinstance(value, list):
+            encoded[key.encode("utf-8")] = [item.encode("utf-8") for item in value]
+        else:
+            encoded[key.encode("utf-8")] = value.encode("utf-8")
+    return encoded
+
+# BEGIN TESTS
+
+
+def test_is_bytes_argv():
+    assert is_bytes_argv([b"-s"]) is True
+    assert is_bytes_argv(["-s"]) is False
+    assert is_bytes_argv([]) is False
+
+
+def test_tokenize_bytes_matches_strings():
+    for command in (test_command_1, test_command_2, test_command_3):
+        string_tokens = tokenize(create_argv(command))
+        bytes_tokens = tokenize(create_argvb(command))
+        assert len(string_tokens) == len(bytes_tokens)
+        for (kind1, key1, value1, position1, value_position1), (kind2, key2, value2, position2, value_position2) \
+                in zip(string_tokens, bytes_tokens):
+            assert kind1 == kind2
+            assert key1.encode("utf-8") == key2
+            assert (value1 is None and value2 is None) or value1.encode("utf-8") == value2
+            assert position1 == position2
+            assert value_position1 == value_position2
+
+
+def test_command_bytes_containers_match_strings():
+    for command in (test_command_1, test_command_2, test_command_3, test_command_4):
+        c = Command.from_argv(create_argv(command))
+        cb = Command.from_argv(create_argvb(command))
+        assert cb.arguments == create_argvb(command)
+        assert cb.switches == encode_set(c.switches)
+        assert cb.mops == encode_set(c.mops)
+        assert cb.defs == encode_dict(c.defs)
+        assert cb.mdefs == encode_dict(c.mdefs)
+
+
+def test_containers_bytes_match_strings():
+    for command in (test_command_1, test_command_2, test_command_3, test_command_4):
+        argv = create_argv(command)
+        argvb = create_argvb(command)
+        assert Switches(argvb) == encode_set(Switches(argv))
+        assert Mops(argvb) == encode_set(Mops(argv))
+        assert Definitions(argvb) == encode_dict(Definitions(argv))
+        assert MultiDefinitions(argvb) == encode_dict(MultiDefinitions(argv))
+
+
+def test_containers_bytes_keys():
+    argvb = [b"-abc", b"-o", b"x", b"-o", b"y"]
+    assert Switches(argvb) == set([b"abc", b"o"])
+    assert Mops(argvb) == set([b"a", b"b", b"c"])
+    assert Mops(argvb).contains((b"a", b"c"))
+    assert Definitions(argvb) == {b"o": b"y"}
+    assert MultiDefinitions(argvb) == {b"o": [b"x", b"y"]}
+
+
+def test_command_bytes_lazy():
+    cb = Command.from_argv(create_argvb(test_command_2), lazy=True)
+    assert cb.mdefs == {b"o": [b"path1", b"path2"]}
+    assert cb.has_mops is False
+
+
+def test_command_bytes_methods():
+    cb = Command.from_argv(create_argvb(test_command_1))
+    assert cb.contains_switches(b"s", b"long")
+    assert cb.contains_definitions(b"name")
+    assert cb.get_definition(b"nameeq") == b"longdefeq"
+    assert cb.get_arg_after(b"-n") == b"shortdef"
+    assert cb.arg0 == b"subcmd"
+    assert cb.arg4 == b"shortdef"
+    assert Command.from_argv([b"-s"]).arg4 == b""
+    with pytest.raises(MissingDictionaryKeyError):
+        cb.get_definition(b"missing")
+    with pytest.raises(MissingArgumentError):
+        cb.get_arg_after(b"missing")
+
+
+def test_command_bytes_mops():
+    cb = Command.from_argv(create_argvb(test_command_3))
+    assert cb.mops == set([b"m", b"o", b"p", b"s", b"t", b"l", b"x"])
+    assert cb.contains_mops(b"m", b"x")
+    assert not cb.contains_mops(b"q")
+
+
+def test_command_bytes_double_dash():
+    cb = Command.from_argv(create_argvb(test_command_3))
+    assert cb.has_double_dash()
+    assert cb.get_double_dash_args() == [b"-tlx", b"lastpos"]
+    assert not Command.from_argv(create_argvb(test_command_1)).has_double_dash()
+
+
+def test_command_bytes_standard_requests():
+    cb = Command.from_argv(create_argvb(test_command_4))
+    assert cb.is_help_request()
+    assert cb.is_verbose_request()
+    assert cb.is_version_request()
+    assert not cb.is_quiet_request()
+
+
+def test_command_bytes_undecodable_argument():
+    cb = Command.from_argv([b"--name", b"caf\xe9"])
+    assert cb.get_definition(b"name") == b"caf\xe9"
+    assert "caf" in cb.obj_string()
+    assert "caf" in repr(cb.arguments)
+
+
+def test_command_bytes_spec_and_aliases():
+    spec = OptionSpec().add_flag("verbose", "v").add_option("output", "o").add_repeatable_option("I").compile()
+    cb = Command.from_argv([b"-v", b"-o", b"out", b"-I", b"a", b"-I", b"b", b"-rnj"], spec=spec)
+    assert cb.switches == set([b"verbose"])
+    assert cb.defs == {b"output": b"out", b"I": b"b"}
+    assert cb.mdefs == {b"I": [b"a", b"b"]}
+    assert cb.mops == set([b"r", b"n", b"j"])
+    aliases = OptionAliases((b"output", b"o"))
+    cb = Command.from_argv([b"-o", b"out"], aliases=aliases)
+    assert cb.get_definition(b"o") == b"out"
+    assert cb.defs == {b"output": b"out"}
+
+
+def test_command_bytes_string_aliases():
+    aliases = OptionAliases(("output", "o"), ("verbose", "v"))
+    assert aliases.get_alias_map(True) == {b"output": b"output", b"o": b"output", b"verbose": b"verbose",
+                                           b"v": b"verbose"}
+    assert aliases.canonical(b"o") == b"output"
+    assert b"v" in aliases
+    cb = Command.from_argv([b"-o", b"x", b"-v"], aliases=aliases)
+    assert cb.defs == {b"output": b"x"}
+    assert cb.switches == set([b"output", b"verbose"])
+    assert cb.find_definition(b"output") == b"x"
+    assert cb.get_definition(b"o") == b"x"
+    assert cb.contains_switches(b"v")
+    assert Command.from_argv([b"-o", b"x"], lazy=True, aliases=aliases).defs == {b"output": b"x"}
+    assert ParseResult([b"-o", b"x"], aliases=aliases).events.keys == (b"output",)
+
+
+def test_parse_stream_bytes_mode_aliases():
+    data = b"ls\0-o\0x\0\n"
+    result = next(parse_stream(io.BytesIO(data), b"\n", aliases=OptionAliases(("output", "o")), decode=False))
+    assert dict(result.defs) == {b"output": b"x"}
+
+
+def test_parse_stream_bytes_mode():
+    data = b"ls\0-l\0--color=auto\0\xff\0\n"
+    result = next(parse_stream(io.BytesIO(data), b"\n", decode=False))
+    assert result == ParseResult([b"-l", b"--color=auto", b"\xff"])
+    assert result.switches == frozenset([b"l"])
+    assert dict(result.defs) == {b"color": b"auto"}
+
+
+def test_fsencode_argv_roundtrip():
+    argv = create_argv(test_command_1)
+    cb = Command.from_argv([os.fsencode(argument) for argument in argv])
+    assert [os.fsdecode(argument) for argument in cb.arguments] == argv
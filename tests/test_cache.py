@@ -0,0 +1,144 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+
+import shlex
+import pytest
+
+from commandlines import Command
+from commandlines.cache import ParseCache
+from commandlines.tokenizer import ParseResult
+
+# TESTS OVERVIEW: ParseCache and ParseResult tests
+
+test_command_1 = "executable subcmd -s --long -n shortdef --name longdef --nameeq=longdefeq lastpos"
+test_command_2 = "executable -o path1 -o path2 -t --flag"
+test_command_3 = "executable -mops -- lastpos"
+
+
+def create_argv(argstring):
+    return shlex.split(argstring)[1:]
+
+# BEGIN TESTS
+
+#
+# ParseResult tests
+#
+
+
+def test_parseresult_fields():
+    result = ParseResult(create_argv(test_command_2))
+    assert result.argv == ("-o", "path1", "-o", "path2", "-t", "--flag")
+    assert result.switches == frozenset(["o", "t", "flag"])
+    assert result.mops == 0
+    assert result.mops_other == frozenset()
+    assert dict(result.defs) == {"o": "path2"}
+    assert dict(result.mdefs) == {"o": ("path1", "path2")}
+
+
+def test_parseresult_immutable():
+    result = ParseResult(create_argv(test_command_2))
+    with pytest.raises(AttributeError):
+        result.argv = ()
+    with pytest.raises(AttributeError):
+        result.bogus = 1
+    with pytest.raises(AttributeError):
+        del result.switches
+
+#
+# ParseCache tests
+#
+
+
+def test_parsecache_hits_and_misses():
+    cache = ParseCache(maxsize=4)
+    first = cache.parse(create_argv(test_command_1))
+    second = cache.parse(create_argv(test_command_1))
+    assert first is second
+    assert cache.hits == 1
+    assert cache.misses == 1
+    assert cache.evictions == 0
+    assert len(cache) == 1
+    assert create_argv(test_command_1) in cache
+
+
+def test_parsecache_lru_eviction():
+    cache = ParseCache(maxsize=2)
+    cache.parse(create_argv(test_command_1))
+    cache.parse(create_argv(test_command_2))
+    cache.parse(create_argv(test_command_1))   # test_command_1 becomes most recently used
+    cache.parse(create_argv(test_command_3))   # evicts test_command_2
+    assert len(cache) == 2
+    assert cache.evictions == 1
+    assert create_argv(test_command_1) in cache
+    assert create_argv(test_command_2) not in cache
+    assert create_argv(test_command_3) in cache
+
+
+def test_parsecache_contains_does_not_change_lru_order():
+    cache = ParseCache(maxsize=2)
+    cache.parse(create_argv(test_command_1))
+    cache.parse(create_argv(test_command_2))
+    assert cache.contains(create_argv(test_command_1)) is True
+    cache.parse(create_argv(test_command_3))   # evicts test_command_1
+    assert cache.contains(create_argv(test_command_1)) is False
+    assert cache.stats()["hits"] == 0
+
+
+def test_parsecache_stats_and_clear():
+    cache = ParseCache(maxsize=1)
+    cache.parse(create_argv(test_command_1))
+    cache.parse(create_argv(test_command_2))
+    assert cache.stats() == {"hits": 0, "misses": 2, "evictions": 1, "size": 1, "maxsize": 1}
+    cache.clear()
+    assert cache.stats() == {"hits": 0, "misses": 0, "evictions": 0, "size": 0, "maxsize": 1}
+    cache.parse(create_argv(test_command_1))
+    cache.parse(create_argv(test_command_2))   # evicts test_command_1 after the clear
+    assert cache.stats() == {"hits": 0, "misses": 2, "evictions": 1, "size": 1, "maxsize": 1}
+    assert create_argv(test_command_2) in cache
+
+
+def test_parsecache_invalid_maxsize():
+    with pytest.raises(ValueError):
+        ParseCache(maxsize=0)
+
+
+def test_parsecache_command_matches_uncached():
+    cache = ParseCache()
+    for test_command in (test_command_1, test_command_2, test_command_3):
+        argv = create_argv(test_command)
+        expected = Command.from_argv(argv)
+        for lazy in (False, True):
+            c = Command.from_argv(argv, lazy=lazy, cache=cache)
+            assert c.argv == expected.argv
+            assert c.obj_string() == expected.obj_string()
+    assert cache.hits == 3
+    assert cache.misses == 3
+
+
+def test_parsecache_commands_do_not_share_state():
+    cache = ParseCache()
+    argv = create_argv(test_command_2)
+    first = Command.from_argv(argv, cache=cache)
+    second = Command.from_argv(argv, cache=cache)
+    first.set_defaults({"output": "stdout"})
+    first.switches.add("bogus")
+    first.defs["o"] = "changed"
+    first.mdefs["o"].append("path3")
+    first.argv.append("--late")
+    assert second.defaults == {}
+    assert "bogus" not in second.switches
+    assert second.get_definition("o") == "path2"
+    assert second.get_multiple_definitions("o") == ["path1", "path2"]
+    assert second.argv == argv
+    third = Command.from_argv(argv, cache=cache)
+    assert third.obj_string() == Command.from_argv(argv).obj_string()
+
+
+def test_parsecache_from_argv_list():
+    cache = ParseCache()
+    argv_list = [create_argv(test_command_1), create_argv(test_command_1), create_argv(test_command_2)]
+    commands = Command.from_argv_list(argv_list, cache=cache)
+    assert [c.argv for c in commands] == argv_list
+    assert cache.hits == 1
+    assert cache.misses == 2
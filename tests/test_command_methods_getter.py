@@ -191,3 +191,126 @@ def test_command_get_doubledash_not_present_2():
     c = Command()
     with pytest.raises(MissingArgumentError):
         c.get_double_dash_args()
+
+
+def test_command_get_doubledash_view():
+    set_sysargv(test_command_11)
+    c = Command()
+    view = c.get_double_dash_view()
+    assert len(view) == 4
+    assert view == ['lastpos', '-n', '--long', 'another']
+    assert view[0] == 'lastpos'
+    assert view[-1] == 'another'
+    assert view[1:3] == ['-n', '--long']
+    assert '--long' in view
+    assert '-t' not in view
+    assert list(view) == ['lastpos', '-n', '--long', 'another']
+    assert view.to_list() == c.get_double_dash_args()
+    assert view.index('--long') == 2
+    with pytest.raises(IndexError):
+        view[4]
+
+
+def test_command_get_doubledash_view_no_copy():
+    set_sysargv(test_command_11)
+    c = Command()
+    view = c.get_double_dash_view()
+    assert view._arguments is c.arguments
+    with pytest.raises(TypeError):
+        view[0] = 'changed'
+
+
+def test_command_get_doubledash_view_not_present():
+    set_sysargv(test_command_1)
+    c = Command()
+    with pytest.raises(MissingArgumentError):
+        c.get_double_dash_view()
+
+
+def test_command_get_pre_doubledash_view():
+    set_sysargv(test_command_12)
+    c = Command()
+    assert c.get_pre_double_dash_view() == ['--file', 'path']
+    set_sysargv(test_command_1)
+    c = Command()
+    assert c.get_pre_double_dash_view() == c.arguments
+
+
+def test_command_get_doubledash_lazy():
+    set_sysargv(test_command_12)
+    c = Command(lazy=True)
+    assert c.has_double_dash() is True
+    assert c.get_double_dash_view() == ['lastpos', '--test', 'path2', 'another']
+
+
+def test_command_get_doubledash_after_arguments_modified():
+    set_sysargv(test_command_12)
+    c = Command()
+    c.arguments.insert(0, 'first')
+    assert c.arguments.get_double_dash_position() == 3
+    assert c.get_double_dash_args() == ['lastpos', '--test', 'path2', 'another']
+    c.arguments.remove('--')
+    assert c.has_double_dash() is False
+
+
+def test_command_get_option_positions():
+    set_sysargv(test_command_1)
+    c = Command()
+    assert c.get_option_positions("s") == (1,)
+    assert c.get_option_positions("name") == (5,)
+    assert c.get_option_positions("nameeq") == (7,)
+    with pytest.raises(MissingArgumentError):
+        c.get_option_positions("missing")
+
+
+def test_command_get_option_positions_repeated():
+    c = Command.from_argv(["-o", "one", "lastpos", "--o=two", "-o", "three"])
+    assert c.get_option_positions("o") == (0, 3, 4)
+    c.arguments.insert(0, "first")   # positions are parse positions
+    assert c.get_option_positions("o") == (0, 3, 4)
+
+
+def test_command_get_definition_occurrences():
+    c = Command.from_argv(["-o", "one", "lastpos", "--o=two", "-s", "--name", "value"])
+    assert c.get_definition_occurrences("o") == ((0, 1, "one"), (3, 3, "two"))
+    assert c.get_definition_occurrences("name") == ((5, 6, "value"),)
+    assert c.get_definition("o") == c.get_definition_occurrences("o")[-1][2]
+    with pytest.raises(MissingDictionaryKeyError):
+        c.get_definition_occurrences("s")
+    with pytest.raises(MissingDictionaryKeyError):
+        c.get_definition_occurrences("missing")
+
+
+def test_command_find_methods():
+    c = Command.from_argv(["-o", "one", "lastpos", "--o=two", "-s", "--name", "value"])
+    c.set_defaults({"output": "stdout"})
+    assert c.find_definition("name") == "value"
+    assert c.find_definition("missing") is None
+    assert c.find_definition("missing", "default") == "default"
+    assert c.find_multiple_definitions("o") == ["one", "two"]
+    assert c.find_multiple_definitions("name") is None
+    assert c.find_default("output") == "stdout"
+    assert c.find_default("missing", "stderr") == "stderr"
+    assert c.find_arg_after("--name") == "value"
+    assert c.find_arg_after("value") is None
+    assert c.find_arg_after("missing", "default") == "default"
+    assert c.find_option_positions("o") == (0, 3)
+    assert c.find_option_positions("missing") is None
+    assert c.find_definition_occurrences("name") == ((5, 6, "value"),)
+    assert c.find_definition_occurrences("s", ()) == ()
+
+
+def test_command_exception_messages():
+    c = Command.from_argv(["-s"])
+    with pytest.raises(MissingDictionaryKeyError) as excinfo:
+        c.get_definition("missing")
+    assert excinfo.value.dict_key == "missing"
+    assert str(excinfo.value) == "Missing dictionary key exception: the dictionary key 'missing' was not found."
+    assert excinfo.value.error_message == str(excinfo.value)
+    with pytest.raises(MissingArgumentError) as excinfo:
+        c.get_arg_after("missing")
+    assert excinfo.value.argument == "missing"
+    assert str(excinfo.value) == "Missing argument exception: the argument 'missing' was not found."
+    with pytest.raises(IndexOutOfRangeError) as excinfo:
+        c.arguments.get_argument(5)
+    assert str(excinfo.value) == "Index out of range exception.  The requested index fell outside of the index range."
@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+
+import sys
+import shlex
+import pytest
+
+from commandlines import Command
+
+# TEST OVERVIEW: Command object instantiation from explicit argument lists
+
+test_command_1 = "executable subcmd -s --long -n shortdef --name longdef --nameeq=longdefeq lastpos"
+test_command_2 = "executable -o path1 -o path2 -t --flag"
+test_command_3 = "executable -mops -- lastpos"
+test_command_empty_1 = "executable"
+
+
+def set_sysargv(argstring):
+    sys.argv = shlex.split(argstring)
+
+
+def create_argv(argstring):
+    return shlex.split(argstring)[1:]
+
+# BEGIN TESTS
+
+
+def test_commandobj_from_argv_matches_sysargv_instantiation():
+    for test_command in (test_command_1, test_command_2, test_command_3, test_command_empty_1):
+        set_sysargv(test_command)
+        expected = Command()
+        set_sysargv("bogus --other")
+        c = Command.from_argv(create_argv(test_command))
+        assert c.argv == expected.argv
+        assert c.obj_string() == expected.obj_string()
+
+
+def test_commandobj_from_argv_does_not_read_sysargv():
+    set_sysargv(test_command_1)
+    c = Command.from_argv(create_argv(test_command_2))
+    assert c.argv == ["-o", "path1", "-o", "path2", "-t", "--flag"]
+    assert sys.argv == shlex.split(test_command_1)
+
+
+def test_commandobj_from_argv_copies_argument_list():
+    argv = create_argv(test_command_2)
+    c = Command.from_argv(argv)
+    argv.append("--late")
+    assert c.argc == 6
+    assert "--late" not in c.argv
+
+
+def test_commandobj_from_argv_accepts_tuple():
+    c = Command.from_argv(tuple(create_argv(test_command_2)))
+    assert c.argv == create_argv(test_command_2)
+    assert isinstance(c.argv, list)
+
+
+def test_commandobj_from_argv_lazy():
+    c = Command.from_argv(create_argv(test_command_1), lazy=True)
+    assert "switches" not in c.__dict__
+    assert c.contains_switches("s", "long") is True
+
+
+def test_commandobj_from_argv_list():
+    argv_list = [create_argv(test_command_1), create_argv(test_command_2), create_argv(test_command_empty_1)]
+    commands = Command.from_argv_list(argv_list)
+    assert len(commands) == 3
+    for c, argv in zip(commands, argv_list):
+        assert c.argv == argv
+        assert c.obj_string() == Command.from_argv(argv).obj_string()
+    assert commands[1].get_multiple_definitions("o") == ["path1", "path2"]
+
+
+def test_commandobj_from_argv_list_generator():
+    commands = Command.from_argv_list(create_argv(x) for x in (test_command_2, test_command_3))
+    assert len(commands) == 2
+    assert commands[1].has_double_dash() is True
+
+
+def test_commandobj_from_argv_list_independent_defaults():
+    commands = Command.from_argv_list([create_argv(test_command_2), create_argv(test_command_2)])
+    commands[0].set_defaults({"o": "default"})
+    assert commands[1].defaults == {}
@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+
+import sys
+import shlex
+import pytest
+
+from commandlines import Command
+
+# TEST OVERVIEW: lazy mode Command object instantiation tests
+
+test_command_1 = "executable subcmd -s --long -n shortdef --name longdef --nameeq=longdefeq -o one -o two lastpos"
+test_command_empty_1 = "executable"
+
+
+def set_sysargv(argstring):
+    sys.argv = shlex.split(argstring)
+
+# BEGIN TESTS
+
+
+def test_commandobj_lazy_defers_attributes():
+    set_sysargv(test_command_1)
+    c = Command(lazy=True)
+    assert "switches" not in c.__dict__
+    assert "defs" not in c.__dict__
+    assert "arguments" not in c.__dict__
+    assert c.argc == 13
+    assert c.defaults == {}
+
+
+def test_commandobj_lazy_false_values_parse_eagerly():
+    set_sysargv(test_command_1)
+    for lazy in (False, 0, None):
+        c = Command(lazy=lazy)
+        assert "switches" in c.__dict__
+        assert "arguments" in c.__dict__
+
+
+def test_commandobj_lazy_caches_attribute_on_first_access():
+    set_sysargv(test_command_1)
+    c = Command(lazy=True)
+    switches = c.switches
+    assert "switches" in c.__dict__
+    assert c.switches is switches
+    assert "mops" not in c.__dict__   # other containers are not built by the switches access
+
+
+def test_commandobj_lazy_subcmd_does_not_parse_options():
+    set_sysargv(test_command_1)
+    c = Command(lazy=True)
+    assert c.subcmd == "subcmd"
+    assert "_parsed" not in c.__dict__
+
+
+def test_commandobj_lazy_matches_eager():
+    set_sysargv(test_command_1)
+    eager = Command()
+    lazy = Command(lazy=True)
+    for name in ("arguments", "switches", "mops", "defs", "mdefs", "arg0", "arg1", "arg2", "arg3", "arg4", "arglp",
+                 "subcmd", "subsubcmd", "has_args", "has_switches", "has_mops", "has_defs", "has_mdefs"):
+        assert getattr(lazy, name) == getattr(eager, name)
+    assert lazy.obj_string() == eager.obj_string()
+
+
+def test_commandobj_lazy_matches_eager_empty():
+    set_sysargv(test_command_empty_1)
+    eager = Command()
+    lazy = Command(lazy=True)
+    assert lazy.has_args is False
+    assert lazy.arg0 == ""
+    assert lazy.arglp == ""
+    assert lazy.obj_string() == eager.obj_string()
+
+
+def test_commandobj_lazy_methods():
+    set_sysargv(test_command_1)
+    c = Command(lazy=True)
+    assert c.is_help_request() is False
+    assert c.contains_switches("s", "long") is True
+    assert c.get_definition("name") == "longdef"
+    assert c.get_multiple_definitions("o") == ["one", "two"]
+
+
+def test_commandobj_lazy_missing_attribute():
+    set_sysargv(test_command_1)
+    c = Command(lazy=True)
+    with pytest.raises(AttributeError):
+        c.bogus
+
+
+def test_commandobj_eager_does_not_build_parse_result():
+    set_sysargv(test_command_1)
+    c = Command()
+    assert "_parsed" not in c.__dict__   # shared ParseResult objects are built for cached parses only
+    assert "flags" not in c.__dict__
+    assert "_events" not in c.__dict__
+    assert c.is_help_request() is False
+    assert c.get_option_positions("o") == (8, 10)
+    assert "flags" in c.__dict__
+    assert "_events" in c.__dict__
+    assert "_parsed" not in c.__dict__
+
+
+def test_commandobj_lazy_events_match_eager():
+    set_sysargv(test_command_1)
+    eager = Command()
+    lazy = Command(lazy=True)
+    assert lazy.get_option_positions("name") == eager.get_option_positions("name")
+    assert lazy.get_definition_occurrences("o") == eager.get_definition_occurrences("o")
+    assert lazy._events == eager._events
+    assert lazy.flags == eager.flags
@@ -0,0 +1,214 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+
+import os
+import shlex
+import pytest
+from array import array
+
+from commandlines import Command
+from commandlines.cache import ParseCache
+from commandlines.spec import OptionSpec
+from commandlines.convert import CONVERTERS, get_converter, to_bool, to_duration, to_numeric_array, to_path
+from commandlines.exceptions import ConversionError, MissingDictionaryKeyError
+
+# TESTS OVERVIEW: typed option value conversion tests
+
+test_command_1 = "executable --port 8080 --timeout 1m30s -r 0.5 -I 1 -I 2 --name value --debug yes"
+test_command_2 = "executable --port http --timeout soon -I 1 -I x -I y --debug maybe"
+
+
+def create_argv(argstring):
+    return shlex.split(argstring)[1:]
+
+
+def create_spec():
+    spec = OptionSpec()
+    spec.add_option("port", "p").add_option("timeout").add_option("ratio", "r").add_option("name")
+    spec.add_option("debug").add_repeatable_option("include", "I")
+    spec.set_type("p", int).set_type("timeout", "duration").set_type("ratio", "float").set_type("debug", "bool")
+    spec.set_type("include", int)
+    return spec.compile()
+
+
+# BEGIN TESTS
+
+
+def test_convert_to_bool():
+    assert to_bool("yes") is True
+    assert to_bool("ON") is True
+    assert to_bool(b"1") is True
+    assert to_bool("false") is False
+    assert to_bool("n") is False
+    with pytest.raises(ValueError):
+        to_bool("maybe")
+
+
+def test_convert_to_duration():
+    assert to_duration("90") == 90.0
+    assert to_duration("1.5") == 1.5
+    assert to_duration("500ms") == 0.5
+    assert to_duration("1h30m") == 5400.0
+    assert to_duration("2d") == 172800.0
+    assert to_duration(b"1w") == 604800.0
+    for value in ("", "soon", "10x", "1h 30m", "m", "1h30"):
+        with pytest.raises(ValueError):
+            to_duration(value)
+
+
+def test_convert_to_path():
+    assert to_path("~/file") == os.path.expanduser("~/file")
+    assert to_path("relative/file") == "relative/file"
+    with pytest.raises(ValueError):
+        to_path("")
+
+
+def test_convert_get_converter():
+    assert get_converter("int") is int
+    assert get_converter(to_bool) is to_bool
+    assert sorted(CONVERTERS) == ["bool", "duration", "float", "int", "path"]
+    with pytest.raises(ValueError):
+        get_converter("complex")
+
+
+def test_convert_spec_set_type_undeclared():
+    spec = OptionSpec().add_flag("verbose").set_type("verbose", "bool")
+    with pytest.raises(ValueError):
+        spec.compile()
+    with pytest.raises(ValueError):
+        OptionSpec().add_option("port").set_type("port", "unknown")
+
+
+def test_convert_get_typed_definition():
+    c = Command.from_argv(create_argv(test_command_1), spec=create_spec())
+    assert c.get_typed_definition("port") == 8080
+    assert c.get_typed_definition("timeout") == 90.0
+    assert c.get_typed_definition("ratio") == 0.5
+    assert c.get_typed_definition("debug") is True
+    assert c.get_typed_definition("name") == "value"   # no declared type
+    assert c.get_definition("port") == "8080"
+    with pytest.raises(MissingDictionaryKeyError):
+        c.get_typed_definition("missing")
+
+
+def test_convert_get_typed_multiple_definitions():
+    c = Command.from_argv(create_argv(test_command_1), spec=create_spec())
+    values = c.get_typed_multiple_definitions("include")
+    assert values == [1, 2]
+    values.append(3)   # a new list is returned for each call
+    assert c.get_typed_multiple_definitions("include") == [1, 2]
+
+
+def test_convert_without_spec():
+    c = Command.from_argv(create_argv(test_command_1))
+    assert c.get_typed_definition("port") == "8080"
+    assert c.get_typed_multiple_definitions("I") == ["1", "2"]
+
+
+def test_convert_errors():
+    c = Command.from_argv(create_argv(test_command_2), spec=create_spec())
+    with pytest.raises(ConversionError) as excinfo:
+        c.get_typed_definition("port")
+    assert [error[:2] for error in excinfo.value.errors] == [("port", "http")]
+    assert "'http' of the option 'port'" in str(excinfo.value)
+    with pytest.raises(ConversionError) as excinfo:
+        c.get_typed_multiple_definitions("include")
+    assert [error[:2] for error in excinfo.value.errors] == [("include", "x"), ("include", "y")]
+    with pytest.raises(ValueError):
+        c.get_typed_definition("timeout")
+
+
+def test_convert_definitions():
+    c = Command.from_argv(create_argv(test_command_1), spec=create_spec())
+    definitions, multiple_definitions = c.convert_definitions()
+    assert definitions == {"port": 8080, "timeout": 90.0, "ratio": 0.5, "include": 2, "name": "value", "debug": True}
+    assert multiple_definitions == {"include": [1, 2]}
+
+
+def test_convert_definitions_aggregate_errors():
+    c = Command.from_argv(create_argv(test_command_2), spec=create_spec())
+    with pytest.raises(ConversionError) as excinfo:
+        c.convert_definitions()
+    assert sorted(error[:2] for error in excinfo.value.errors) == [("debug", "maybe"), ("include", "x"),
+                                                                    ("include", "y"), ("port", "http"),
+                                                                    ("timeout", "soon")]
+
+
+def test_convert_cached_on_parse_result():
+    calls = []
+
+    def counting_int(value):
+        calls.append(value)
+        return int(value)
+
+    spec = OptionSpec().add_option("port").set_type("port", counting_int).compile()
+    cache = ParseCache()
+    for c in Command.from_argv_list([["--port", "80"], ["--port", "80"]], cache=cache, spec=spec):
+        assert c.get_typed_definition("port") == 80
+        assert c.get_typed_definition("port") == 80
+    assert calls == ["80"]
+    c = Command.from_parse_result(cache.parse(["--port", "80"], spec), spec=spec)
+    assert c.get_typed_definition("port") == 80
+    assert calls == ["80"]
+
+
+def test_convert_bytes_mode():
+    argv = [argument.encode("utf-8") for argument in create_argv(test_command_1)]
+    c = Command.from_argv(argv, spec=create_spec())
+    assert c.get_typed_definition(b"port") == 8080
+    assert c.get_typed_definition(b"debug") is True
+    assert c.get_typed_multiple_definitions(b"include") == [1, 2]
+
+
+def test_convert_to_numeric_array():
+    weights = to_numeric_array(["0.1", "0.3", "2"], "d", use_numpy=False)
+    assert isinstance(weights, array)
+    assert weights.tolist() == [0.1, 0.3, 2.0]
+    assert weights.typecode == "d"
+    assert to_numeric_array([b"1", b"2"], "i", use_numpy=False).tolist() == [1, 2]
+    with pytest.raises(ValueError):
+        to_numeric_array(["1"], "u")
+    with pytest.raises(ValueError):
+        to_numeric_array(["1.5"], "i", use_numpy=False)
+
+
+def test_convert_get_numeric_definitions():
+    c = Command.from_argv(["--weight=0.1", "--weight=0.3", "--id", "5", "--id", "x", "--seed", "7"])
+    weights = c.get_numeric_definitions("weight", use_numpy=False)
+    assert weights.tolist() == [0.1, 0.3]
+    assert c.get_numeric_definitions("seed", "l", use_numpy=False).tolist() == [7]   # single use option
+    with pytest.raises(ConversionError) as excinfo:
+        c.get_numeric_definitions("id", "l", use_numpy=False)
+    assert excinfo.value.errors[0][:2] == ("id", "x")
+    with pytest.raises(MissingDictionaryKeyError):
+        c.get_numeric_definitions("missing")
+    with pytest.raises(OverflowError):
+        Command.from_argv(["--n", "1000", "--n", "1"]).get_numeric_definitions("n", "b", use_numpy=False)
+
+
+def test_convert_numeric_arrays_numpy():
+    numpy = pytest.importorskip("numpy")
+    c = Command.from_argv(["--weight=0.1", "--weight=0.3", "--id", " 5", "--id", "6"])
+    weights = c.get_numeric_definitions("weight")
+    assert isinstance(weights, numpy.ndarray)
+    assert weights.dtype == numpy.dtype("d")
+    assert weights.tolist() == [0.1, 0.3]
+    assert c.get_numeric_definitions("id", "l", use_numpy=True).tolist() == [5, 6]
+
+
+def test_convert_numeric_arrays_without_numpy():
+    try:
+        import numpy
+    except ImportError:
+        with pytest.raises(ImportError):
+            to_numeric_array(["1"], use_numpy=True)
+        assert isinstance(to_numeric_array(["1"]), array)
+
+
+def test_convert_alias_lookups():
+    c = Command.from_argv(create_argv(test_command_1), spec=create_spec())
+    assert c.get_typed_definition("p") == 8080
+    assert c.get_typed_definition("r") == 0.5
+    assert c.get_typed_multiple_definitions("I") == [1, 2]
+    assert list(c.get_numeric_definitions("I", "l", use_numpy=False)) == [1, 2]
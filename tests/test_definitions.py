@@ -146,3 +146,10 @@ def test_definitions_get_def_arg_emptyargs():
     with pytest.raises(MissingDictionaryKeyError):
         defin.get_def_argument("bogus")
 
+
+
+def test_definitions_find_def_argument():
+    defs = Definitions(create_argv(test_command_1))
+    assert defs.find_def_argument("name") == "longdef"
+    assert defs.find_def_argument("missing") is None
+    assert defs.find_def_argument("missing", "default") == "default"
@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+
+import pickle
+import shlex
+import sys
+import pytest
+
+from commandlines import Command
+from commandlines.aliases import OptionAliases
+from commandlines.cache import ParseCache
+from commandlines.flags import OptionFlags, FLAG_HELP, FLAG_QUIET, FLAG_USAGE, FLAG_VERBOSE, FLAG_VERSION, FLAG_USER, \
+    STANDARD_FLAGS
+from commandlines.tokenizer import ParseResult
+
+# TESTS OVERVIEW: switch flag word tests
+
+test_command_1 = "executable -h --verbose lastpos"
+test_command_2 = "executable --quiet --usage -v"
+test_command_3 = "executable --debug -c --verbose=2 -- --version"
+test_command_4 = "executable subcmd lastpos"
+
+
+def set_sysargv(argstring):
+    sys.argv = shlex.split(argstring)
+
+
+def create_argv(argstring):
+    return shlex.split(argstring)[1:]
+
+
+def create_flags():
+    return OptionFlags(("debug", "d"), ("color", "c"))
+
+
+# BEGIN TESTS
+
+
+def test_flags_parse_result():
+    assert ParseResult(create_argv(test_command_1)).flags == FLAG_HELP | FLAG_VERBOSE
+    assert ParseResult(create_argv(test_command_2)).flags == FLAG_QUIET | FLAG_USAGE | FLAG_VERSION
+    assert ParseResult(create_argv(test_command_3)).flags == 0   # definition and post double dash options
+    assert ParseResult(create_argv(test_command_4)).flags == 0
+
+
+def test_flags_parse_result_pickle():
+    result = ParseResult(create_argv(test_command_2))
+    assert pickle.loads(pickle.dumps(result)).flags == result.flags
+
+
+def test_flags_parse_result_bytes_mode():
+    argv = [argument.encode("utf-8") for argument in create_argv(test_command_1)]
+    assert ParseResult(argv).flags == FLAG_HELP | FLAG_VERBOSE
+
+
+def test_flags_command_standard():
+    set_sysargv(test_command_1)
+    c = Command()
+    assert c.flags == FLAG_HELP | FLAG_VERBOSE
+    assert c.is_help_request() is True
+    assert c.is_verbose_request() is True
+    assert c.is_quiet_request() is False
+    assert Command(lazy=True).flags == c.flags
+
+
+def test_flags_command_registry():
+    flags = create_flags()
+    c = Command.from_argv(create_argv(test_command_3) + ["-d"], flags=flags)
+    assert c.flags == flags.mask("debug", "color")
+    c = Command.from_argv(["-v", "--color"], lazy=True, flags=flags)
+    assert c.flags == flags.mask("version", "color")
+    assert c.is_version_request() is True
+
+
+def test_flags_command_registry_from_argv_list_and_cache():
+    flags = create_flags()
+    cache = ParseCache()
+    commands = Command.from_argv_list([["--debug"], ["-h"]], cache=cache, flags=flags)
+    assert [c.flags for c in commands] == [flags.mask("debug"), FLAG_HELP]
+    result = cache.parse(["--debug"])
+    assert Command.from_parse_result(result, flags=flags).flags == flags.mask("d")
+
+
+def test_flags_command_aliases():
+    aliases = OptionAliases(("debug", "dbg"))
+    c = Command.from_argv(["--dbg"], aliases=aliases, flags=OptionFlags(("debug",)))
+    assert c.flags == FLAG_USER
+
+
+def test_flags_matches_flags():
+    c = Command.from_argv(create_argv(test_command_1))
+    assert c.matches_flags(FLAG_VERBOSE, FLAG_QUIET) is True
+    assert c.matches_flags(FLAG_VERBOSE | FLAG_HELP) is True
+    assert c.matches_flags(FLAG_VERBOSE | FLAG_VERSION) is False
+    c = Command.from_argv(["--verbose", "--quiet"])
+    assert c.matches_flags(FLAG_VERBOSE, FLAG_QUIET) is False
+    assert c.matches_flags(0, FLAG_HELP) is True
+
+
+def test_flags_registry_bits():
+    flags = create_flags()
+    assert flags.mask("debug") == FLAG_USER
+    assert flags.mask("d") == FLAG_USER
+    assert flags.mask("color") == FLAG_USER << 1
+    assert flags.mask("h", "verbose") == FLAG_HELP | FLAG_VERBOSE
+    assert "c" in flags
+    assert "c" not in STANDARD_FLAGS
+    assert flags.flags_of(frozenset(("debug", "other"))) == FLAG_USER
+    assert flags.flags_of(frozenset((b"c",)), bytes_mode=True) == FLAG_USER << 1
+
+
+def test_flags_registry_errors():
+    with pytest.raises(ValueError):
+        OptionFlags(("debug",), ("d", "debug"))
+    with pytest.raises(ValueError):
+        OptionFlags(("help",))
+    with pytest.raises(ValueError):
+        OptionFlags(())
+    with pytest.raises(ValueError):
+        create_flags().mask("missing")
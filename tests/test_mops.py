@@ -5,7 +5,9 @@
 import shlex
 import pytest
 
+from commandlines import Command
 from commandlines.library import Mops
+from commandlines.tokenizer import mops_mask, mops_from_mask, MOPS_BITS
 
 # TESTS OVERVIEW: Command object getter method tests
 
@@ -85,3 +87,59 @@ def test_mops_contains():
     assert mops_set.contains(("m", "o", "p", "s")) == True
     assert mops_set.contains(("b")) == False       # switch character that is not present should yield False
     assert mops_set.contains(("m", "b")) == False  # single missing switch character should yield False
+
+
+def test_mops_contains_non_ascii_fallback():
+    mops_set = Mops(["-a_", "-\u00e9b"])
+    assert mops_set == {"a", "_", "\u00e9", "b"}
+    assert mops_set.contains(("a", "_")) == True
+    assert mops_set.contains(("\u00e9", "b")) == True
+    assert mops_set.contains(("?",)) == False
+    assert mops_set.contains(("a", "?")) == False
+
+
+def test_mops_contains_multicharacter_needle():
+    mops_set = Mops(create_argv(test_command_9))
+    assert mops_set.contains(("mo",)) == False
+
+
+def test_mops_mask():
+    mops_set = Mops(create_argv(test_command_9))
+    assert mops_set.mask == MOPS_BITS["m"] | MOPS_BITS["o"] | MOPS_BITS["p"] | MOPS_BITS["s"]
+    assert mops_set.contains_mask(MOPS_BITS["m"] | MOPS_BITS["s"]) == True
+    assert mops_set.contains_mask(MOPS_BITS["m"] | MOPS_BITS["t"]) == False
+    assert mops_set.contains_mask(0) == True
+
+
+def test_mops_mask_invalidated_by_modification():
+    mops_set = Mops(create_argv(test_command_9))
+    assert mops_set.contains(("t",)) == False
+    mops_set.add("t")
+    assert mops_set.contains(("t",)) == True
+    mops_set.discard("m")
+    assert mops_set.contains(("m",)) == False
+    mops_set |= {"z"}
+    assert mops_set.contains(("z", "t")) == True
+    mops_set.clear()
+    assert mops_set.mask == 0
+
+
+def test_mops_mask_functions():
+    mask, other = mops_mask("aZ9_")
+    assert mask == MOPS_BITS["a"] | MOPS_BITS["Z"] | MOPS_BITS["9"]
+    assert other == frozenset(["_"])
+    assert sorted(mops_from_mask(mask)) == ["9", "Z", "a"]
+    assert mops_mask("") == (0, frozenset())
+    assert mops_from_mask(0) == []
+
+
+def test_mops_command_from_mask():
+    c = Command.from_argv(create_argv(test_command_11))
+    assert isinstance(c.mops, Mops)
+    assert c.mops == {"m", "o", "p", "s", "t", "e"}
+    assert c.contains_mops("m", "t") == True
+    assert c.contains_mops("m", "z") == False
+    assert c._parsed.mops == c.mops.mask
+    lazy = Command.from_argv(create_argv(test_command_11), lazy=True)
+    assert lazy.has_mops is True
+    assert "mops" not in lazy.__dict__
@@ -0,0 +1,155 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+
+import os
+import shlex
+import pytest
+
+from commandlines.aliases import OptionAliases
+from commandlines.query import Query
+from commandlines.spec import OptionSpec
+from commandlines.process import ProcessScanner, ProcessTable
+from commandlines.tokenizer import ParseResult
+
+# TESTS OVERVIEW: ProcessScanner and ProcessTable tests with a fake /proc directory tree
+
+test_command_1 = "java -Xmx512m --config=/etc/app.conf -jar app.jar"
+test_command_2 = "nginx -c /etc/nginx.conf -g daemon"
+test_command_3 = "python -m http.server --bind 127.0.0.1"
+
+
+def create_argv(argstring):
+    return shlex.split(argstring)
+
+
+def write_process(proc_root, pid, argstring):
+    process_dir = proc_root.join(str(pid))
+    process_dir.ensure(dir=True)
+    data = b"".join(argument.encode("utf-8") + b"\0" for argument in create_argv(argstring))
+    process_dir.join("cmdline").write_binary(data)
+
+
+@pytest.fixture
+def proc_root(tmpdir):
+    root = tmpdir.join("proc")
+    write_process(root, 1, test_command_1)
+    write_process(root, 22, test_command_2)
+    write_process(root, 333, test_command_3)
+    root.join("2").ensure(dir=True)
+    root.join("2").join("cmdline").write_binary(b"")   # kernel thread
+    root.join("self").ensure(dir=True)
+    root.join("meminfo").write_binary(b"")
+    return root
+
+# BEGIN TESTS
+
+
+def test_scan_entries(proc_root):
+    table = ProcessScanner(str(proc_root)).scan()
+    assert isinstance(table, ProcessTable)
+    assert len(table) == 3
+    assert table.pids() == [1, 22, 333]
+    assert 2 not in table
+    entry = table[22]
+    assert entry.pid == 22
+    assert entry.executable == "nginx"
+    assert entry.result == ParseResult(create_argv(test_command_2)[1:])
+
+
+def test_scan_entry_command(proc_root):
+    command = ProcessScanner(str(proc_root)).scan()[1].command
+    assert command.contains_definitions("config")
+    assert command.get_definition("config") == "/etc/app.conf"
+    assert command.contains_switches("Xmx512m")
+    assert command.arguments == create_argv(test_command_1)[1:]
+
+
+def test_scan_reuses_unchanged_results(proc_root):
+    scanner = ProcessScanner(str(proc_root))
+    first = scanner.scan()
+    assert scanner.parsed == 3
+    assert scanner.reused == 0
+    write_process(proc_root, 22, test_command_2 + " -q")
+    write_process(proc_root, 4444, test_command_3)
+    second = scanner.scan()
+    assert scanner.parsed == 1
+    assert scanner.reused == 3
+    assert second[1].result is first[1].result
+    assert second[333].result is first[333].result
+    assert second[4444].result is first[333].result
+    assert second[22].result is not first[22].result
+    assert "q" in second[22].result.switches
+
+
+def test_scan_process_exit(proc_root):
+    scanner = ProcessScanner(str(proc_root))
+    scanner.scan()
+    proc_root.join("333").remove()
+    table = scanner.scan()
+    assert table.pids() == [1, 22]
+
+
+def test_scan_unreadable_cmdline(proc_root):
+    proc_root.join("5555").ensure(dir=True)   # process exited after the directory listing
+    assert 5555 not in ProcessScanner(str(proc_root)).scan()
+
+
+def test_table_filter(proc_root):
+    table = ProcessScanner(str(proc_root)).scan()
+    assert [entry.pid for entry in table.filter(Query(definitions=("config",)))] == [1]
+    assert [entry.pid for entry in table.filter(Query(switches=("c", "bind"), mode="any"))] == [22, 333]
+
+
+def test_table_with_switch(proc_root):
+    table = ProcessScanner(str(proc_root)).scan()
+    assert [entry.pid for entry in table.with_switch("jar")] == [1]
+    assert table.with_switch("missing") == []
+
+
+def test_table_get_definitions(proc_root):
+    table = ProcessScanner(str(proc_root)).scan()
+    assert table.get_definitions("config") == {1: "/etc/app.conf"}
+    assert table.get_definitions("c") == {22: "/etc/nginx.conf"}
+
+
+def test_scan_aliases(proc_root):
+    table = ProcessScanner(str(proc_root), aliases=OptionAliases(("config", "c"))).scan()
+    assert table.get_definitions("config") == {1: "/etc/app.conf", 22: "/etc/nginx.conf"}
+    assert table[22].command.get_definition("c") == "/etc/nginx.conf"
+
+
+def test_table_alias_needles(proc_root):
+    table = ProcessScanner(str(proc_root), aliases=OptionAliases(("config", "c"), ("bind", "b"))).scan()
+    assert table.get_definitions("c") == {1: "/etc/app.conf", 22: "/etc/nginx.conf"}
+    assert table.get_definitions("c") == table.get_definitions("config")   # repeated lookups use the cached dicts
+    assert [entry.pid for entry in table.with_switch("b")] == [333]
+
+
+def test_table_spec_alias_needles(proc_root):
+    spec = OptionSpec().add_option("config", "c").add_option("module", "m").compile()
+    table = ProcessScanner(str(proc_root), spec=spec).scan()
+    assert table.get_definitions("c") == {1: "/etc/app.conf", 22: "/etc/nginx.conf"}
+    assert table.get_definitions("m") == {333: "http.server"}
+    assert table[22].command.get_definition("c") == "/etc/nginx.conf"
+
+
+def test_scan_host_proc():
+    if not os.path.isdir("/proc/self"):
+        pytest.skip("the proc file system is not available")
+    table = ProcessScanner().scan()
+    assert os.getpid() in table
+
+
+def test_scan_bytes_mode(proc_root):
+    table = ProcessScanner(str(proc_root), decode=False).scan()
+    assert table[1].executable == b"java"
+    assert table.get_definitions(b"config") == {1: b"/etc/app.conf"}
+    assert table[22].command.get_definition(b"c") == b"/etc/nginx.conf"
+
+
+def test_scan_bytes_mode_aliases(proc_root):
+    table = ProcessScanner(str(proc_root), aliases=OptionAliases(("config", "c")), decode=False).scan()
+    assert table.get_definitions(b"c") == {1: b"/etc/app.conf", 22: b"/etc/nginx.conf"}
+    assert table.get_definitions("config") == {}   # bytes mode needles are bytes
+    assert table[22].command.find_definition(b"config") == b"/etc/nginx.conf"
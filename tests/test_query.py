@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+
+import shlex
+import pytest
+
+from commandlines import Command
+from commandlines.aliases import OptionAliases
+from commandlines.query import Query, ALL, ANY, NONE
+
+# TESTS OVERVIEW: pre-compiled multi-needle Query tests
+
+test_command_1 = "executable subcmd -s --long -n shortdef --name longdef --nameeq=longdefeq lastpos"
+test_command_2 = "executable -mops -t lastpos -o file1 -o file2"
+test_command_3 = "executable subcmd subsubcmd"
+test_command_4 = "executable -a_ --output=path"
+
+
+def create_command(argstring):
+    return Command.from_argv(shlex.split(argstring)[1:])
+
+# BEGIN TESTS
+
+
+def test_query_invalid_mode():
+    with pytest.raises(ValueError):
+        Query(switches=("s",), mode="bogus")
+
+
+def test_query_all_switches():
+    query = Query(switches=("s", "long"))
+    assert query.matches(create_command(test_command_1)) is True
+    assert query.matches(create_command(test_command_2)) is False
+
+
+def test_query_all_multiple_kinds():
+    query = Query(switches=("s",), definitions=("n", "nameeq"), arguments=("subcmd", "lastpos"), mode=ALL)
+    assert query.matches(create_command(test_command_1)) is True
+    query = Query(switches=("s",), definitions=("bogus",))
+    assert query.matches(create_command(test_command_1)) is False
+
+
+def test_query_all_mops_and_multi_definitions():
+    query = Query(mops=("m", "p"), multi_definitions=("o",))
+    assert query.matches(create_command(test_command_2)) is True
+    assert Query(mops=("m", "z")).matches(create_command(test_command_2)) is False
+    assert Query(mops=("a", "_")).matches(create_command(test_command_4)) is True
+    assert Query(mops=("?",)).matches(create_command(test_command_4)) is False
+
+
+def test_query_any():
+    query = Query(switches=("bogus", "long"), mode=ANY)
+    assert query.matches(create_command(test_command_1)) is True
+    assert query.matches(create_command(test_command_3)) is False
+    assert Query(mops=("z", "s"), mode=ANY).matches(create_command(test_command_2)) is True
+    assert Query(mops=("_",), mode=ANY).matches(create_command(test_command_4)) is True
+    assert Query(definitions=("x", "output"), mode=ANY).matches(create_command(test_command_4)) is True
+    assert Query(multi_definitions=("o",), mode=ANY).matches(create_command(test_command_2)) is True
+    assert Query(arguments=("subsubcmd",), mode=ANY).matches(create_command(test_command_3)) is True
+
+
+def test_query_none():
+    query = Query(switches=("h", "help"), mode=NONE)
+    assert query.matches(create_command(test_command_1)) is True
+    assert Query(arguments=("subcmd",), mode=NONE).matches(create_command(test_command_3)) is False
+
+
+def test_query_empty_needles():
+    c = create_command(test_command_1)
+    assert Query().matches(c) is True
+    assert Query(mode=ANY).matches(c) is False
+    assert Query(mode=NONE).matches(c) is True
+
+
+def test_query_aliases():
+    aliases = OptionAliases(("output", "o"))
+    c = Command.from_argv(["-o", "path"], aliases=aliases)
+    assert Query(definitions=("o",), aliases=aliases).matches(c) is True
+    assert Query(definitions=("o",)).matches(c) is False
+
+
+def test_query_filter():
+    commands = [create_command(x) for x in (test_command_1, test_command_2, test_command_3)]
+    query = Query(arguments=("lastpos",))
+    assert query.filter(commands) == [commands[0], commands[1]]
+
+
+def test_query_string():
+    query = Query(switches=("s", "long"), mode=ANY)
+    assert str(query) == "< Query object > mode=any switches=['long', 's']"
+    assert repr(query) == str(query)
@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+
+import json
+import shlex
+import pytest
+
+from commandlines import Command
+from commandlines.aliases import OptionAliases
+from commandlines.exceptions import MissingDictionaryKeyError
+from commandlines.resolve import ResolvedOptions, SOURCE_COMMAND_LINE, SOURCE_CONFIG, SOURCE_DEFAULTS, SOURCE_ENVIRONMENT
+
+# TESTS OVERVIEW: layered option resolution tests
+
+test_command_1 = "executable --output=cli.txt -l 3 lastpos"
+test_environ = {"MYAPP_LEVEL": "2", "MYAPP_OUTPUT_DIR": "/tmp", "MYAPP_": "empty", "OTHER_LEVEL": "9"}
+test_config = {"level": "1", "color": "auto", "output-dir": "/var"}
+test_defaults = {"output": "stdout", "level": "0", "color": "never", "width": 80}
+
+
+def create_argv(argstring):
+    return shlex.split(argstring)[1:]
+
+
+def create_command():
+    c = Command.from_argv(create_argv(test_command_1))
+    c.set_defaults(test_defaults)
+    return c
+
+
+# BEGIN TESTS
+
+
+def test_resolve_precedence():
+    options = create_command().resolve("MYAPP_", dict(test_config, l="ignored"), test_environ)
+    assert options.get("output") == "cli.txt"
+    assert options.source("output") == SOURCE_COMMAND_LINE
+    assert options.get("level") == "2"
+    assert options.source("level") == SOURCE_ENVIRONMENT
+    assert options.get("output-dir") == "/tmp"
+    assert options.get("color") == "auto"
+    assert options.source("color") == SOURCE_CONFIG
+    assert options.get("width") == 80
+    assert options.source("width") == SOURCE_DEFAULTS
+    assert options.get("l") == "3"   # command line short option
+    assert options.get("missing") is None
+    assert options.get("missing", "default") == "default"
+    assert options.source("missing") is None
+
+
+def test_resolve_without_environment_and_config():
+    options = create_command().resolve(environ=test_environ)
+    assert options.get("level") == "0"
+    assert options.source("level") == SOURCE_DEFAULTS
+    assert "output-dir" not in options
+    assert len(options) == 5
+    assert sorted(options) == ["color", "l", "level", "output", "width"]
+
+
+def test_resolve_mapping_protocol():
+    options = create_command().resolve()
+    assert options["output"] == "cli.txt"
+    assert "output" in options
+    with pytest.raises(MissingDictionaryKeyError):
+        options["missing"]
+
+
+def test_resolve_config_file(tmp_path):
+    config_path = tmp_path / "config.json"
+    config_path.write_text(json.dumps(test_config))
+    options = create_command().resolve(config=str(config_path), environ={})
+    assert options.get("output-dir") == "/var"
+    assert options.source("color") == SOURCE_CONFIG
+
+
+def test_resolve_config_file_not_object(tmp_path):
+    config_path = tmp_path / "config.json"
+    config_path.write_text("[1, 2]")
+    with pytest.raises(ValueError):
+        create_command().resolve(config=str(config_path))
+
+
+def test_resolve_aliases():
+    aliases = OptionAliases(("level", "l"))
+    c = Command.from_argv(create_argv(test_command_1), aliases=aliases)
+    c.set_defaults({"l": "0"})
+    options = c.resolve("MYAPP_", environ={"MYAPP_L": "2"})
+    assert options.get("level") == "3"
+    assert options.get("l") == "3"
+    assert options.source("l") == SOURCE_COMMAND_LINE
+    assert options.values == {"level": "3", "output": "cli.txt"}
+
+
+def test_resolve_bytes_mode():
+    c = Command.from_argv([b"--output", b"out.txt"])
+    c.set_defaults({"level": "0"})
+    options = c.resolve()
+    assert options.get("output") == "out.txt"
+    assert options.source("level") == SOURCE_DEFAULTS
+
+
+def test_resolved_options_direct():
+    options = ResolvedOptions({"a": "1"}, defaults={"a": "0", "b": "2"})
+    assert options.values == {"a": "1", "b": "2"}
+    assert options.sources == {"a": SOURCE_COMMAND_LINE, "b": SOURCE_DEFAULTS}
@@ -0,0 +1,187 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+
+import shlex
+import pytest
+
+from commandlines import Command
+from commandlines.exceptions import MissingArgumentError
+from commandlines.router import Router, RouteMatch
+from commandlines.tokenizer import fsencode
+
+# TESTS OVERVIEW: trie subcommand router tests
+
+test_command_1 = "executable remote add origin https://example.com --force"
+test_command_2 = "executable remote -v"
+test_command_3 = "executable status"
+test_command_4 = "executable remote set-url origin url"
+
+
+def create_argv(argstring):
+    return shlex.split(argstring)[1:]
+
+
+def handler(argv, *args, **kwargs):
+    return argv, args, kwargs
+
+
+def create_router():
+    router = Router()
+    router.add_route(("remote",), "remote").add_route(("remote", "add"), "remote add")
+    router.add_route(("remote", "set-url", "origin"), "remote set-url origin")
+    return router
+
+
+# ///////////////////////////////////////////////////////
+#
+#  Route registration
+#
+# ///////////////////////////////////////////////////////
+
+def test_router_add_route():
+    router = create_router()
+    assert len(router) == 3
+    assert ("remote",) in router
+    assert ("remote", "add") in router
+    assert ("remote", "set-url") not in router   # interior trie node without a handler
+    assert ("status",) not in router
+    assert router.routes() == [("remote",), ("remote", "add"), ("remote", "set-url", "origin")]
+
+
+def test_router_add_route_list_route():
+    router = Router()
+    router.add_route(["remote", "add"], handler)
+    assert ("remote", "add") in router
+
+
+def test_router_add_route_empty_route_raises_valueerror():
+    router = Router()
+    with pytest.raises(ValueError):
+        router.add_route((), handler)
+
+
+def test_router_add_route_duplicate_route_raises_valueerror():
+    router = create_router()
+    with pytest.raises(ValueError):
+        router.add_route(("remote", "add"), handler)
+
+
+def test_router_route_decorator():
+    router = Router()
+
+    @router.route("remote", "add")
+    def remote_add(argv):
+        return argv
+
+    assert ("remote", "add") in router
+    assert remote_add(["x"]) == ["x"]   # the decorated function is returned unchanged
+    assert router.resolve(["remote", "add", "origin"]).handler is remote_add
+
+
+def test_router_repr_str():
+    router = create_router()
+    assert repr(router) == "< Router object > routes=3"
+    assert str(router) == "< Router object > routes=3"
+
+
+# ///////////////////////////////////////////////////////
+#
+#  Route resolution
+#
+# ///////////////////////////////////////////////////////
+
+def test_router_resolve_longest_route():
+    router = create_router()
+    match = router.resolve(create_argv(test_command_1))
+    assert isinstance(match, RouteMatch)
+    assert match.route == ("remote", "add")
+    assert match.handler == "remote add"
+    assert match.arguments == ["origin", "https://example.com", "--force"]
+
+
+def test_router_resolve_shorter_route_after_partial_match():
+    router = create_router()
+    match = router.resolve(create_argv(test_command_2))
+    assert match.route == ("remote",)
+    assert match.arguments == ["-v"]
+
+
+def test_router_resolve_interior_node_falls_back_to_last_route():
+    router = create_router()
+    match = router.resolve(["remote", "set-url", "upstream"])
+    assert match.route == ("remote",)
+    assert match.arguments == ["set-url", "upstream"]
+
+
+def test_router_resolve_deep_route():
+    router = create_router()
+    match = router.resolve(create_argv(test_command_4))
+    assert match.route == ("remote", "set-url", "origin")
+    assert match.arguments == ["url"]
+
+
+def test_router_resolve_exact_route_empty_remaining_arguments():
+    router = create_router()
+    match = router.resolve(["remote", "add"])
+    assert match.route == ("remote", "add")
+    assert match.arguments == []
+
+
+def test_router_resolve_no_match():
+    router = create_router()
+    assert router.resolve(create_argv(test_command_3)) is None
+    assert router.resolve([]) is None
+    assert router.resolve(["--force", "remote"]) is None   # routes are matched from index position 0
+
+
+def test_router_resolve_command_arguments():
+    router = create_router()
+    c = Command.from_argv(create_argv(test_command_1))
+    match = router.resolve(c.arguments)
+    assert match.route == ("remote", "add")
+    assert match.arguments == ["origin", "https://example.com", "--force"]
+    assert isinstance(match.arguments, list)
+
+
+def test_router_resolve_bytes_mode():
+    router = create_router()
+    match = router.resolve([fsencode(arg) for arg in create_argv(test_command_1)])
+    assert match.route == ("remote", "add")
+    assert match.arguments == [b"origin", b"https://example.com", b"--force"]
+
+
+def test_routematch_repr_str():
+    router = create_router()
+    match = router.resolve(create_argv(test_command_2))
+    assert repr(match) == "< RouteMatch object > route=['remote'] arguments=['-v']"
+    assert str(match) == "< RouteMatch object > route=['remote'] arguments=['-v']"
+
+
+# ///////////////////////////////////////////////////////
+#
+#  Dispatch
+#
+# ///////////////////////////////////////////////////////
+
+def test_router_dispatch():
+    router = Router()
+    router.add_route(("remote", "add"), handler)
+    result = router.dispatch(create_argv(test_command_1), "positional", key="value")
+    assert result == (["origin", "https://example.com", "--force"], ("positional",), {"key": "value"})
+
+
+def test_router_dispatch_default_handler():
+    router = Router(default=handler)
+    router.add_route(("remote", "add"), lambda argv: "remote add")
+    assert router.dispatch(create_argv(test_command_3)) == (["status"], (), {})
+    assert router.dispatch(create_argv(test_command_1)) == "remote add"
+
+
+def test_router_dispatch_no_match_raises_missingargumenterror():
+    router = create_router()
+    with pytest.raises(MissingArgumentError) as excinfo:
+        router.dispatch(create_argv(test_command_3))
+    assert excinfo.value.argument == "status"
+    with pytest.raises(MissingArgumentError):
+        router.dispatch([])
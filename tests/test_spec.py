@@ -0,0 +1,198 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+
+import shlex
+import pytest
+
+from commandlines import Command
+from commandlines.aliases import OptionAliases
+from commandlines.cache import ParseCache
+from commandlines.spec import OptionSpec, CompiledSpec
+
+# TESTS OVERVIEW: compiled option specification parsing tests
+
+test_command_1 = "executable subcmd -v --output path -I dir1 --include=dir2 lastpos"
+test_command_2 = "executable -o -n -x"
+test_command_3 = "executable -v file -rnj --undeclared --other=value"
+test_command_4 = "executable -v -- -o path --verbose"
+test_command_5 = "executable -o path1 -o path2 -I dir1"
+test_command_6 = "executable --verbose=yes - -o"
+
+
+def create_argv(argstring):
+    return shlex.split(argstring)[1:]
+
+
+def create_spec():
+    spec = OptionSpec()
+    spec.add_flag("verbose", "v").add_flag("rnj")
+    spec.add_option("output", "o")
+    spec.add_repeatable_option("include", "I")
+    return spec.compile()
+
+# BEGIN TESTS
+
+#
+# OptionSpec declaration tests
+#
+
+
+def test_optionspec_declarations():
+    spec = OptionSpec()
+    assert spec.add_flag("verbose", "v") is spec
+    spec.add_option("output", "o")
+    spec.add_repeatable_option("include")
+    assert spec.flags == [("verbose", "v")]
+    assert spec.options == [("output", "o")]
+    assert spec.repeatable_options == [("include",)]
+    assert isinstance(spec.compile(), CompiledSpec)
+
+
+def test_optionspec_invalid_names():
+    spec = OptionSpec()
+    with pytest.raises(ValueError):
+        spec.add_flag()
+    with pytest.raises(ValueError):
+        spec.add_flag("--verbose")
+    with pytest.raises(ValueError):
+        spec.add_option("out=put")
+    with pytest.raises(ValueError):
+        spec.add_option("")
+
+
+def test_optionspec_duplicate_names():
+    spec = OptionSpec()
+    spec.add_flag("verbose", "v")
+    spec.add_option("value", "v")
+    with pytest.raises(ValueError):
+        spec.compile()
+
+
+def test_compiledspec_dispatch_table_spellings():
+    compiled_spec = create_spec()
+    for token in ("-v", "--verbose", "-verbose", "-o", "--output", "-output", "-I", "--include", "-include"):
+        assert token in compiled_spec
+    assert "--v" not in compiled_spec
+    assert "-x" not in compiled_spec
+
+#
+# Command parsing with a compiled specification
+#
+
+
+def test_spec_parse_flags_options_and_repeatable_options():
+    c = Command.from_argv(create_argv(test_command_1), spec=create_spec())
+    assert c.switches == {"verbose"}
+    assert c.defs == {"output": "path", "include": "dir2"}
+    assert c.mdefs == {"include": ["dir1", "dir2"]}
+    assert c.mops == set()
+    assert c.subcmd == "subcmd"
+    assert c.arglp == "lastpos"
+    assert c.get_definition("output") == "path"
+    assert c.get_multiple_definitions("include") == ["dir1", "dir2"]
+
+
+def test_spec_parse_option_consumes_dash_argument():
+    c = Command.from_argv(create_argv(test_command_2), spec=create_spec())
+    assert c.defs == {"output": "-n"}
+    assert c.switches == {"x"}
+
+
+def test_spec_parse_flag_does_not_define():
+    c = Command.from_argv(create_argv(test_command_3), spec=create_spec())
+    assert c.defs == {"other": "value"}
+    assert c.switches == {"verbose", "rnj", "undeclared"}   # declared single dash long option is not exploded
+    assert c.mops == set()
+
+
+def test_spec_parse_undeclared_single_dash_multi_character_is_mops():
+    c = Command.from_argv(["-abc", "-v"], spec=create_spec())
+    assert c.mops == {"a", "b", "c"}
+    assert c.switches == {"verbose"}
+
+
+def test_spec_parse_double_dash_ends_option_parsing():
+    c = Command.from_argv(create_argv(test_command_4), spec=create_spec())
+    assert c.switches == {"verbose"}
+    assert c.defs == {}
+    assert c.has_double_dash() is True
+    assert c.get_double_dash_args() == ["-o", "path", "--verbose"]
+
+
+def test_spec_parse_double_dash_option_argument():
+    c = Command.from_argv(["-o", "--", "-v", "--", "lastpos"], spec=create_spec())
+    assert c.defs == {"output": "--"}
+    assert c.switches == {"verbose"}
+    assert c._parsed.double_dash == 3   # the first `--` is the -o option argument
+    assert c.get_double_dash_args() == ["lastpos"]
+    assert c.get_pre_double_dash_view() == ["-o", "--", "-v"]
+    c = Command.from_argv(["-o", "--", "lastpos"], spec=create_spec(), lazy=True)
+    assert c.has_double_dash() is False
+
+
+def test_spec_parse_repeatable_option_single_use():
+    c = Command.from_argv(create_argv(test_command_5), spec=create_spec())
+    assert c.defs == {"output": "path2", "include": "dir1"}
+    assert c.mdefs == {"output": ["path1", "path2"], "include": ["dir1"]}
+
+
+def test_spec_parse_flag_with_value_missing_option_argument_and_single_dash():
+    c = Command.from_argv(create_argv(test_command_6), spec=create_spec())
+    assert c.defs == {"verbose": "yes"}
+    assert c.switches == {"output"}   # option without an argument is parsed as a switch
+    assert "-" in c.arguments
+
+
+def test_spec_parse_lazy_and_cached():
+    compiled_spec = create_spec()
+    argv = create_argv(test_command_1)
+    expected = Command.from_argv(argv, spec=compiled_spec)
+    lazy = Command.from_argv(argv, lazy=True, spec=compiled_spec)
+    assert lazy.obj_string() == expected.obj_string()
+    cache = ParseCache()
+    cached = Command.from_argv(argv, cache=cache, spec=compiled_spec)
+    uncached_heuristic = Command.from_argv(argv, cache=cache)
+    assert cached.obj_string() == expected.obj_string()
+    assert uncached_heuristic.obj_string() == Command.from_argv(argv).obj_string()
+    assert cache.misses == 2
+
+
+def test_spec_parse_from_argv_list():
+    compiled_spec = create_spec()
+    commands = Command.from_argv_list([create_argv(test_command_1), create_argv(test_command_5)], spec=compiled_spec)
+    assert commands[0].switches == {"verbose"}
+    assert commands[1].get_multiple_definitions("output") == ["path1", "path2"]
+
+
+def test_spec_alias_lookups():
+    c = Command.from_argv(create_argv(test_command_1), spec=create_spec())
+    assert c.contains_switches("v") is True
+    assert c.contains_definitions("o", "I") is True
+    assert c.contains_multi_definitions("I") is True
+    assert c.get_definition("o") == "path"
+    assert c.find_definition("o") == "path"
+    assert c.get_multiple_definitions("I") == ["dir1", "dir2"]
+    assert c.find_multiple_definitions("I") == ["dir1", "dir2"]
+    assert c.get_option_positions("o") == c.get_option_positions("output")
+    assert c.get_definition_occurrences("I") == c.get_definition_occurrences("include")
+    assert c.resolve().get("o") == "path"
+
+
+def test_spec_alias_lookups_bytes_mode():
+    c = Command.from_argv([arg.encode("ascii") for arg in create_argv(test_command_1)], spec=create_spec())
+    assert c.contains_switches(b"v") is True
+    assert c.get_definition(b"o") == b"path"
+
+
+def test_spec_alias_lookups_with_aliases_registry():
+    aliases = OptionAliases(("output", "out"))
+    c = Command.from_argv(create_argv(test_command_1), spec=create_spec(), aliases=aliases)
+    assert c.get_definition("out") == "path"   # an aliases registry replaces the spec alias names for lookups
+
+
+def test_compiled_spec_aliases():
+    aliases = create_spec().aliases
+    assert aliases.canonical("v") == "verbose"
+    assert aliases.canonical("I") == "include"
+    assert aliases.canonical("undeclared") == "undeclared"
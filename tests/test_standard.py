@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+
+import os
+import shlex
+import subprocess
+import sys
+import pytest
+
+from commandlines import Command
+from commandlines.standard import get_standard_request, is_help_request, is_usage_request, is_version_request
+
+# TESTS OVERVIEW: standard option fast path tests
+
+test_command_1 = "executable subcmd -s --name value --help"
+test_command_2 = "executable -v lastpos"
+test_command_3 = "executable --usage -h"
+test_command_4 = "executable subcmd -- --help -v"
+test_command_5 = "executable --help=topic -vh lastpos"
+test_command_6 = "executable -help ---version"
+test_command_7 = "executable -h file -- lastpos"
+test_command_empty_1 = "executable"
+
+test_commands = (test_command_1, test_command_2, test_command_3, test_command_4, test_command_5, test_command_6,
+                 test_command_7, test_command_empty_1)
+
+
+def create_argv(argstring):
+    return shlex.split(argstring)[1:]
+
+
+# BEGIN TESTS
+
+
+def test_standard_get_standard_request():
+    assert get_standard_request(create_argv(test_command_1)) == "help"
+    assert get_standard_request(create_argv(test_command_2)) == "version"
+    assert get_standard_request(create_argv(test_command_3)) == "usage"   # first match
+    assert get_standard_request(create_argv(test_command_7)) == "help"
+    assert get_standard_request(create_argv(test_command_empty_1)) is None
+
+
+def test_standard_stops_at_double_dash():
+    assert get_standard_request(create_argv(test_command_4)) is None
+
+
+def test_standard_definitions_and_mops_are_not_requests():
+    assert get_standard_request(create_argv(test_command_5)) is None
+
+
+def test_standard_requests_parameter():
+    argv = create_argv(test_command_3)
+    assert get_standard_request(argv, ("help",)) == "help"
+    assert get_standard_request(argv, ("version",)) is None
+    assert get_standard_request(create_argv(test_command_6), ("version",)) == "version"
+
+
+def test_standard_sysargv_default():
+    sys.argv = shlex.split(test_command_2)
+    assert get_standard_request() == "version"
+    assert is_version_request() is True
+    assert is_help_request() is False
+
+
+def test_standard_bytes_argv():
+    argv = [argument.encode("utf-8") for argument in create_argv(test_command_1)]
+    assert get_standard_request(argv) == "help"
+    argv = [argument.encode("utf-8") for argument in create_argv(test_command_4)]
+    assert get_standard_request(argv) is None
+
+
+def test_standard_matches_command_methods():
+    for command in test_commands:
+        argv = create_argv(command)
+        c = Command.from_argv(argv)
+        assert is_help_request(argv) == c.is_help_request()
+        assert is_usage_request(argv) == c.is_usage_request()
+        assert is_version_request(argv) == c.is_version_request()
+
+
+@pytest.mark.skipif(sys.version_info < (3, 7), reason="the package imports the Command object eagerly before Python 3.7")
+def test_standard_import_does_not_import_parser():
+    import commandlines
+    env = dict(os.environ, PYTHONPATH=os.path.dirname(os.path.dirname(os.path.abspath(commandlines.__file__))))
+    code = "import sys, commandlines.standard; print(sorted(m for m in sys.modules if m.startswith('commandlines')))"
+    output = subprocess.check_output([sys.executable, "-c", code], env=env).decode("ascii")
+    assert output.strip() == "['commandlines', 'commandlines.aliases', 'commandlines.standard']"
+    code = "import commandlines; print(commandlines.Command.__name__)"
+    assert subprocess.check_output([sys.executable, "-c", code], env=env).decode("ascii").strip() == "Command"
+    with pytest.raises(AttributeError):
+        commandlines.Missing
@@ -0,0 +1,172 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+
+import io
+import os
+import shlex
+import pytest
+
+from commandlines import Command
+from commandlines.cache import ParseCache
+from commandlines.stream import iter_argv, iter_records, parse_stream, read_argv
+from commandlines.tokenizer import ParseResult
+
+# TESTS OVERVIEW: NUL delimited argument stream reader tests
+
+test_command_1 = "executable subcmd -s --long -n shortdef --name longdef --nameeq=longdefeq lastpos"
+test_command_2 = "executable -o path1 -o path2 -t --flag"
+test_command_3 = "executable -mops -- lastpos"
+
+
+def create_argv(argstring):
+    return shlex.split(argstring)
+
+
+def create_cmdline(argstring):
+    return b"".join(argument.encode("utf-8") + b"\0" for argument in create_argv(argstring))
+
+
+def create_spool(*argstrings):
+    return b"".join(create_cmdline(argstring) + b"\n" for argstring in argstrings)
+
+# BEGIN TESTS
+
+#
+# iter_records tests
+#
+
+
+def test_iter_records_file_object():
+    assert list(iter_records(io.BytesIO(b"one\0two\0three\0"))) == [b"one", b"two", b"three"]
+
+
+def test_iter_records_no_final_delimiter():
+    assert list(iter_records(io.BytesIO(b"one\0two"))) == [b"one", b"two"]
+
+
+def test_iter_records_empty_records():
+    assert list(iter_records(io.BytesIO(b"\0one\0\0two\0"))) == [b"", b"one", b"", b"two"]
+    assert list(iter_records(io.BytesIO(b""))) == []
+
+
+def test_iter_records_across_chunks():
+    data = b"".join(str(n).encode("ascii") * (n % 17) + b"\0" for n in range(200))
+    expected = data.split(b"\0")[:-1]
+    for chunksize in (1, 2, 3, 7, 16, 1000, 10 ** 6):
+        assert list(iter_records(io.BytesIO(data), chunksize=chunksize)) == expected
+
+
+def test_iter_records_newline_delimiter():
+    assert list(iter_records(io.BytesIO(b"a\0b\0\nc\0\n"), b"\n", 2)) == [b"a\0b\0", b"c\0"]
+
+
+def test_iter_records_file_path_and_descriptor(tmpdir):
+    path = tmpdir.join("spool")
+    path.write_binary(b"one\0two\0")
+    assert list(iter_records(str(path))) == [b"one", b"two"]
+    fd = os.open(str(path), os.O_RDONLY)
+    try:
+        assert list(iter_records(fd, chunksize=3)) == [b"one", b"two"]
+    finally:
+        os.close(fd)
+
+
+def test_iter_records_invalid_parameters():
+    with pytest.raises(ValueError):
+        iter_records(io.BytesIO(b""), b"\0\0")
+    with pytest.raises(ValueError):
+        iter_records(io.BytesIO(b""), chunksize=0)
+
+
+#
+# iter_argv and read_argv tests
+#
+
+
+def test_iter_argv_records():
+    spool = create_spool(test_command_1, test_command_2, test_command_3)
+    assert list(iter_argv(io.BytesIO(spool), b"\n", chunksize=5)) == \
+        [create_argv(test_command_1), create_argv(test_command_2), create_argv(test_command_3)]
+
+
+def test_iter_argv_bytes():
+    assert list(iter_argv(io.BytesIO(b"ls\0-l\0\n"), b"\n", decode=False)) == [[b"ls", b"-l"]]
+
+
+def test_iter_argv_empty_argument():
+    assert list(iter_argv(io.BytesIO(b"echo\0\0-n\0\n"), b"\n")) == [["echo", "", "-n"]]
+
+
+def test_iter_argv_surrogateescape():
+    argv = list(iter_argv(io.BytesIO(b"cat\0caf\xe9\0\n"), b"\n"))[0]
+    assert argv[1] == b"caf\xe9".decode("utf-8", "surrogateescape")
+    assert os.fsencode(argv[1]) == b"caf\xe9"
+
+
+def test_iter_argv_whole_source_embedded_newline():
+    assert list(iter_argv(io.BytesIO(b"sh\0-c\0echo a\necho b\0"), None)) == [["sh", "-c", "echo a\necho b"]]
+
+
+def test_iter_argv_requires_record_delimiter():
+    with pytest.raises(TypeError):
+        iter_argv(io.BytesIO(b"ls\0-l\0\n"))
+    with pytest.raises(TypeError):
+        parse_stream(io.BytesIO(b"ls\0-l\0\n"))
+
+
+def test_read_argv_cmdline(tmpdir):
+    path = tmpdir.join("cmdline")
+    path.write_binary(create_cmdline(test_command_1))
+    assert read_argv(str(path)) == create_argv(test_command_1)
+    assert read_argv(str(path), decode=False)[0] == b"executable"
+
+
+def test_read_argv_embedded_newline(tmpdir):
+    path = tmpdir.join("cmdline")
+    path.write_binary(b"printf\0a\nb\0")
+    assert read_argv(str(path)) == ["printf", "a\nb"]
+
+
+def test_read_argv_empty(tmpdir):
+    path = tmpdir.join("cmdline")
+    path.write_binary(b"")
+    assert read_argv(str(path)) == []
+
+
+#
+# parse_stream tests
+#
+
+
+def test_parse_stream_matches_command():
+    spool = create_spool(test_command_1, test_command_2, test_command_3)
+    results = list(parse_stream(io.BytesIO(spool), b"\n", chunksize=8))
+    for result, command in zip(results, (test_command_1, test_command_2, test_command_3)):
+        assert result == ParseResult(create_argv(command)[1:])
+        c1 = Command.from_parse_result(result)
+        c2 = Command.from_argv(create_argv(command)[1:])
+        assert c1.arguments == c2.arguments
+        assert c1.switches == c2.switches
+        assert c1.mops == c2.mops
+        assert c1.defs == c2.defs
+        assert c1.mdefs == c2.mdefs
+
+
+def test_parse_stream_include_executable():
+    result = next(parse_stream(io.BytesIO(create_spool(test_command_2)), b"\n", executable=False))
+    assert result.argv[0] == "executable"
+
+
+def test_parse_stream_whole_source():
+    results = list(parse_stream(io.BytesIO(create_cmdline(test_command_2)), None))
+    assert results == [ParseResult(create_argv(test_command_2)[1:])]
+
+
+def test_parse_stream_cache():
+    cache = ParseCache()
+    spool = create_spool(test_command_1, test_command_1, test_command_2)
+    results = list(parse_stream(io.BytesIO(spool), b"\n", cache=cache))
+    assert results[0] is results[1]
+    assert cache.hits == 1
+    assert cache.misses == 2
@@ -0,0 +1,192 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+
+import copy
+import pickle
+import shlex
+import pytest
+
+from commandlines.aliases import OptionAliases
+from commandlines.tokenizer import collect, make_events, scan_definitions, scan_mops, scan_switches, tokenize, \
+    ParseResult, TOKEN_SWITCH, TOKEN_MOPS, TOKEN_DEFINITION, \
+    TOKEN_DOUBLE_DASH
+
+# TESTS OVERVIEW: single pass token classifier tests
+
+test_command_1 = "executable subcmd -s --long -n shortdef --name longdef --nameeq=longdefeq lastpos"
+test_command_2 = "executable -mops -t lastpos"
+test_command_3 = "executable -o path1 -o path2 --file=one --file=two -t --flag"
+test_command_4 = "executable -t --name -- lastpos -mops --long another --def=val"
+test_command_5 = "executable subcmd subsubcmd"
+test_command_empty_1 = "executable"
+
+
+def create_argv(argstring):
+    return shlex.split(argstring)[1:]
+
+# BEGIN TESTS
+
+
+def test_tokenize_positional_args_excluded():
+    tokens = tokenize(create_argv(test_command_5))
+    assert tokens == []
+
+
+def test_tokenize_empty_args():
+    tokens = tokenize(create_argv(test_command_empty_1))
+    assert tokens == []
+
+
+def test_tokenize_switch_and_definition_kinds():
+    tokens = tokenize(create_argv(test_command_1))
+    assert tokens[0] == (TOKEN_SWITCH, "s", None, 1, -1)
+    assert tokens[1] == (TOKEN_SWITCH, "long", None, 2, -1)
+    assert tokens[2] == (TOKEN_SWITCH | TOKEN_DEFINITION, "n", "shortdef", 3, 4)
+    assert tokens[3] == (TOKEN_SWITCH | TOKEN_DEFINITION, "name", "longdef", 5, 6)
+    assert tokens[4] == (TOKEN_DEFINITION, "nameeq", "longdefeq", 7, 7)
+    assert len(tokens) == 5
+
+
+def test_tokenize_mops_kind():
+    tokens = tokenize(create_argv(test_command_2))
+    assert tokens[0] == (TOKEN_SWITCH | TOKEN_MOPS, "mops", None, 0, -1)
+    assert tokens[1] == (TOKEN_SWITCH | TOKEN_DEFINITION, "t", "lastpos", 1, 2)
+
+
+def test_tokenize_double_dash_ends_option_context():
+    tokens = tokenize(create_argv(test_command_4))
+    assert tokens[0] == (TOKEN_SWITCH, "t", None, 0, -1)
+    assert tokens[1] == (TOKEN_SWITCH, "name", None, 1, -1)
+    assert tokens[2] == (TOKEN_DOUBLE_DASH, "", None, 2, -1)
+    assert tokens[3] == (TOKEN_MOPS, "mops", None, 4, -1)   # mops syntax is recognized after the double dash idiom
+    assert len(tokens) == 4
+
+
+def test_tokenize_empty_string_argument():
+    tokens = tokenize(["-o", "", ""])
+    assert tokens == [(TOKEN_SWITCH | TOKEN_DEFINITION, "o", "", 0, 1)]
+
+
+def test_collect_containers():
+    switchset, mopsset, defmap, multimap, double_dash = collect(tokenize(create_argv(test_command_3)))
+    assert double_dash == -1
+    assert switchset == {"o", "t", "flag"}
+    assert mopsset == set()
+    assert defmap == {"o": "path2", "file": "two"}
+    assert multimap == {"o": ["path1", "path2"], "file": ["one", "two"]}
+
+
+def test_collect_containers_double_dash():
+    switchset, mopsset, defmap, multimap, double_dash = collect(tokenize(create_argv(test_command_4)))
+    assert double_dash == 2
+    assert switchset == {"t", "name"}
+    assert mopsset == {"m", "o", "p", "s"}
+    assert defmap == {}
+    assert multimap == {}
+
+
+def test_make_events():
+    events = make_events(tokenize(create_argv(test_command_4)))
+    assert len(events) == 4
+    assert list(events) == [(0, TOKEN_SWITCH, "t", -1), (1, TOKEN_SWITCH, "name", -1), (2, TOKEN_DOUBLE_DASH, "", -1),
+                            (4, TOKEN_MOPS, "mops", -1)]
+    assert events[0] == (0, TOKEN_SWITCH, "t", -1)
+    assert events[-1] == events[len(events) - 1]
+    with pytest.raises(IndexError):
+        events[len(events)]
+
+
+def test_scan_functions_match_collect():
+    commands = (test_command_1, test_command_2, test_command_3, test_command_4, test_command_5, test_command_empty_1,
+                "executable -o= --a=b=c -m-x-y -- -- -rn --x=y", "executable -n '' -v -", "executable -o -p --")
+    for command in commands:
+        for argv in (create_argv(command), [argument.encode("utf-8") for argument in create_argv(command)]):
+            bytes_mode = len(argv) > 0 and isinstance(argv[0], bytes)
+            switchset, mopsset, defmap, multimap, double_dash = collect(tokenize(argv), None, bytes_mode)
+            assert scan_switches(argv) == switchset
+            assert scan_mops(argv) == mopsset
+            assert scan_definitions(argv) == defmap
+            assert scan_definitions(argv, multiple=True) == multimap
+
+
+def test_events_positions():
+    events = ParseResult(create_argv(test_command_3)).events
+    assert events.positions_of("o") == (0, 2)
+    assert events.positions_of("file") == (4, 5)
+    assert events.positions_of("flag") == (7,)
+    assert events.positions_of("missing") == ()
+    assert events.positions_of("o", TOKEN_SWITCH) == (0, 2)
+    assert events.positions_of("file", TOKEN_SWITCH) == ()
+
+
+def test_events_values():
+    events = ParseResult(create_argv(test_command_3)).events
+    assert events.values == ("path1", "path2", "one", "two", None, None)
+    assert [event[3] for event in events] == [1, 3, 4, 5, -1, -1]
+
+
+def test_events_occurrences():
+    result = ParseResult(create_argv(test_command_3))
+    events = result.events
+    assert events.occurrences("o") == ((0, 1, "path1"), (2, 3, "path2"))
+    assert events.occurrences("file") == ((4, 4, "one"), (5, 5, "two"))
+    assert events.occurrences("flag") == ()
+    assert events.occurrences("missing") == ()
+    for key, value in result.defs:
+        assert events.occurrences(key)[-1][2] == value
+    for key, values in result.mdefs:
+        assert tuple(occurrence[2] for occurrence in events.occurrences(key)) == values
+
+
+def test_collect_single_definitions_not_multiple():
+    defmap, multimap = collect(tokenize(["-o", "one", "--file=two", "-o", "three", "-o", "four"]))[2:4]
+    assert defmap == {"o": "four", "file": "two"}
+    assert multimap == {"o": ["one", "three", "four"]}
+
+
+def test_events_immutable():
+    result = ParseResult(create_argv(test_command_3))
+    events = result.events
+    with pytest.raises(AttributeError):
+        events.keys = ("zz",)
+    with pytest.raises(AttributeError):
+        events.positions = events.positions
+    with pytest.raises(AttributeError):
+        del events.values
+    positions = events.positions
+    positions[0] = 99   # the integer field attributes are copies
+    kinds = events.kinds
+    kinds[0] = 0
+    assert events.positions[0] == 0
+    assert events.positions_of("o") == (0, 2)
+    assert events[0] == (0, TOKEN_SWITCH | TOKEN_DEFINITION, "o", 1)
+    assert pickle.loads(pickle.dumps(events)) == events
+    assert copy.copy(events) == events
+
+
+def test_events_event_at():
+    events = ParseResult(create_argv(test_command_1)).events
+    assert events[events.event_at(3)] == (3, TOKEN_SWITCH | TOKEN_DEFINITION, "n", 4)
+    assert events.event_at(0) == -1   # positional argument
+    assert events.event_at(4) == -1   # definition argument
+
+
+def test_events_derive_containers():
+    for command in (test_command_1, test_command_2, test_command_3, test_command_4):
+        result = ParseResult(create_argv(command))
+        events = result.events
+        tokens = [(kind, key, value, position, value_position)
+                  for (position, kind, key, value_position), value in zip(events, events.values)]
+        switchset, mopsset, defmap, multimap, double_dash = collect(tokens)
+        rebuilt = make_events(tokens)
+        assert frozenset(switchset) == result.switches
+        assert tuple(defmap.items()) == result.defs
+        assert double_dash == result.double_dash
+        assert rebuilt == events
+
+
+def test_events_canonical_keys():
+    events = ParseResult(["-o", "one", "--output=two"], aliases=OptionAliases(("output", "o"))).events
+    assert events.positions_of("output") == (0, 2)
+    assert events.positions_of("o") == ()